@@ -0,0 +1,18 @@
+"""
+Page-Object Micro-benchmarks
+
+Measures the cost of single page-object operations against static HTML
+fixtures rendered from the stand-in templates. Run with: python -m benchmarks
+"""
+from benchmarks.fixtures import FIXTURE_ORIGIN, render_fixtures, install_fixtures
+from benchmarks.harness import BenchmarkResult, run_case
+from benchmarks.cases import CASES
+
+__all__ = [
+    'FIXTURE_ORIGIN',
+    'render_fixtures',
+    'install_fixtures',
+    'BenchmarkResult',
+    'run_case',
+    'CASES'
+]
@@ -0,0 +1,144 @@
+"""
+Run the page-object micro-benchmarks: python -m benchmarks
+
+    python -m benchmarks --save-baseline          # record benchmarks/baseline.json
+    python -m benchmarks --threshold 0.25         # fail when a case got >25% slower
+    python -m benchmarks --ring-tracing           # also run every case with ring-buffer tracing
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+
+from playwright.sync_api import sync_playwright
+
+from benchmarks.cases import CASES
+from benchmarks.fixtures import render_fixtures, install_fixtures
+from benchmarks.harness import run_case
+from utils.instrumentation import find_regressions
+from utils.screenshots import configure_screenshots
+from utils.steps import set_step_backend, set_step_listener, BACKENDS, BACKEND_ALLURE
+from utils.tracing import RingTracer
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def run_in_context(browser, fixtures, name: str, setup, args, ring_tracing: bool = False) -> dict:
+    """Run one case in a fresh context, optionally under ring-buffer tracing"""
+    context = browser.new_context(viewport={"width": 1920, "height": 1080})
+    install_fixtures(context, fixtures)
+    page = context.new_page()
+    tracer = None
+    try:
+        if ring_tracing:
+            tracer = RingTracer(context, chunk_steps=args.trace_chunk_steps, keep_chunks=args.trace_keep_chunks)
+            tracer.start()
+            set_step_listener(tracer.step_finished)
+        operation, reset = setup(page)
+        return run_case(name, operation, reset, args.rounds, args.warmup).as_dict()
+    finally:
+        if tracer is not None:
+            set_step_listener(None)
+            tracer.stop()
+        context.close()
+
+
+def run(args) -> dict:
+    """Run the selected cases, each in a fresh context"""
+    fixtures = render_fixtures()
+    results = {}
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(headless=not args.headed)
+        try:
+            for name, setup in CASES.items():
+                if args.filter and args.filter not in name:
+                    continue
+                results[name] = run_in_context(browser, fixtures, name, setup, args)
+                print(format_result(name, results[name]))
+                if args.ring_tracing:
+                    traced = results[f"{name}[ring-tracing]"] = run_in_context(browser, fixtures, name, setup, args,
+                                                                              ring_tracing=True)
+                    print(format_result(f"{name}[ring-tracing]", traced))
+                    print(format_overhead(results[name], traced))
+        finally:
+            browser.close()
+    return results
+
+
+def format_result(name: str, stats: dict) -> str:
+    if stats['error']:
+        return f"{name:<45} ERROR {stats['error']}"
+    return (f"{name:<45} {stats['ops_per_sec']:>8.1f} ops/s  p50={stats['p50'] * 1000:.1f} ms  "
+            f"p90={stats['p90'] * 1000:.1f} ms  p99={stats['p99'] * 1000:.1f} ms")
+
+
+def format_overhead(untraced: dict, traced: dict) -> str:
+    if untraced['error'] or traced['error'] or not untraced['p50']:
+        return f"{'':<45} tracing overhead: n/a"
+    delta = traced['p50'] - untraced['p50']
+    return f"{'':<45} tracing overhead: p50 {delta * 1000:+.1f} ms ({delta / untraced['p50']:+.0%})"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Page-object micro-benchmarks")
+    parser.add_argument("--filter", default="", help="Only run cases whose name contains this text")
+    parser.add_argument("--rounds", type=int, default=30, help="Timed rounds per case (default 30)")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed warm-up rounds per case (default 3)")
+    parser.add_argument("--step-backend", choices=BACKENDS, default=BACKEND_ALLURE,
+                        help="Step backend active during the run (default allure, as in test runs)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser")
+    parser.add_argument("--ring-tracing", action="store_true",
+                        help="Run every case a second time under ring-buffer tracing and report the overhead")
+    parser.add_argument("--trace-chunk-steps", type=int, default=1, help="Steps per trace chunk (default 1)")
+    parser.add_argument("--trace-keep-chunks", type=int, default=5, help="Trace chunks kept (default 5)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed relative slowdown against the baseline (default 0.25)")
+    parser.add_argument("--metric", choices=["p50", "p90", "p99", "max"], default="p50",
+                        help="Statistic compared against the baseline (default p50)")
+    parser.add_argument("--output", default="reports/benchmarks/latest.json", help="Where to write the results")
+    args = parser.parse_args(argv)
+
+    set_step_backend(args.step_backend)
+    configure_screenshots(output_dir=tempfile.mkdtemp(prefix="benchmark-screenshots-"))
+
+    results = run(args)
+    # Same shape as an instrumentation export, so both diff the same way
+    report = {'environment': {'python': platform.python_version(), 'platform': platform.platform(),
+                              'step_backend': args.step_backend, 'rounds': args.rounds,
+                              'ring_tracing': args.ring_tracing},
+              'summary': {'by_action': results}}
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(report, output_file, indent=2)
+
+    errors = [name for name, stats in results.items() if stats['error']]
+    if args.save_baseline:
+        if errors:
+            print(f"Not saving a baseline: {len(errors)} case(s) failed")
+            return 1
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(report, baseline_file, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one")
+        return 1 if errors else 0
+
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    # Benchmarked operations are short; only sub-millisecond noise is ignored
+    regressions = find_regressions(baseline, report, args.threshold, args.metric, min_seconds=0.0005)
+    for name, before, after in regressions:
+        print(f"REGRESSED {name}: {args.metric} {before * 1000:.1f} ms -> {after * 1000:.1f} ms")
+    return 1 if regressions or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
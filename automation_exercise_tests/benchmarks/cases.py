@@ -0,0 +1,66 @@
+"""
+Benchmark Cases
+
+Each case opens its fixture page and returns (operation, reset); only the
+operation is timed.
+"""
+from pages import ProductsPage, CartPage, SignupLoginPage
+from benchmarks.fixtures import FIXTURE_ORIGIN
+from utils.screenshots import get_screenshot_pipeline
+
+
+CASES = {}
+
+ADDRESS = {
+    'first_name': "Bench", 'last_name': "Mark", 'company': "Fixtures Ltd",
+    'address1': "1 Benchmark Street", 'address2': "Suite 2", 'country': "Canada",
+    'state': "Ontario", 'city': "Toronto", 'zipcode': "M5V 2T6", 'mobile': "5550100",
+}
+
+
+def case(name: str):
+    """Register a benchmark case under name"""
+    def decorator(func):
+        CASES[name] = func
+        return func
+    return decorator
+
+
+@case("BasePage.navigate_to")
+def navigate_to(page):
+    products_page = ProductsPage(page, FIXTURE_ORIGIN)
+    return products_page.open, None
+
+
+@case("ProductsPage.add_product_to_cart")
+def add_product_to_cart(page):
+    products_page = ProductsPage(page, FIXTURE_ORIGIN)
+    products_page.open()
+
+    def reset():
+        if products_page.is_visible(ProductsPage.CONTINUE_SHOPPING_BUTTON):
+            products_page.click_continue_shopping()
+
+    return lambda: products_page.add_product_to_cart(1), reset
+
+
+@case("CartPage.get_all_products_info")
+def get_all_products_info(page):
+    cart_page = CartPage(page, FIXTURE_ORIGIN)
+    cart_page.open()
+    return cart_page.get_all_products_info, None
+
+
+@case("SignupLoginPage.fill_address_information")
+def fill_address_information(page):
+    signup_page = SignupLoginPage(page, FIXTURE_ORIGIN)
+    page.goto(f"{FIXTURE_ORIGIN}/signup")
+    return lambda: signup_page.fill_address_information(**ADDRESS), None
+
+
+@case("BasePage.take_screenshot")
+def take_screenshot(page):
+    products_page = ProductsPage(page, FIXTURE_ORIGIN)
+    products_page.open()
+    # Flushing waits for the background writes of the previous round
+    return lambda: products_page.take_screenshot("benchmark"), get_screenshot_pipeline().flush
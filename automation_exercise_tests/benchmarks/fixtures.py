@@ -0,0 +1,40 @@
+"""
+Static HTML Fixtures
+
+The pages are rendered once from server/templates.py, so they carry the same
+locators as the site, and are served from memory through request routing.
+No server thread and no network hop take part in the measurements.
+"""
+from playwright.sync_api import BrowserContext, Route
+
+from server import templates
+from server.store import PRODUCTS
+
+
+FIXTURE_ORIGIN = "http://fixtures.benchmark"
+
+
+def render_fixtures(cart_size: int = 5) -> dict:
+    """Render the fixture pages, keyed by path"""
+    cart_items = [{**product, 'quantity': 1, 'total': product['price']} for product in PRODUCTS[:cart_size]]
+    return {
+        "/": templates.home(),
+        "/login": templates.login(),
+        "/signup": templates.signup("Benchmark User", "benchmark@example.com"),
+        "/products": templates.products(PRODUCTS),
+        "/view_cart": templates.cart(cart_items),
+    }
+
+
+def install_fixtures(context: BrowserContext, fixtures: dict):
+    """Serve the fixtures (and the add-to-cart endpoint) for FIXTURE_ORIGIN"""
+    def handle(route: Route):
+        path = route.request.url[len(FIXTURE_ORIGIN):].split("?")[0] or "/"
+        if path.startswith("/add_to_cart/"):
+            route.fulfill(status=200, content_type="text/plain", body="Added")
+        elif path in fixtures:
+            route.fulfill(status=200, content_type="text/html; charset=utf-8", body=fixtures[path])
+        else:
+            route.fulfill(status=404, content_type="text/plain", body="Not found")
+
+    context.route(f"{FIXTURE_ORIGIN}/**", handle)
@@ -0,0 +1,60 @@
+"""
+Benchmark Harness
+
+Runs an operation for a number of timed rounds after a warm-up and reports
+ops/sec and the latency distribution. Work that must not be measured (closing
+a modal, clearing a form) goes into the reset callable, which runs untimed
+before every round.
+"""
+import time
+from dataclasses import dataclass, field
+
+from utils.instrumentation import percentile
+
+
+@dataclass
+class BenchmarkResult:
+    """Latency samples of one benchmark case"""
+    name: str
+    samples: list = field(default_factory=list)
+    error: str = None
+
+    @property
+    def total(self) -> float:
+        return sum(self.samples)
+
+    @property
+    def ops_per_sec(self) -> float:
+        return len(self.samples) / self.total if self.total else 0.0
+
+    def as_dict(self) -> dict:
+        """Summary in the same shape as an instrumentation export entry"""
+        durations = sorted(self.samples)
+        return {
+            'count': len(durations),
+            'total': round(self.total, 6),
+            'ops_per_sec': round(self.ops_per_sec, 2),
+            'mean': round(self.total / len(durations), 6) if durations else 0.0,
+            'p50': round(percentile(durations, 0.50), 6),
+            'p90': round(percentile(durations, 0.90), 6),
+            'p99': round(percentile(durations, 0.99), 6),
+            'max': round(durations[-1], 6) if durations else 0.0,
+            'error': self.error,
+        }
+
+
+def run_case(name: str, operation, reset=None, rounds: int = 30, warmup: int = 3) -> BenchmarkResult:
+    """Time operation() for the given rounds; an exception ends the case with an error"""
+    result = BenchmarkResult(name)
+    try:
+        for round_number in range(warmup + rounds):
+            if reset:
+                reset()
+            start = time.perf_counter()
+            operation()
+            elapsed = time.perf_counter() - start
+            if round_number >= warmup:
+                result.samples.append(elapsed)
+    except Exception as error:
+        result.error = f"{type(error).__name__}: {str(error).splitlines()[0] if str(error) else ''}"
+    return result
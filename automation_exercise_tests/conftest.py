@@ -1,6 +1,8 @@
 """
 Pytest Configuration and Fixtures
 """
+import json
+import os
 import pytest
 from playwright.sync_api import Page
 from pages import (
@@ -10,38 +12,416 @@ from pages import (
     CartPage,
     CheckoutPage
 )
-from utils import generate_user_data, generate_payment_data
+from pages.base_page import BasePage, DEFAULT_BASE_URL, WAIT_READY, WAIT_NETWORKIDLE
+from server import StandInServer
+from utils import (
+    generate_user_data,
+    generate_payment_data,
+    get_worker_id,
+    get_run_id,
+    worker_dir,
+    configure_unique_ids,
+    configure_data_pool,
+    ContextPool,
+    provision_account,
+    SessionCache,
+    restore_cookies,
+    restore_local_storage,
+    NetworkFilter,
+    DEFAULT_DENY_DOMAINS,
+    parse_list_option,
+    page_timings,
+    configure_screenshots,
+    get_screenshot_pipeline,
+    SCREENSHOT_POLICIES,
+    SCREENSHOT_FORMATS,
+    VideoPolicy,
+    VIDEO_MODES,
+    VIDEO_OFF,
+    parse_size,
+    set_step_backend,
+    flush_steps,
+    STEP_BACKENDS,
+    instrumentation,
+    configure_timeouts,
+    get_timeouts,
+    history_scope,
+    TIMEOUT_MODES,
+    TIMEOUTS_ADAPTIVE,
+    locator_cache_totals,
+    HarArchive,
+    seed_test_data,
+    HAR_MODES,
+    HAR_OFF,
+    HAR_RECORD,
+    HAR_REPLAY,
+    NOT_FOUND_ACTIONS,
+    DurationHistory,
+    run_recorder,
+    order_items,
+    initial_chunk,
+    predict_makespan,
+    SCHEDULE_MODES,
+    SCHEDULE_DURATION,
+    SCHEDULE_OFF,
+    CheckpointStore,
+    FlowCheckpoints,
+    CHECKPOINT_MODES,
+    CHECKPOINTS_OFF,
+    configure_account_registry,
+    get_account_registry,
+    PROFILES,
+    default_profile_name,
+    apply_profile,
+    write_allure_environment,
+    RingTracer,
+    trace_dir_for,
+    tracing_totals,
+    set_step_listener
+)
 import allure
 
 
+network_filter_key = pytest.StashKey()
+har_manifest_key = pytest.StashKey()
+profile_key = pytest.StashKey()
+ring_tracer_key = pytest.StashKey()
+account_cleanup_key = pytest.StashKey()
+context_pool_key = pytest.StashKey()
+
+
+def _env_flag(name: str):
+    """Boolean environment variable, or None when it is not set (left to --profile)"""
+    value = os.getenv(name)
+    return None if value is None else value.lower() in ("1", "true", "yes")
+
+
+def pytest_addoption(parser, pluginmanager):
+    """Register framework command line options"""
+    # Playwright's defaults (False, 0, "off") look like explicit choices; None leaves them to --profile.
+    # pytest stored the old defaults on config.option when the plugin added them, so reset those too.
+    config = pluginmanager.get_plugin("pytestconfig")
+    for option in parser.getgroup("playwright").options:
+        if option.dest in ("headed", "slowmo", "tracing"):
+            option.default = None
+            setattr(config.option, option.dest, None)
+    group = parser.getgroup("automation_exercise", "Automation Exercise")
+    group.addoption(
+        "--profile",
+        choices=sorted(PROFILES),
+        default=default_profile_name(),
+        help="Bundle of browser, capture and step settings: local, debug, ci-fast or perf "
+             "(default: AE_PROFILE, ci-fast when CI is set, else local). Explicit options win.",
+    )
+    group.addoption(
+        "--headless",
+        action="store_false",
+        dest="headed",
+        default=None,
+        help="Run the browser headless, also under a headed profile (opposite of --headed).",
+    )
+    group.addoption(
+        "--viewport",
+        default=os.getenv("AE_VIEWPORT"),
+        help="Browser viewport WIDTHxHEIGHT (default: from --profile).",
+    )
+    group.addoption(
+        "--local-server",
+        action="store_true",
+        default=os.getenv("AE_LOCAL_SERVER", "false").lower() in ("1", "true", "yes"),
+        help="Run against the bundled local stand-in server instead of the live site.",
+    )
+    group.addoption(
+        "--context-pool",
+        type=int,
+        default=int(os.getenv("AE_CONTEXT_POOL", "0")),
+        help="Number of pre-warmed browser contexts to reuse across tests (0 disables pooling).",
+    )
+    group.addoption(
+        "--session-cache-dir",
+        default=os.getenv("AE_SESSION_CACHE_DIR", "playwright/.auth"),
+        help="Directory for cached logged-in storage states.",
+    )
+    group.addoption(
+        "--session-cache-ttl",
+        type=float,
+        default=float(os.getenv("AE_SESSION_CACHE_TTL", "1800")),
+        help="Seconds a cached logged-in storage state stays valid.",
+    )
+    group.addoption(
+        "--data-seed",
+        type=int,
+        default=int(os.getenv("AE_DATA_SEED", "1234")),
+        help="Seed of the pre-generated user/payment data pool.",
+    )
+    group.addoption(
+        "--data-pool-size",
+        type=int,
+        default=int(os.getenv("AE_DATA_POOL_SIZE", "1000")),
+        help="Number of records in the data pool (regenerated when changed).",
+    )
+    group.addoption(
+        "--data-pool-dir",
+        default=os.getenv("AE_DATA_POOL_DIR", "playwright/.data"),
+        help="Directory of the memory-mapped data pool file.",
+    )
+    group.addoption(
+        "--wait-strategy",
+        choices=[WAIT_READY, WAIT_NETWORKIDLE],
+        default=os.getenv("AE_WAIT_STRATEGY", WAIT_READY),
+        help="How navigation waits: per-page readiness locators or the legacy networkidle.",
+    )
+    group.addoption(
+        "--timeouts",
+        choices=TIMEOUT_MODES,
+        default=os.getenv("AE_TIMEOUTS", TIMEOUTS_ADAPTIVE),
+        help="Derive wait timeouts from per-locator latency history, or keep the fixed defaults.",
+    )
+    group.addoption(
+        "--timeout-history-dir",
+        default=os.getenv("AE_TIMEOUT_HISTORY_DIR", "playwright/.timeouts"),
+        help="Directory of the per-locator latency history kept across runs.",
+    )
+    group.addoption(
+        "--timeout-margin",
+        type=float,
+        default=float(os.getenv("AE_TIMEOUT_MARGIN", "3.0")),
+        help="Adaptive timeout = p99 of the observed latency times this margin.",
+    )
+    group.addoption(
+        "--timeout-allow-shorter",
+        action="store_true",
+        default=os.getenv("AE_TIMEOUT_ALLOW_SHORTER", "false").lower() in ("1", "true", "yes"),
+        help="Let adaptive timeouts go below the page objects' defaults (they only raise them otherwise).",
+    )
+    group.addoption(
+        "--screenshot-policy",
+        choices=SCREENSHOT_POLICIES,
+        default=os.getenv("AE_SCREENSHOT_POLICY"),
+        help="Which step screenshots to take (failure screenshots are always taken; default: from --profile).",
+    )
+    group.addoption(
+        "--screenshot-format",
+        choices=SCREENSHOT_FORMATS,
+        default=os.getenv("AE_SCREENSHOT_FORMAT", "png"),
+        help="Screenshot image format (webp requires Pillow, otherwise jpeg is used).",
+    )
+    group.addoption(
+        "--screenshot-quality",
+        type=int,
+        default=int(os.getenv("AE_SCREENSHOT_QUALITY", "80")),
+        help="JPEG/WebP quality (0-100).",
+    )
+    group.addoption(
+        "--screenshot-sample-rate",
+        type=float,
+        default=float(os.getenv("AE_SCREENSHOT_SAMPLE_RATE", "0.2")),
+        help="Share of step screenshots kept with --screenshot-policy sampled.",
+    )
+    group.addoption(
+        "--screenshot-full-page",
+        action="store_true",
+        default=False,
+        help="Capture the full scrollable page instead of clipping to the viewport.",
+    )
+    group.addoption(
+        "--video-policy",
+        choices=VIDEO_MODES,
+        default=os.getenv("AE_VIDEO_POLICY"),
+        help="Record videos always, never, keep only failures, or keep a sample of passing tests "
+             "(default: from --profile).",
+    )
+    group.addoption(
+        "--video-sample-rate",
+        type=float,
+        default=float(os.getenv("AE_VIDEO_SAMPLE_RATE", "0.1")),
+        help="Share of passing-test videos kept with --video-policy sampled.",
+    )
+    group.addoption(
+        "--video-size",
+        default=os.getenv("AE_VIDEO_SIZE", "1280x720"),
+        help="Recording resolution WIDTHxHEIGHT, independent of the viewport.",
+    )
+    group.addoption(
+        "--video-budget-mb",
+        type=float,
+        default=float(os.getenv("AE_VIDEO_BUDGET_MB", "500")),
+        help="Disk budget for reports/videos/, shared by all xdist workers; oldest videos are evicted first.",
+    )
+    group.addoption(
+        "--step-backend",
+        choices=STEP_BACKENDS,
+        default=os.getenv("AE_STEP_BACKEND"),
+        help="How page-object steps are reported: full allure tree, top-level only, buffered or off "
+             "(default: from --profile).",
+    )
+    group.addoption(
+        "--ring-tracing",
+        action="store_true",
+        default=_env_flag("AE_RING_TRACING"),
+        help="Trace in chunks per page-object step, keeping only the last chunks; saved on failure "
+             "(default: from --profile).",
+    )
+    group.addoption(
+        "--trace-chunk-steps",
+        type=int,
+        default=int(os.getenv("AE_TRACE_CHUNK_STEPS", "1")),
+        help="Outermost page-object steps per ring trace chunk.",
+    )
+    group.addoption(
+        "--trace-keep-chunks",
+        type=int,
+        default=int(os.getenv("AE_TRACE_KEEP_CHUNKS", "5")),
+        help="Finished ring trace chunks kept before a failure (plus the one in progress).",
+    )
+    group.addoption(
+        "--trace-dir",
+        default=os.getenv("AE_TRACE_DIR", "reports/traces"),
+        help="Where the ring trace chunks of failed tests are saved.",
+    )
+    group.addoption(
+        "--network-filter",
+        action="store_true",
+        default=os.getenv("AE_NETWORK_FILTER", "false").lower() in ("1", "true", "yes"),
+        help="Block ads, trackers and heavy media; stub analytics calls.",
+    )
+    group.addoption(
+        "--block-domains",
+        default=os.getenv("AE_BLOCK_DOMAINS", ""),
+        help="Comma separated domains to block in addition to the built-in ad/tracker list.",
+    )
+    group.addoption(
+        "--allow-domains",
+        default=os.getenv("AE_ALLOW_DOMAINS", ""),
+        help="Comma separated domains to allow; everything else is blocked.",
+    )
+    group.addoption(
+        "--block-resource-types",
+        default=os.getenv("AE_BLOCK_RESOURCE_TYPES", ""),
+        help="Comma separated resource types to block, e.g. image,media,font.",
+    )
+    group.addoption(
+        "--har",
+        choices=HAR_MODES,
+        default=os.getenv("AE_HAR", HAR_OFF),
+        help="Record each test's network traffic to a HAR, or replay tests from their HARs.",
+    )
+    group.addoption(
+        "--har-dir",
+        default=os.getenv("AE_HAR_DIR", "hars"),
+        help="Directory of the per-test HAR files and their deduplicated bodies.",
+    )
+    group.addoption(
+        "--har-not-found",
+        choices=NOT_FOUND_ACTIONS,
+        default=os.getenv("AE_HAR_NOT_FOUND", "abort"),
+        help="Replay: abort requests missing from the HAR, or let them through to the network.",
+    )
+    group.addoption(
+        "--instrument",
+        action="store_true",
+        default=os.getenv("AE_INSTRUMENT", "false").lower() in ("1", "true", "yes"),
+        help="Time every page-object action and export percentiles to reports/timings/.",
+    )
+    group.addoption(
+        "--checkpoints",
+        choices=CHECKPOINT_MODES,
+        default=os.getenv("AE_CHECKPOINTS", CHECKPOINTS_OFF),
+        help="Checkpoint each phase of long flows (save), and resume from the latest valid one (resume).",
+    )
+    group.addoption(
+        "--checkpoint-dir",
+        default=os.getenv("AE_CHECKPOINT_DIR", "playwright/.checkpoints"),
+        help="Directory of the per-test flow checkpoints.",
+    )
+    group.addoption(
+        "--checkpoint-max-age",
+        type=float,
+        default=float(os.getenv("AE_CHECKPOINT_MAX_AGE", "3600")),
+        help="Seconds after which a checkpoint is too old to resume from.",
+    )
+    group.addoption(
+        "--keep-accounts",
+        action="store_true",
+        default=os.getenv("AE_KEEP_ACCOUNTS", "false").lower() in ("1", "true", "yes"),
+        help="Do not delete the accounts created by the run at session end.",
+    )
+    group.addoption(
+        "--account-registry-dir",
+        default=os.getenv("AE_ACCOUNT_REGISTRY_DIR", "playwright/.accounts"),
+        help="Directory recording every account the tests create (swept by python -m utils.accounts).",
+    )
+    group.addoption(
+        "--cleanup-concurrency",
+        type=int,
+        default=int(os.getenv("AE_CLEANUP_CONCURRENCY", "8")),
+        help="Parallel delete requests when cleaning up accounts at session end.",
+    )
+    group.addoption(
+        "--schedule",
+        choices=SCHEDULE_MODES,
+        default=os.getenv("AE_SCHEDULE", SCHEDULE_OFF),
+        help="'duration': run recently failed tests first, then the rest longest-first by recorded duration "
+             "(needs a history from an earlier run; default: off).",
+    )
+    group.addoption(
+        "--durations-file",
+        default=os.getenv("AE_DURATIONS_FILE", "playwright/.durations.json"),
+        help="History of per-test durations and outcomes used by --schedule duration.",
+    )
+
+
+@pytest.fixture(scope="session")
+def local_server(pytestconfig):
+    """Start the local stand-in server when --local-server is given"""
+    # Replayed tests are served from their HARs
+    if not pytestconfig.getoption("local_server") or pytestconfig.getoption("har") == HAR_REPLAY:
+        yield None
+        return
+    server = StandInServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def base_url(pytestconfig, local_server):
+    """Base URL of the site under test (--local-server, --base-url or the live site)"""
+    recorded_base_url = pytestconfig.stash[har_manifest_key].get('base_url')
+    if recorded_base_url:
+        return recorded_base_url
+    if local_server is not None:
+        return local_server.url
+    return pytestconfig.getoption("base_url") or DEFAULT_BASE_URL
+
+
 @pytest.fixture(scope="function")
-def home_page(page: Page) -> HomePage:
+def home_page(page: Page, base_url: str) -> HomePage:
     """Fixture to provide HomePage instance"""
-    return HomePage(page)
+    return HomePage(page, base_url)
 
 
 @pytest.fixture(scope="function")
-def signup_login_page(page: Page) -> SignupLoginPage:
+def signup_login_page(page: Page, base_url: str) -> SignupLoginPage:
     """Fixture to provide SignupLoginPage instance"""
-    return SignupLoginPage(page)
+    return SignupLoginPage(page, base_url)
 
 
 @pytest.fixture(scope="function")
-def products_page(page: Page) -> ProductsPage:
+def products_page(page: Page, base_url: str) -> ProductsPage:
     """Fixture to provide ProductsPage instance"""
-    return ProductsPage(page)
+    return ProductsPage(page, base_url)
 
 
 @pytest.fixture(scope="function")
-def cart_page(page: Page) -> CartPage:
+def cart_page(page: Page, base_url: str) -> CartPage:
     """Fixture to provide CartPage instance"""
-    return CartPage(page)
+    return CartPage(page, base_url)
 
 
 @pytest.fixture(scope="function")
-def checkout_page(page: Page) -> CheckoutPage:
+def checkout_page(page: Page, base_url: str) -> CheckoutPage:
     """Fixture to provide CheckoutPage instance"""
-    return CheckoutPage(page)
+    return CheckoutPage(page, base_url)
 
 
 @pytest.fixture(scope="function")
@@ -57,39 +437,453 @@ def payment_data():
 
 
 @pytest.fixture(scope="function")
-def browser_context_args(browser_context_args):
+def logged_in_user(page: Page, base_url: str, user_data: dict) -> dict:
+    """Fixture to provide a user created over the API and logged in on the page's context"""
+    get_account_registry().register(base_url, user_data)
+    with allure.step(f"Provision account over API: {user_data['email']}"):
+        return provision_account(base_url, page.context, user_data)
+
+
+@pytest.fixture(scope="function")
+def flow_checkpoints(request, pytestconfig, page: Page, base_url: str) -> FlowCheckpoints:
+    """Fixture to provide phase checkpoints of the test, dropped once it passes"""
+    store = CheckpointStore(
+        pytestconfig.getoption("checkpoint_dir"),
+        max_age_seconds=pytestconfig.getoption("checkpoint_max_age"),
+    )
+    checkpoints = FlowCheckpoints(store, request.node.nodeid, page, base_url,
+                                  mode=pytestconfig.getoption("checkpoints"))
+    yield checkpoints
+    checkpoints.finish(passed=hasattr(request.node, "rep_call") and request.node.rep_call.passed)
+
+
+@pytest.fixture(scope="session")
+def session_cache(pytestconfig) -> SessionCache:
+    """Disk cache of logged-in storage states shared by all tests of a worker"""
+    return SessionCache(
+        pytestconfig.getoption("session_cache_dir"),
+        ttl_seconds=pytestconfig.getoption("session_cache_ttl"),
+    )
+
+
+@pytest.fixture(scope="function")
+def cached_logged_in_user(request, page: Page, base_url: str, worker_id: str,
+                          session_cache: SessionCache, home_page: HomePage) -> dict:
+    """Fixture to provide "some logged-in user", restored from the session cache when valid
+
+    The user profile can be chosen with indirect parametrization; it defaults
+    to "default". The page is left on the home page.
+    """
+    profile = getattr(request, "param", "default")
+    key = SessionCache.make_key(base_url, profile, worker_id)
+
+    entry = session_cache.load(key)
+    if entry is not None:
+        with allure.step(f"Restore cached session: {entry['user']['email']}"):
+            restore_cookies(page.context, entry['storage_state'])
+            home_page.open()
+            restore_local_storage(page, entry['storage_state'])
+            # The page is loaded: a stale session shows no header, so do not wait for one
+            if home_page.is_user_logged_in(entry['user']['name'], timeout=0):
+                return entry['user']
+        # Stale or invalidated session: start over with a new account
+        session_cache.invalidate(key)
+        page.context.clear_cookies()
+
+    user = generate_user_data()
+    # Kept (and not deleted at session end) for as long as the cached session can be reused
+    get_account_registry().register(base_url, user, keep_seconds=session_cache.ttl_seconds)
+    with allure.step(f"Provision account over API: {user['email']}"):
+        provision_account(base_url, page.context, user)
+    home_page.open()
+    assert home_page.is_user_logged_in(user['name']), "Provisioned session is not logged in"
+    session_cache.save(key, user, page.context.storage_state())
+    return user
+
+
+@pytest.fixture(scope="session")
+def worker_id(pytestconfig) -> str:
+    """xdist worker id of this process ('master' when not running in parallel)"""
+    return get_worker_id(pytestconfig)
+
+
+@pytest.fixture(scope="session")
+def video_policy(pytestconfig, worker_id) -> VideoPolicy:
+    """Video recording mode, retention and disk budget for this worker"""
+    mode = pytestconfig.getoption("video_policy")
+    # Pooled contexts outlive a single test, so per-test videos are not possible
+    if pytestconfig.getoption("context_pool"):
+        mode = VIDEO_OFF
+    return VideoPolicy(
+        mode=mode,
+        video_dir=worker_dir("reports/videos/", worker_id),
+        size=parse_size(pytestconfig.getoption("video_size")),
+        sample_rate=pytestconfig.getoption("video_sample_rate"),
+        budget_mb=pytestconfig.getoption("video_budget_mb"),
+        budget_dir="reports/videos/",
+    )
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args, pytestconfig, video_policy):
     """Configure browser context"""
     return {
         **browser_context_args,
-        "viewport": {
-            "width": 1920,
-            "height": 1080,
-        },
-        "record_video_dir": "reports/videos/",
+        "viewport": parse_size(pytestconfig.getoption("viewport")),
+        **video_policy.context_args(),
     }
 
 
+@pytest.fixture(scope="function")
+def video_recording(request, video_policy) -> list:
+    """Collect the test's video files and apply the retention policy
+
+    Set up before the browser context, so its teardown runs after the
+    context has closed and the videos are complete.
+    """
+    video_paths = []
+    yield video_paths
+    failed = request.node.rep_call.failed if hasattr(request.node, "rep_call") else True
+    video_policy.finalize(video_paths, failed)
+
+
+@pytest.fixture(scope="session")
+def context_pool(pytestconfig, browser, browser_context_args):
+    """Session-wide pool of warm browser contexts (None when pooling is disabled)"""
+    size = pytestconfig.getoption("context_pool")
+    # HARs are per test and recordings are written when the context closes
+    if size <= 0 or pytestconfig.getoption("har") != HAR_OFF:
+        yield None
+        return
+    pool = ContextPool(browser, browser_context_args, size).warm()
+    pytestconfig.stash[context_pool_key] = pool
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def network_filter(pytestconfig):
+    """Request filter shared by all contexts of the session (None when disabled)"""
+    if not pytestconfig.getoption("network_filter"):
+        return None
+    request_filter = NetworkFilter(
+        deny_domains=DEFAULT_DENY_DOMAINS + parse_list_option(pytestconfig.getoption("block_domains")),
+        allow_domains=parse_list_option(pytestconfig.getoption("allow_domains")),
+        block_resource_types=parse_list_option(pytestconfig.getoption("block_resource_types")),
+    )
+    pytestconfig.stash[network_filter_key] = request_filter
+    return request_filter
+
+
+@pytest.fixture(scope="session")
+def har_archive(pytestconfig, base_url) -> HarArchive:
+    """Per-test HAR recording/replay settings"""
+    archive = HarArchive(
+        pytestconfig.getoption("har_dir"),
+        mode=pytestconfig.getoption("har"),
+        not_found=pytestconfig.getoption("har_not_found"),
+    )
+    if archive.mode == HAR_RECORD:
+        archive.write_manifest(
+            run_id=get_run_id(pytestconfig),
+            data_seed=pytestconfig.getoption("data_seed"),
+            data_pool_size=pytestconfig.getoption("data_pool_size"),
+            base_url=base_url,
+        )
+    return archive
+
+
+@pytest.fixture(scope="function", autouse=True)
+def har_test_data(request, pytestconfig):
+    """With HARs, derive the test's user data from the recording run, so posted forms match"""
+    if pytestconfig.getoption("har") != HAR_OFF:
+        run_id = pytestconfig.stash[har_manifest_key].get('run_id') or get_run_id(pytestconfig)
+        with seed_test_data(run_id, request.node.nodeid):
+            yield
+    else:
+        yield
+
+
+@pytest.fixture(scope="function")
+def page(request, video_recording, context_pool, network_filter, har_archive) -> Page:
+    """Page for the test: checked out of the context pool, or a fresh context"""
+    if context_pool is None:
+        context = request.getfixturevalue("context")
+        har_archive.attach(context, request.node.nodeid)
+        test_page = context.new_page()
+        if test_page.video:
+            video_recording.append(test_page.video.path())
+    else:
+        test_page = context_pool.acquire()
+
+    if network_filter is not None:
+        network_filter.attach(test_page.context)
+        counters = network_filter.stats.snapshot()
+
+    tracer = None
+    if request.config.getoption("ring_tracing"):
+        tracer = request.node.stash[ring_tracer_key] = RingTracer(
+            test_page.context,
+            chunk_steps=request.config.getoption("trace_chunk_steps"),
+            keep_chunks=request.config.getoption("trace_keep_chunks"),
+        )
+        tracer.start()
+        set_step_listener(tracer.step_finished)
+
+    yield test_page
+
+    if tracer is not None:
+        # Failures were persisted in makereport; whatever is left is dropped
+        set_step_listener(None)
+        tracer.stop()
+    if network_filter is not None:
+        allure.attach(
+            json.dumps(network_filter.stats.since(counters), indent=2),
+            name="network_filter",
+            attachment_type=allure.attachment_type.JSON
+        )
+    if context_pool is not None:
+        context_pool.release(test_page)
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Hook to capture screenshots on test failure"""
+    """Hook to capture screenshots on test failure and attach pending screenshots"""
     outcome = yield
     report = outcome.get_result()
+    # Expose the phase reports (item.rep_setup, item.rep_call, ...) to fixture teardowns
+    setattr(item, f"rep_{report.when}", report)
+    screenshots = get_screenshot_pipeline()
+
+    tracer = item.stash.get(ring_tracer_key, None)
+    if tracer is not None and report.failed and report.when != "teardown":
+        trace_dir = worker_dir(item.config.getoption("trace_dir"), get_worker_id(item.config))
+        chunks = tracer.persist(trace_dir_for(trace_dir, item.nodeid))
+        allure.attach("\n".join(chunks), name="ring_trace_chunks", attachment_type=allure.attachment_type.TEXT)
+        allure.attach.file(chunks[-1], name="trace_last_chunk", extension="zip")
 
     if report.when == "call" and report.failed:
         # Get the page fixture if available
         if "page" in item.funcargs:
             page = item.funcargs["page"]
-            screenshot = page.screenshot()
-            allure.attach(
-                screenshot,
-                name="failure_screenshot",
-                attachment_type=allure.attachment_type.PNG
-            )
+            screenshots.capture(page, "failure_screenshot", force=True)
+
+    # A failing phase releases the held screenshots; writes are joined and attached once, after teardown
+    screenshots.flush(failed=report.failed, test_finished=report.when == "teardown")
+    flush_steps()
+
+
+def pytest_collection_modifyitems(config, items):
+    """Order tests by the duration history (identically on every worker)"""
+    if config.getoption("schedule") != SCHEDULE_DURATION:
+        return
+    history = DurationHistory(config.getoption("durations_file")).load()
+    if not history.tests:
+        return
+    items[:] = order_items(items, history)
+    if not hasattr(config, "workerinput"):
+        run_recorder.predicted = predict_makespan(
+            [history.estimate(item.nodeid) for item in items], 1)
+
+
+def pytest_xdist_node_collection_finished(node, ids):
+    """Controller: predict the makespan once the first worker reports its (ordered) collection"""
+    if run_recorder.predicted is not None or node.config.getoption("schedule") != SCHEDULE_DURATION:
+        return
+    history = DurationHistory(node.config.getoption("durations_file")).load()
+    if not history.tests:
+        return
+    workers = int(node.config.getoption("numprocesses") or 1)
+    chunk = 1
+    if node.config.getoption("dist", None) == "load":
+        chunk = initial_chunk(len(ids), workers, node.config.getoption("maxschedchunk", None))
+    run_recorder.predicted = predict_makespan([history.estimate(nodeid) for nodeid in ids], workers, chunk)
+
+
+def pytest_runtest_logreport(report):
+    """Collect test durations (on the controller, for every worker)"""
+    run_recorder.add(report)
+
+
+def pytest_runtest_setup(item):
+    """Direct step screenshots of the test to its own folder"""
+    get_screenshot_pipeline().start_test(item.nodeid)
 
 
 def pytest_configure(config):
-    """Configure pytest with custom markers"""
+    """Configure pytest with custom markers and per-worker isolation"""
+    worker = get_worker_id(config)
+    configure_unique_ids(get_run_id(config), worker)
+    # Resolve the profile first: it fills the options everything below reads
+    profile = config.stash[profile_key] = apply_profile(config.option, PROFILES[config.getoption("profile")])
+    target = "local stand-in" if config.getoption("local_server") else config.getoption("base_url") or DEFAULT_BASE_URL
+    alluredir = config.getoption("allure_report_dir", None)
+    if alluredir and not hasattr(config, "workerinput"):
+        write_allure_environment(alluredir, profile, target=target)
+    har_manifest = {}
+    if config.getoption("har") == HAR_REPLAY:
+        har_manifest = HarArchive(config.getoption("har_dir")).read_manifest()
+    elif (config.getoption("har") == HAR_RECORD and config.getoption("local_server")
+          and config.getoption("numprocesses", None)):
+        raise pytest.UsageError("--har record with --local-server needs a single worker "
+                                "(each worker's stand-in has its own port); use a fixed --base-url instead")
+    config.stash[har_manifest_key] = har_manifest
+    # The pool file is only opened (or generated) when the first record is drawn
+    configure_data_pool(
+        pool_dir=config.getoption("data_pool_dir"),
+        seed=har_manifest.get('data_seed', config.getoption("data_seed")),
+        size=har_manifest.get('data_pool_size', config.getoption("data_pool_size")),
+    )
+    # Accounts of the per-session stand-in or of a replayed run do not outlive the session
+    configure_account_registry(
+        registry_dir=config.getoption("account_registry_dir"),
+        run_id=get_run_id(config),
+        worker_id=worker,
+        enabled=not config.getoption("local_server") and config.getoption("har") != HAR_REPLAY,
+    )
+    # Each worker gets its own Playwright artifacts folder
+    config.option.output = worker_dir(config.option.output, worker)
+    BasePage.wait_strategy = config.getoption("wait_strategy")
+    # Latencies are only comparable for the same site and profile
+    configure_timeouts(
+        mode=config.getoption("timeouts"),
+        history_dir=config.getoption("timeout_history_dir"),
+        scope=history_scope("har replay" if config.getoption("har") == HAR_REPLAY else target, profile.name),
+        worker_id=worker,
+        margin=config.getoption("timeout_margin"),
+        allow_shorter=config.getoption("timeout_allow_shorter"),
+    )
+    if config.getoption("ring_tracing") and config.getoption("tracing") != "off":
+        raise pytest.UsageError(f"--ring-tracing replaces --tracing {config.getoption('tracing')}; use one of them")
+    set_step_backend(config.getoption("step_backend"))
+    instrumentation.enabled = config.getoption("instrument")
+    configure_screenshots(
+        policy=config.getoption("screenshot_policy"),
+        image_format=config.getoption("screenshot_format"),
+        quality=config.getoption("screenshot_quality"),
+        full_page=config.getoption("screenshot_full_page"),
+        sample_rate=config.getoption("screenshot_sample_rate"),
+        output_dir=worker_dir("reports/screenshots", worker),
+    )
+
     config.addinivalue_line("markers", "smoke: Smoke test cases")
     config.addinivalue_line("markers", "regression: Regression test cases")
     config.addinivalue_line("markers", "cart: Cart functionality tests")
-    config.addinivalue_line("markers", "checkout: Checkout process tests")
\ No newline at end of file
+    config.addinivalue_line("markers", "checkout: Checkout process tests")
+
+
+def pytest_sessionfinish(session):
+    """Stop the screenshot writer and save timings and wait latencies of this worker
+
+    The controller then prunes HARs, deletes the run's test accounts and
+    updates the duration history.
+    """
+    get_screenshot_pipeline().close()
+    worker = get_worker_id(session.config)
+    get_timeouts().save(os.path.join("reports", "timeouts", f"{worker}.json"))
+    if page_timings.records:
+        page_timings.save(os.path.join("reports", "page-timings", f"{worker}.json"))
+    if instrumentation.records:
+        instrumentation.export(os.path.join("reports", "timings", f"{worker}.json"),
+                               environment={'profile': session.config.stash[profile_key].describe()})
+    if hasattr(session.config, "workerinput"):
+        return
+    # Only the controller prunes, after every worker has written its HARs
+    if session.config.getoption("har") == HAR_RECORD:
+        HarArchive(session.config.getoption("har_dir")).prune()
+    # ...deletes the accounts every worker created (checkpointed flows resume with theirs)...
+    keep_accounts = session.config.getoption("keep_accounts") or session.config.getoption("checkpoints") != CHECKPOINTS_OFF
+    if get_account_registry().enabled and not keep_accounts:
+        session.config.stash[account_cleanup_key] = get_account_registry().cleanup(
+            run_id=get_run_id(session.config),
+            concurrency=session.config.getoption("cleanup_concurrency"),
+        )
+    # ...and updates the duration history, which holds the reports of all workers
+    if run_recorder.durations:
+        history = DurationHistory(session.config.getoption("durations_file")).load()
+        run_recorder.store(history)
+        history.save()
+
+
+def pytest_report_header(config):
+    """Show the execution profile in effect"""
+    return f"profile: {config.stash[profile_key].describe()}"
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report makespan, account cleanup, ring tracing, context pool, page timings, locator cache and wait statistics,
+    network filter"""
+    if run_recorder.durations and run_recorder.predicted is not None:
+        makespan = run_recorder.summary()
+        terminalreporter.write_sep("-", "schedule (seconds)")
+        terminalreporter.write_line(
+            f"predicted makespan: {makespan['predicted']:.1f}  actual (busiest worker): "
+            f"{makespan['busiest_worker']:.1f}  wall: {makespan['wall']:.1f}  workers: {makespan['workers']}"
+        )
+
+    cleanup = config.stash.get(account_cleanup_key, None)
+    if cleanup is not None and (cleanup['due'] or cleanup['kept']):
+        terminalreporter.write_sep("-", "test account cleanup")
+        terminalreporter.write_line(
+            f"deleted: {cleanup['deleted']}  failed: {cleanup['failed']}  kept (cached sessions): "
+            f"{cleanup['kept']}  in {cleanup['seconds']}s"
+        )
+        if cleanup['failed']:
+            terminalreporter.write_line("  failed deletions stay registered for: python -m utils.accounts")
+
+    trace_stats = tracing_totals.snapshot()
+    if trace_stats['tests']:
+        terminalreporter.write_sep("-", "ring tracing")
+        terminalreporter.write_line(
+            f"tests: {trace_stats['tests']}  chunks: {trace_stats['chunks']}  saved on failure: "
+            f"{trace_stats['persisted']}  rotation time: {trace_stats['rotation_seconds']}s"
+        )
+
+    pool = config.stash.get(context_pool_key, None)
+    if pool is not None:
+        terminalreporter.write_sep("-", "context pool")
+        terminalreporter.write_line(
+            f"created: {pool.stats['created']}  first use: {pool.stats['first_use']}  "
+            f"reused: {pool.stats['reused']}  discarded: {pool.stats['discarded']}"
+        )
+
+    if page_timings.records:
+        terminalreporter.write_sep("-", "page load timings (seconds)")
+        for name, stats in page_timings.summary().items():
+            terminalreporter.write_line(
+                f"{name}: n={stats['count']} mean={stats['mean']} "
+                f"median={stats['median']} max={stats['max']}"
+            )
+
+    cache_stats = locator_cache_totals.snapshot()
+    if cache_stats['hits'] or cache_stats['misses']:
+        terminalreporter.write_sep("-", "locator cache")
+        terminalreporter.write_line(
+            f"hits: {cache_stats['hits']}  misses: {cache_stats['misses']}  "
+            f"invalidations: {cache_stats['invalidations']}  hit rate: {cache_stats['hit_rate']:.0%}"
+        )
+
+    wait_summary = get_timeouts().summary()
+    if wait_summary:
+        terminalreporter.write_sep("-", "wait timeouts vs observed latency (ms)")
+        slowest = sorted(wait_summary.items(), key=lambda item: item[1]['max_ms'] or float("inf"), reverse=True)
+        for locator, stats in slowest[:15]:
+            observed = "never appeared"
+            if stats['max_ms'] is not None:
+                observed = f"p50={stats['p50_ms']} max={stats['max_ms']}"
+            timed_out = f"  TIMED OUT x{stats['timed_out']}" if stats['timed_out'] else ""
+            terminalreporter.write_line(
+                f"{locator}: waits={stats['waits']} timeout={stats['timeout_ms']} {observed}{timed_out}"
+            )
+
+    request_filter = config.stash.get(network_filter_key, None)
+    if request_filter is None:
+        return
+    stats = request_filter.stats.snapshot()
+    terminalreporter.write_sep("-", "network filter")
+    terminalreporter.write_line(
+        f"allowed: {stats['allowed']}  blocked: {stats['blocked']}  stubbed: {stats['stubbed']}  "
+        f"estimated bytes saved: {stats['estimated_bytes_saved']}"
+    )
+    for resource_type, count in sorted(stats['blocked_by_type'].items()):
+        terminalreporter.write_line(f"  {resource_type}: {count}")
@@ -1,18 +1,20 @@
 """
 Page Objects Package
 """
-from pages.base_page import BasePage
+from pages.base_page import BasePage, FormFillError
 from pages.home_page import HomePage
 from pages.signup_login_page import SignupLoginPage
 from pages.products_page import ProductsPage
-from pages.cart_page import CartPage
+from pages.cart_page import CartPage, CartItem
 from pages.checkout_page import CheckoutPage
 
 __all__ = [
     'BasePage',
+    'FormFillError',
     'HomePage',
     'SignupLoginPage',
     'ProductsPage',
     'CartPage',
+    'CartItem',
     'CheckoutPage'
 ]
\ No newline at end of file
@@ -0,0 +1,22 @@
+"""
+Async Page Objects
+
+Twins of the page objects on playwright.async_api, with the same locators
+and method names, so many purchase flows can run concurrently on one event
+loop.
+"""
+from pages.aio.base_page import AsyncBasePage
+from pages.aio.home_page import AsyncHomePage
+from pages.aio.signup_login_page import AsyncSignupLoginPage
+from pages.aio.products_page import AsyncProductsPage
+from pages.aio.cart_page import AsyncCartPage
+from pages.aio.checkout_page import AsyncCheckoutPage
+
+__all__ = [
+    'AsyncBasePage',
+    'AsyncHomePage',
+    'AsyncSignupLoginPage',
+    'AsyncProductsPage',
+    'AsyncCartPage',
+    'AsyncCheckoutPage'
+]
@@ -0,0 +1,144 @@
+"""
+Async Base Page Object Model class with common methods for all pages
+"""
+import time
+
+from playwright.async_api import Page, expect, TimeoutError as PlaywrightTimeoutError
+from pages.base_page import (
+    DEFAULT_BASE_URL,
+    DEFAULT_TIMEOUT,
+    WAIT_READY,
+    WAIT_NETWORKIDLE,
+    FILL_FORM_SCRIPT,
+    FormFillError
+)
+from utils.page_timings import page_timings
+from utils.screenshots import get_screenshot_pipeline
+from utils.steps import step
+from utils.timeouts import get_timeouts
+
+
+def shares_locators(page_class):
+    """Copy the locator constants (UPPER_CASE attributes) of a sync page object"""
+    def decorator(async_class):
+        for name, value in vars(page_class).items():
+            if name.isupper():
+                setattr(async_class, name, value)
+        return async_class
+    return decorator
+
+
+class AsyncBasePage:
+    """Base class for all async page objects"""
+
+    # Locators that must be visible before the page counts as loaded
+    READY_LOCATORS = ()
+
+    # "ready" waits for READY_LOCATORS; "networkidle" is the legacy blanket wait
+    wait_strategy = WAIT_READY
+
+    def __init__(self, page: Page, base_url: str = None):
+        self.page = page
+        self.base_url = (base_url or DEFAULT_BASE_URL).rstrip("/")
+
+    @step("Navigate to {url}", primitive=True)
+    async def navigate_to(self, url: str):
+        """Navigate to a specific URL and wait until the page is ready"""
+        start = time.perf_counter()
+        if self.wait_strategy == WAIT_NETWORKIDLE or not self.READY_LOCATORS:
+            await self.page.goto(url)
+            await self.page.wait_for_load_state("networkidle")
+            strategy = WAIT_NETWORKIDLE
+        else:
+            await self.page.goto(url, wait_until="domcontentloaded")
+            await self.wait_until_ready()
+            strategy = WAIT_READY
+        page_timings.record(type(self).__name__, url, strategy, time.perf_counter() - start)
+
+    @step("Wait until page is ready", primitive=True)
+    async def wait_until_ready(self, timeout: int = None):
+        """Wait for every readiness locator of the page to be visible"""
+        for locator in self.READY_LOCATORS:
+            wait_timeout = get_timeouts().timeout_for(locator, DEFAULT_TIMEOUT) if timeout is None else timeout
+            await self._wait_for(locator, wait_timeout)
+
+    async def _wait_for(self, locator: str, timeout: int):
+        """Wait for a locator and report the latency to the timeout service"""
+        start = time.perf_counter()
+        try:
+            await self.page.wait_for_selector(locator, timeout=timeout)
+        except PlaywrightTimeoutError:
+            get_timeouts().record(locator, (time.perf_counter() - start) * 1000, timeout, timed_out=True)
+            raise
+        get_timeouts().record(locator, (time.perf_counter() - start) * 1000, timeout, timed_out=False)
+
+    async def is_ready(self) -> bool:
+        """Check the readiness contract without waiting"""
+        for locator in self.READY_LOCATORS:
+            if not await self.page.locator(locator).first.is_visible():
+                return False
+        return True
+
+    @step("Click element: {locator}", primitive=True)
+    async def click(self, locator: str):
+        """Click on an element"""
+        await self.page.click(locator)
+
+    @step("Fill field: {locator} with value: {value}", primitive=True)
+    async def fill(self, locator: str, value: str):
+        """Fill a form field"""
+        await self.page.fill(locator, value)
+
+    @step("Fill form fields", primitive=True)
+    async def fill_form(self, fields: dict):
+        """Fill several fields in a single browser round trip (see BasePage.fill_form)"""
+        failures = await self.page.evaluate(FILL_FORM_SCRIPT,
+                                            [[locator, value] for locator, value in fields.items()])
+        if failures:
+            raise FormFillError(failures)
+
+    @step("Get text from element: {locator}", primitive=True)
+    async def get_text(self, locator: str) -> str:
+        """Get text from an element"""
+        return await self.page.locator(locator).inner_text()
+
+    @step("Check if element is visible: {locator}", primitive=True)
+    async def is_visible(self, locator: str) -> bool:
+        """Check if element is visible"""
+        return await self.page.locator(locator).is_visible()
+
+    @step("Wait for element: {locator}", primitive=True)
+    async def wait_for_element(self, locator: str, timeout: int = None, default_timeout: int = DEFAULT_TIMEOUT):
+        """Wait for an element to be visible (adaptive timeout, see BasePage.wait_for_element)"""
+        wait_timeout = get_timeouts().timeout_for(locator, default_timeout) if timeout is None else timeout
+        await self._wait_for(locator, wait_timeout)
+
+    @step("Take screenshot: {name}", primitive=True)
+    async def take_screenshot(self, name: str):
+        """Take a screenshot for the Allure report (subject to the capture policy)"""
+        await get_screenshot_pipeline().capture_async(self.page, name)
+
+    @step("Scroll to element: {locator}", primitive=True)
+    async def scroll_to_element(self, locator: str):
+        """Scroll to an element"""
+        await self.page.locator(locator).scroll_into_view_if_needed()
+
+    @step("Select from dropdown: {locator} with value: {value}", primitive=True)
+    async def select_dropdown(self, locator: str, value: str):
+        """Select value from dropdown"""
+        await self.page.select_option(locator, value)
+
+    @step("Get page title", primitive=True)
+    async def get_title(self) -> str:
+        """Get page title"""
+        return await self.page.title()
+
+    @step("Assert element text equals: {expected_text}", primitive=True)
+    async def assert_text_equals(self, locator: str, expected_text: str):
+        """Assert that element text equals expected text"""
+        await expect(self.page.locator(locator)).to_have_text(expected_text)
+
+    @step("Assert element contains text: {expected_text}", primitive=True)
+    async def assert_text_contains(self, locator: str, expected_text: str):
+        """Assert that element text contains expected text"""
+        await expect(self.page.locator(locator)).to_contain_text(expected_text)
@@ -0,0 +1,90 @@
+"""
+Async Cart Page Object Model
+"""
+from pages.aio.base_page import AsyncBasePage, shares_locators
+from pages.cart_page import CartPage, CartItem, CART_SNAPSHOT_SCRIPT, _to_number
+from utils.steps import step
+
+
+@shares_locators(CartPage)
+class AsyncCartPage(AsyncBasePage):
+    """Async twin of CartPage"""
+
+    @step("Open cart page")
+    async def open(self):
+        """Navigate to cart page"""
+        await self.navigate_to(f"{self.base_url}/view_cart")
+        return self
+
+    @step("Get number of items in cart")
+    async def get_cart_items_count(self) -> int:
+        """Get the number of items in cart"""
+        return await self.page.locator(self.CART_ITEMS).count()
+
+    @step("Get product name at index: {index}")
+    async def get_product_name(self, index: int) -> str:
+        """Get product name by index (0-based)"""
+        return await self.page.locator(self.PRODUCT_NAME).nth(index).inner_text()
+
+    @step("Get product price at index: {index}")
+    async def get_product_price(self, index: int) -> str:
+        """Get product price by index (0-based)"""
+        return await self.page.locator(self.PRODUCT_PRICE).nth(index).inner_text()
+
+    @step("Get product quantity at index: {index}")
+    async def get_product_quantity(self, index: int) -> str:
+        """Get product quantity by index (0-based)"""
+        return await self.page.locator(self.PRODUCT_QUANTITY).nth(index).inner_text()
+
+    @step("Get product total at index: {index}")
+    async def get_product_total(self, index: int) -> str:
+        """Get product total price by index (0-based)"""
+        return await self.page.locator(self.PRODUCT_TOTAL).nth(index).inner_text()
+
+    @step("Read cart table")
+    async def get_cart_snapshot(self) -> list:
+        """Read all cart rows in a single browser round trip"""
+        rows = await self.page.evaluate(CART_SNAPSHOT_SCRIPT, [
+            self.CART_INFO_TABLE,
+            self.PRODUCT_NAME,
+            self.PRODUCT_PRICE,
+            self.PRODUCT_QUANTITY,
+            self.PRODUCT_TOTAL
+        ])
+        return [
+            CartItem(
+                name=row['name'],
+                price=_to_number(row['price']),
+                quantity=_to_number(row['quantity']),
+                total=_to_number(row['total']),
+                price_text=row['price'],
+                quantity_text=row['quantity'],
+                total_text=row['total']
+            )
+            for row in rows
+        ]
+
+    @step("Verify cart contains {expected_count} products")
+    async def verify_cart_items_count(self, expected_count: int) -> bool:
+        """Verify the number of items in cart"""
+        return len(await self.get_cart_snapshot()) == expected_count
+
+    @step("Get all products in cart")
+    async def get_all_products_info(self) -> list:
+        """Get information about all products in cart"""
+        return [item.as_dict() for item in await self.get_cart_snapshot()]
+
+    @step("Click Proceed to Checkout")
+    async def click_proceed_to_checkout(self):
+        """Click on Proceed to Checkout button"""
+        await self.click(self.PROCEED_TO_CHECKOUT_BUTTON)
+
+    @step("Take cart screenshot")
+    async def capture_cart_state(self):
+        """Take screenshot of cart"""
+        await self.take_screenshot("cart_state")
+
+    @step("Verify cart is not empty")
+    async def is_cart_not_empty(self) -> bool:
+        """Check if cart has items"""
+        return len(await self.get_cart_snapshot()) > 0
@@ -0,0 +1,104 @@
+"""
+Async Checkout Page Object Model
+"""
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from pages.aio.base_page import AsyncBasePage, shares_locators
+from pages.checkout_page import CheckoutPage
+from utils.steps import step
+
+
+@shares_locators(CheckoutPage)
+class AsyncCheckoutPage(AsyncBasePage):
+    """Async twin of CheckoutPage"""
+
+    @step("Open checkout page")
+    async def open(self):
+        """Navigate to checkout page"""
+        await self.navigate_to(f"{self.base_url}/checkout")
+        return self
+
+    @step("Verify delivery address is displayed")
+    async def is_delivery_address_visible(self) -> bool:
+        """Check if delivery address is visible"""
+        return await self.is_visible(self.ADDRESS_DELIVERY)
+
+    @step("Verify invoice address is displayed")
+    async def is_invoice_address_visible(self) -> bool:
+        """Check if invoice address is visible"""
+        return await self.is_visible(self.ADDRESS_INVOICE)
+
+    @step("Add comment to order: {comment}")
+    async def add_order_comment(self, comment: str):
+        """Add comment/note to the order"""
+        await self.fill(self.COMMENT_TEXTAREA, comment)
+
+    @step("Click Place Order button")
+    async def click_place_order(self):
+        """Click on Place Order button"""
+        await self.click(self.PLACE_ORDER_BUTTON)
+
+    @step("Fill payment information")
+    async def fill_payment_information(self, name_on_card: str, card_number: str,
+                                       cvc: str, expiry_month: str, expiry_year: str):
+        """Fill payment form"""
+        await self.fill_form({
+            self.NAME_ON_CARD_INPUT: name_on_card,
+            self.CARD_NUMBER_INPUT: card_number,
+            self.CVC_INPUT: cvc,
+            self.EXPIRY_MONTH_INPUT: expiry_month,
+            self.EXPIRY_YEAR_INPUT: expiry_year,
+        })
+
+    @step("Click Pay and Confirm Order button")
+    async def click_pay_and_confirm(self):
+        """Click on Pay and Confirm Order button"""
+        await self.click(self.PAY_CONFIRM_BUTTON)
+
+    @step("Verify order is placed successfully")
+    async def is_order_placed(self) -> bool:
+        """Check if order was placed successfully"""
+        try:
+            await self.wait_for_element(self.ORDER_PLACED_MESSAGE, default_timeout=self.ORDER_CONFIRMATION_TIMEOUT)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    @step("Complete checkout process")
+    async def complete_checkout(self, payment_data: dict, comment: str = ""):
+        """Complete full checkout process"""
+        # Verify addresses
+        assert await self.is_delivery_address_visible(), "Delivery address not visible"
+        assert await self.is_invoice_address_visible(), "Invoice address not visible"
+
+        # Add comment if provided
+        if comment:
+            await self.add_order_comment(comment)
+
+        await self.take_screenshot("before_checkout")
+
+        # Place order
+        await self.click_place_order()
+        await self.wait_for_element(self.NAME_ON_CARD_INPUT)
+
+        # Fill payment
+        await self.fill_payment_information(
+            payment_data['name_on_card'],
+            payment_data['card_number'],
+            payment_data['cvc'],
+            payment_data['expiry_month'],
+            payment_data['expiry_year']
+        )
+
+        await self.take_screenshot("payment_filled")
+
+        # Confirm payment
+        await self.click_pay_and_confirm()
+
+        # Verify order placed
+        await self.wait_for_element(self.ORDER_PLACED_MESSAGE, default_timeout=self.ORDER_CONFIRMATION_TIMEOUT)
+        await self.take_screenshot("order_placed")
+
+    @step("Get order confirmation message")
+    async def get_confirmation_message(self) -> str:
+        """Get order confirmation message"""
+        return await self.get_text(self.ORDER_PLACED_MESSAGE)
@@ -0,0 +1,56 @@
+"""
+Async Home Page Object Model
+"""
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from pages.aio.base_page import AsyncBasePage, shares_locators
+from pages.home_page import HomePage
+from utils.steps import step
+
+
+@shares_locators(HomePage)
+class AsyncHomePage(AsyncBasePage):
+    """Async twin of HomePage"""
+
+    @step("Open home page")
+    async def open(self):
+        """Navigate to home page"""
+        await self.navigate_to(self.base_url)
+        return self
+
+    @step("Click Signup/Login link")
+    async def click_signup_login(self):
+        """Click on Signup/Login link"""
+        await self.click(self.SIGNUP_LOGIN_LINK)
+
+    @step("Click Products link")
+    async def click_products(self):
+        """Click on Products link"""
+        await self.click(self.PRODUCTS_LINK)
+
+    @step("Click Cart link")
+    async def click_cart(self):
+        """Click on Cart link"""
+        await self.click(self.CART_LINK)
+
+    @step("Verify user is logged in as: {username}")
+    async def is_user_logged_in(self, username: str, timeout: int = HomePage.LOGIN_CHECK_TIMEOUT) -> bool:
+        """Check if user is logged in (see HomePage.is_user_logged_in)"""
+        if timeout == 0:
+            if not await self.is_visible(self.LOGGED_IN_USER):
+                return False
+        else:
+            try:
+                await self.page.locator(self.LOGGED_IN_USER).wait_for(state="visible", timeout=timeout)
+            except PlaywrightTimeoutError:
+                return False
+        return username in await self.get_text(self.LOGGED_IN_USER)
+
+    @step("Click Logout link")
+    async def click_logout(self):
+        """Click on Logout link"""
+        await self.click(self.LOGOUT_LINK)
+
+    @step("Click Delete Account link")
+    async def click_delete_account(self):
+        """Click on Delete Account link"""
+        await self.click(self.DELETE_ACCOUNT_LINK)
@@ -0,0 +1,66 @@
+"""
+Async Products Page Object Model
+"""
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from pages.aio.base_page import AsyncBasePage, shares_locators
+from pages.products_page import ProductsPage
+from utils.steps import step
+
+
+@shares_locators(ProductsPage)
+class AsyncProductsPage(AsyncBasePage):
+    """Async twin of ProductsPage"""
+
+    @step("Open products page")
+    async def open(self):
+        """Navigate to products page"""
+        await self.navigate_to(f"{self.base_url}/products")
+        return self
+
+    @step("Verify products page is loaded")
+    async def is_products_page_loaded(self) -> bool:
+        """Check if products page is loaded"""
+        try:
+            await self.wait_until_ready()
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    def get_product_by_index(self, index: int) -> str:
+        """Get product element by index (1-based)"""
+        return f"{self.PRODUCT_ITEM} >> nth={index - 1}"
+
+    @step("Hover over product at index: {index}")
+    async def hover_on_product(self, index: int):
+        """Hover over a product to reveal Add to Cart button"""
+        await self.page.locator(self.get_product_by_index(index)).hover()
+
+    @step("Add product to cart at index: {index}")
+    async def add_product_to_cart(self, index: int):
+        """Add a product to cart by index"""
+        product_locator = self.get_product_by_index(index)
+        # Hover over product
+        await self.page.locator(product_locator).hover()
+        # Click add to cart button within the hovered product
+        await self.click(f"{product_locator} >> {self.ADD_TO_CART_BUTTON}")
+        # Wait for modal to appear
+        await self.wait_for_element(self.CONTINUE_SHOPPING_BUTTON)
+        await self.take_screenshot(f"product_{index}_added")
+
+    @step("Continue shopping after adding product")
+    async def click_continue_shopping(self):
+        """Click Continue Shopping button in modal"""
+        await self.click(self.CONTINUE_SHOPPING_BUTTON)
+
+    @step("View cart from modal")
+    async def click_view_cart_modal(self):
+        """Click View Cart link in modal"""
+        await self.click(self.VIEW_CART_MODAL_LINK)
+
+    @step("Add multiple products to cart: {product_indices}")
+    async def add_multiple_products(self, product_indices: list):
+        """Add multiple products to cart"""
+        for index in product_indices:
+            await self.add_product_to_cart(index)
+            if index != product_indices[-1]:  # Don't click continue shopping for the last product
+                await self.click_continue_shopping()
@@ -0,0 +1,102 @@
+"""
+Async Signup/Login Page Object Model
+"""
+from pages.aio.base_page import AsyncBasePage, shares_locators
+from pages.signup_login_page import SignupLoginPage
+from utils.accounts import get_account_registry
+from utils.steps import step
+
+
+@shares_locators(SignupLoginPage)
+class AsyncSignupLoginPage(AsyncBasePage):
+    """Async twin of SignupLoginPage"""
+
+    @step("Open Signup/Login page")
+    async def open(self):
+        """Navigate to Signup/Login page"""
+        await self.navigate_to(f"{self.base_url}/login")
+        return self
+
+    @step("Fill signup form with name: {name} and email: {email}")
+    async def fill_signup_form(self, name: str, email: str):
+        """Fill the signup form"""
+        await self.fill(self.SIGNUP_NAME_INPUT, name)
+        await self.fill(self.SIGNUP_EMAIL_INPUT, email)
+        await self.click(self.SIGNUP_BUTTON)
+
+    @step("Fill account information")
+    async def fill_account_information(self, password: str, day: str, month: str, year: str):
+        """Fill account information form"""
+        await self.fill_form({
+            self.GENDER_MR_RADIO: True,
+            self.PASSWORD_INPUT: password,
+            self.DAY_DROPDOWN: day,
+            self.MONTH_DROPDOWN: month,
+            self.YEAR_DROPDOWN: year,
+            self.NEWSLETTER_CHECKBOX: True,
+            self.OFFERS_CHECKBOX: True,
+        })
+
+    @step("Fill address information")
+    async def fill_address_information(self, first_name: str, last_name: str, company: str,
+                                       address1: str, address2: str, country: str,
+                                       state: str, city: str, zipcode: str, mobile: str):
+        """Fill address information form"""
+        await self.fill_form({
+            self.FIRST_NAME_INPUT: first_name,
+            self.LAST_NAME_INPUT: last_name,
+            self.COMPANY_INPUT: company,
+            self.ADDRESS1_INPUT: address1,
+            self.ADDRESS2_INPUT: address2,
+            self.COUNTRY_DROPDOWN: country,
+            self.STATE_INPUT: state,
+            self.CITY_INPUT: city,
+            self.ZIPCODE_INPUT: zipcode,
+            self.MOBILE_INPUT: mobile,
+        })
+
+    @step("Click Create Account button")
+    async def click_create_account(self):
+        """Click on Create Account button"""
+        await self.click(self.CREATE_ACCOUNT_BUTTON)
+
+    @step("Verify account created")
+    async def is_account_created(self) -> bool:
+        """Check if account was created successfully"""
+        return await self.is_visible(self.ACCOUNT_CREATED_MESSAGE)
+
+    @step("Click Continue button")
+    async def click_continue(self):
+        """Click on Continue button after account creation"""
+        await self.click(self.CONTINUE_BUTTON)
+
+    @step("Complete registration process")
+    async def complete_registration(self, user_data: dict):
+        """Complete full registration process"""
+        await self.fill_signup_form(user_data['name'], user_data['email'])
+        await self.wait_for_element(self.PASSWORD_INPUT)
+
+        await self.fill_account_information(
+            user_data['password'],
+            user_data['day'],
+            user_data['month'],
+            user_data['year']
+        )
+
+        await self.fill_address_information(
+            user_data['first_name'],
+            user_data['last_name'],
+            user_data['company'],
+            user_data['address1'],
+            user_data['address2'],
+            user_data['country'],
+            user_data['state'],
+            user_data['city'],
+            user_data['zipcode'],
+            user_data['mobile']
+        )
+
+        # Recorded first, so the account is cleaned up even if the rest of the flow fails
+        get_account_registry().register(self.base_url, user_data)
+        await self.click_create_account()
+        await self.wait_for_element(self.ACCOUNT_CREATED_MESSAGE)
@@ -1,75 +1,215 @@
 """
 Base Page Object Model class with common methods for all pages
 """
-from playwright.sync_api import Page, expect
-import allure
+import time
+
+from playwright.sync_api import Locator, Page, expect, TimeoutError as PlaywrightTimeoutError
+from utils.instrumentation import instrumentation
+from utils.locator_cache import LocatorCache
+from utils.page_timings import page_timings
+from utils.screenshots import get_screenshot_pipeline
+from utils.steps import step
+from utils.timeouts import get_timeouts
+
+
+DEFAULT_BASE_URL = "https://www.automationexercise.com"
+
+# Used while a locator has too little latency history for an adaptive timeout
+DEFAULT_TIMEOUT = 10000
+
+WAIT_READY = "ready"
+WAIT_NETWORKIDLE = "networkidle"
+
+# Applies [selector, value] pairs inside the page and returns {selector: error}.
+# Strings fill inputs/textareas or pick a <select> option by value or label,
+# booleans set checkboxes/radios. Native value setters plus input/change
+# events make the site's handlers see the same events as typed input.
+FILL_FORM_SCRIPT = """fields => {
+    const failures = {};
+    for (const [selector, value] of fields) {
+        let element;
+        try {
+            element = document.querySelector(selector);
+        } catch (error) {
+            failures[selector] = 'invalid selector: ' + error.message;
+            continue;
+        }
+        if (!element) {
+            failures[selector] = 'element not found';
+            continue;
+        }
+        if (element.disabled || element.readOnly) {
+            failures[selector] = 'element is not editable';
+            continue;
+        }
+        const tag = element.tagName.toLowerCase();
+        const type = (element.type || '').toLowerCase();
+        if (typeof value === 'boolean') {
+            if (type !== 'checkbox' && type !== 'radio') {
+                failures[selector] = 'boolean value for non-checkable ' + tag;
+            } else if (element.checked !== value) {
+                element.click();
+            }
+            continue;
+        }
+        if (tag === 'select') {
+            const option = Array.from(element.options).find(
+                option => option.value === value || option.label === value || option.text.trim() === value);
+            if (!option) {
+                failures[selector] = 'no option ' + JSON.stringify(value);
+                continue;
+            }
+            element.value = option.value;
+        } else if (tag === 'input' || tag === 'textarea') {
+            const prototype = tag === 'input' ? HTMLInputElement.prototype : HTMLTextAreaElement.prototype;
+            Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, value);
+        } else {
+            failures[selector] = 'cannot fill ' + tag;
+            continue;
+        }
+        element.dispatchEvent(new Event('input', { bubbles: true }));
+        element.dispatchEvent(new Event('change', { bubbles: true }));
+    }
+    return failures;
+}"""
+
+
+class FormFillError(Exception):
+    """Raised when some fields of a bulk form fill could not be applied"""
+
+    def __init__(self, failures: dict):
+        self.failures = failures
+        details = "; ".join(f"{selector}: {error}" for selector, error in failures.items())
+        super().__init__(f"Could not fill {len(failures)} field(s): {details}")
 
 
 class BasePage:
     """Base class for all page objects"""
 
-    def __init__(self, page: Page):
+    # Locators that must be visible before the page counts as loaded
+    READY_LOCATORS = ()
+
+    # "ready" waits for READY_LOCATORS; "networkidle" is the legacy blanket wait
+    wait_strategy = WAIT_READY
+
+    def __init__(self, page: Page, base_url: str = None):
         self.page = page
-        self.base_url = "https://www.automationexercise.com"
+        self.base_url = (base_url or DEFAULT_BASE_URL).rstrip("/")
+        self.locators = LocatorCache.for_page(page)
+
+    def locator(self, selector: str) -> Locator:
+        """Cached Locator for selector (cleared on navigation)"""
+        return self.locators.get(selector)
+
+    def nth(self, selector: str, index: int) -> Locator:
+        """Cached Locator for the index-th (0-based) match of selector"""
+        return self.locators.nth(selector, index)
 
-    @allure.step("Navigate to {url}")
+    @step("Navigate to {url}", primitive=True)
     def navigate_to(self, url: str):
-        """Navigate to a specific URL"""
-        self.page.goto(url)
-        self.page.wait_for_load_state("networkidle")
+        """Navigate to a specific URL and wait until the page is ready"""
+        start = time.perf_counter()
+        if self.wait_strategy == WAIT_NETWORKIDLE or not self.READY_LOCATORS:
+            self.page.goto(url)
+            with instrumentation.waiting():
+                self.page.wait_for_load_state("networkidle")
+            strategy = WAIT_NETWORKIDLE
+        else:
+            self.page.goto(url, wait_until="domcontentloaded")
+            self.wait_until_ready()
+            strategy = WAIT_READY
+        page_timings.record(type(self).__name__, url, strategy, time.perf_counter() - start)
+
+    @step("Wait until page is ready", primitive=True)
+    def wait_until_ready(self, timeout: int = None):
+        """Wait for every readiness locator of the page to be visible"""
+        for locator in self.READY_LOCATORS:
+            wait_timeout = get_timeouts().timeout_for(locator, DEFAULT_TIMEOUT) if timeout is None else timeout
+            self._wait_for(locator, wait_timeout)
+
+    def _wait_for(self, locator: str, timeout: int):
+        """Wait for a locator and report the latency to the timeout service"""
+        start = time.perf_counter()
+        try:
+            with instrumentation.waiting():
+                self.page.wait_for_selector(locator, timeout=timeout)
+        except PlaywrightTimeoutError:
+            get_timeouts().record(locator, (time.perf_counter() - start) * 1000, timeout, timed_out=True)
+            raise
+        get_timeouts().record(locator, (time.perf_counter() - start) * 1000, timeout, timed_out=False)
 
-    @allure.step("Click element: {locator}")
+    def is_ready(self) -> bool:
+        """Check the readiness contract without waiting"""
+        return all(self.nth(locator, 0).is_visible() for locator in self.READY_LOCATORS)
+
+    @step("Click element: {locator}", primitive=True)
     def click(self, locator: str):
-        """Click on an element"""
-        self.page.click(locator)
+        """Click on an element (the first match, like page.click)"""
+        self.nth(locator, 0).click()
 
-    @allure.step("Fill field: {locator} with value: {value}")
+    @step("Fill field: {locator} with value: {value}", primitive=True)
     def fill(self, locator: str, value: str):
         """Fill a form field"""
-        self.page.fill(locator, value)
+        self.nth(locator, 0).fill(value)
+
+    @step("Fill form fields", primitive=True)
+    def fill_form(self, fields: dict):
+        """Fill several fields in a single browser round trip
 
-    @allure.step("Get text from element: {locator}")
+        fields maps a CSS locator to a string (input/textarea value, or
+        select option value/label) or a bool (checkbox/radio state).
+        Raises FormFillError listing every field that failed.
+        """
+        failures = self.page.evaluate(FILL_FORM_SCRIPT, [[locator, value] for locator, value in fields.items()])
+        if failures:
+            raise FormFillError(failures)
+
+    @step("Get text from element: {locator}", primitive=True)
     def get_text(self, locator: str) -> str:
         """Get text from an element"""
-        return self.page.locator(locator).inner_text()
+        return self.locator(locator).inner_text()
 
-    @allure.step("Check if element is visible: {locator}")
+    @step("Check if element is visible: {locator}", primitive=True)
     def is_visible(self, locator: str) -> bool:
         """Check if element is visible"""
-        return self.page.locator(locator).is_visible()
+        return self.locator(locator).is_visible()
+
+    @step("Wait for element: {locator}", primitive=True)
+    def wait_for_element(self, locator: str, timeout: int = None, default_timeout: int = DEFAULT_TIMEOUT):
+        """Wait for an element to be visible
 
-    @allure.step("Wait for element: {locator}")
-    def wait_for_element(self, locator: str, timeout: int = 10000):
-        """Wait for an element to be visible"""
-        self.page.wait_for_selector(locator, timeout=timeout)
+        Without an explicit timeout the wait gets an adaptive one derived from
+        the locator's latency history (default_timeout until there is enough).
+        """
+        wait_timeout = get_timeouts().timeout_for(locator, default_timeout) if timeout is None else timeout
+        self._wait_for(locator, wait_timeout)
 
-    @allure.step("Take screenshot: {name}")
+    @step("Take screenshot: {name}", primitive=True)
     def take_screenshot(self, name: str):
-        """Take a screenshot and attach to Allure report"""
-        screenshot = self.page.screenshot()
-        allure.attach(screenshot, name=name, attachment_type=allure.attachment_type.PNG)
+        """Take a screenshot for the Allure report (subject to the capture policy)"""
+        get_screenshot_pipeline().capture(self.page, name)
 
-    @allure.step("Scroll to element: {locator}")
+    @step("Scroll to element: {locator}", primitive=True)
     def scroll_to_element(self, locator: str):
         """Scroll to an element"""
-        self.page.locator(locator).scroll_into_view_if_needed()
+        self.locator(locator).scroll_into_view_if_needed()
 
-    @allure.step("Select from dropdown: {locator} with value: {value}")
+    @step("Select from dropdown: {locator} with value: {value}", primitive=True)
     def select_dropdown(self, locator: str, value: str):
         """Select value from dropdown"""
-        self.page.select_option(locator, value)
+        self.nth(locator, 0).select_option(value)
 
-    @allure.step("Get page title")
+    @step("Get page title", primitive=True)
     def get_title(self) -> str:
         """Get page title"""
         return self.page.title()
 
-    @allure.step("Assert element text equals: {expected_text}")
+    @step("Assert element text equals: {expected_text}", primitive=True)
     def assert_text_equals(self, locator: str, expected_text: str):
         """Assert that element text equals expected text"""
-        expect(self.page.locator(locator)).to_have_text(expected_text)
+        expect(self.locator(locator)).to_have_text(expected_text)
 
-    @allure.step("Assert element contains text: {expected_text}")
+    @step("Assert element contains text: {expected_text}", primitive=True)
     def assert_text_contains(self, locator: str, expected_text: str):
         """Assert that element text contains expected text"""
-        expect(self.page.locator(locator)).to_contain_text(expected_text)
\ No newline at end of file
+        expect(self.locator(locator)).to_contain_text(expected_text)
\ No newline at end of file
@@ -1,8 +1,57 @@
 """
 Cart Page Object Model
 """
+import re
+from dataclasses import dataclass
+
 from pages.base_page import BasePage
-import allure
+from utils.steps import step
+
+
+# Reads every product row of the cart table in one evaluation
+CART_SNAPSHOT_SCRIPT = """([tableSelector, nameSelector, priceSelector, quantitySelector, totalSelector]) => {
+    const table = document.querySelector(tableSelector);
+    if (!table) return [];
+    const text = (row, selector) => {
+        const cell = row.querySelector(selector);
+        return cell ? cell.innerText.trim() : '';
+    };
+    return Array.from(table.querySelectorAll('tr'))
+        .filter(row => !row.classList.contains('cart_menu') && row.querySelector(nameSelector))
+        .map(row => ({
+            name: text(row, nameSelector),
+            price: text(row, priceSelector),
+            quantity: text(row, quantitySelector),
+            total: text(row, totalSelector),
+        }));
+}"""
+
+
+def _to_number(text: str) -> int:
+    """Parse 'Rs. 1,500' style amounts"""
+    digits = re.sub(r"[^\d]", "", text)
+    return int(digits) if digits else 0
+
+
+@dataclass(frozen=True)
+class CartItem:
+    """One row of the cart table"""
+    name: str
+    price: int
+    quantity: int
+    total: int
+    price_text: str
+    quantity_text: str
+    total_text: str
+
+    def as_dict(self) -> dict:
+        """Row as displayed text, the format of get_all_products_info"""
+        return {
+            'name': self.name,
+            'price': self.price_text,
+            'quantity': self.quantity_text,
+            'total': self.total_text
+        }
 
 
 class CartPage(BasePage):
@@ -20,72 +69,87 @@ class CartPage(BasePage):
     DELETE_PRODUCT_BUTTON = ".cart_quantity_delete"
     CART_EMPTY_TEXT = "#empty_cart"
 
-    def __init__(self, page):
-        super().__init__(page)
+    # Either the cart table or the empty-cart message
+    READY_LOCATORS = (f"{CART_INFO_TABLE}, {CART_EMPTY_TEXT}",)
+
+    def __init__(self, page, base_url: str = None):
+        super().__init__(page, base_url)
+
+    @step("Open cart page")
+    def open(self):
+        """Navigate to cart page"""
+        self.navigate_to(f"{self.base_url}/view_cart")
+        return self
 
-    @allure.step("Get number of items in cart")
+    @step("Get number of items in cart")
     def get_cart_items_count(self) -> int:
         """Get the number of items in cart"""
-        return self.page.locator(self.CART_ITEMS).count()
+        return self.locator(self.CART_ITEMS).count()
 
-    @allure.step("Get product name at index: {index}")
+    @step("Get product name at index: {index}")
     def get_product_name(self, index: int) -> str:
         """Get product name by index (0-based)"""
-        products = self.page.locator(self.PRODUCT_NAME)
-        return products.nth(index).inner_text()
+        return self.nth(self.PRODUCT_NAME, index).inner_text()
 
-    @allure.step("Get product price at index: {index}")
+    @step("Get product price at index: {index}")
     def get_product_price(self, index: int) -> str:
         """Get product price by index (0-based)"""
-        prices = self.page.locator(self.PRODUCT_PRICE)
-        return prices.nth(index).inner_text()
+        return self.nth(self.PRODUCT_PRICE, index).inner_text()
 
-    @allure.step("Get product quantity at index: {index}")
+    @step("Get product quantity at index: {index}")
     def get_product_quantity(self, index: int) -> str:
         """Get product quantity by index (0-based)"""
-        quantities = self.page.locator(self.PRODUCT_QUANTITY)
-        return quantities.nth(index).inner_text()
+        return self.nth(self.PRODUCT_QUANTITY, index).inner_text()
 
-    @allure.step("Get product total at index: {index}")
+    @step("Get product total at index: {index}")
     def get_product_total(self, index: int) -> str:
         """Get product total price by index (0-based)"""
-        totals = self.page.locator(self.PRODUCT_TOTAL)
-        return totals.nth(index).inner_text()
-
-    @allure.step("Verify cart contains {expected_count} products")
+        return self.nth(self.PRODUCT_TOTAL, index).inner_text()
+
+    @step("Read cart table")
+    def get_cart_snapshot(self) -> list:
+        """Read all cart rows in a single browser round trip"""
+        rows = self.page.evaluate(CART_SNAPSHOT_SCRIPT, [
+            self.CART_INFO_TABLE,
+            self.PRODUCT_NAME,
+            self.PRODUCT_PRICE,
+            self.PRODUCT_QUANTITY,
+            self.PRODUCT_TOTAL
+        ])
+        return [
+            CartItem(
+                name=row['name'],
+                price=_to_number(row['price']),
+                quantity=_to_number(row['quantity']),
+                total=_to_number(row['total']),
+                price_text=row['price'],
+                quantity_text=row['quantity'],
+                total_text=row['total']
+            )
+            for row in rows
+        ]
+
+    @step("Verify cart contains {expected_count} products")
     def verify_cart_items_count(self, expected_count: int) -> bool:
         """Verify the number of items in cart"""
-        actual_count = self.get_cart_items_count()
-        return actual_count == expected_count
+        return len(self.get_cart_snapshot()) == expected_count
 
-    @allure.step("Get all products in cart")
+    @step("Get all products in cart")
     def get_all_products_info(self) -> list:
         """Get information about all products in cart"""
-        count = self.get_cart_items_count()
-        products = []
-
-        for i in range(count):
-            product_info = {
-                'name': self.get_product_name(i),
-                'price': self.get_product_price(i),
-                'quantity': self.get_product_quantity(i),
-                'total': self.get_product_total(i)
-            }
-            products.append(product_info)
-
-        return products
+        return [item.as_dict() for item in self.get_cart_snapshot()]
 
-    @allure.step("Click Proceed to Checkout")
+    @step("Click Proceed to Checkout")
     def click_proceed_to_checkout(self):
         """Click on Proceed to Checkout button"""
         self.click(self.PROCEED_TO_CHECKOUT_BUTTON)
 
-    @allure.step("Take cart screenshot")
+    @step("Take cart screenshot")
     def capture_cart_state(self):
         """Take screenshot of cart"""
         self.take_screenshot("cart_state")
 
-    @allure.step("Verify cart is not empty")
+    @step("Verify cart is not empty")
     def is_cart_not_empty(self) -> bool:
         """Check if cart has items"""
-        return self.get_cart_items_count() > 0
\ No newline at end of file
+        return len(self.get_cart_snapshot()) > 0
\ No newline at end of file
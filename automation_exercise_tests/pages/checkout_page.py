@@ -1,8 +1,9 @@
 """
 Checkout Page Object Model
 """
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from pages.base_page import BasePage
-import allure
+from utils.steps import step
 
 
 class CheckoutPage(BasePage):
@@ -29,54 +30,67 @@ class CheckoutPage(BasePage):
     DOWNLOAD_INVOICE_BUTTON = "a[href='/download_invoice']"
     CONTINUE_BUTTON = "a[data-qa='continue-button']"
 
-    def __init__(self, page):
-        super().__init__(page)
+    READY_LOCATORS = (ADDRESS_DELIVERY, ORDER_REVIEW)
 
-    @allure.step("Verify delivery address is displayed")
+    # Payment is processed server side, so confirmation may take longer
+    ORDER_CONFIRMATION_TIMEOUT = 15000
+
+    def __init__(self, page, base_url: str = None):
+        super().__init__(page, base_url)
+
+    @step("Open checkout page")
+    def open(self):
+        """Navigate to checkout page"""
+        self.navigate_to(f"{self.base_url}/checkout")
+        return self
+
+    @step("Verify delivery address is displayed")
     def is_delivery_address_visible(self) -> bool:
         """Check if delivery address is visible"""
         return self.is_visible(self.ADDRESS_DELIVERY)
 
-    @allure.step("Verify invoice address is displayed")
+    @step("Verify invoice address is displayed")
     def is_invoice_address_visible(self) -> bool:
         """Check if invoice address is visible"""
         return self.is_visible(self.ADDRESS_INVOICE)
 
-    @allure.step("Add comment to order: {comment}")
+    @step("Add comment to order: {comment}")
     def add_order_comment(self, comment: str):
         """Add comment/note to the order"""
         self.fill(self.COMMENT_TEXTAREA, comment)
 
-    @allure.step("Click Place Order button")
+    @step("Click Place Order button")
     def click_place_order(self):
         """Click on Place Order button"""
         self.click(self.PLACE_ORDER_BUTTON)
 
-    @allure.step("Fill payment information")
+    @step("Fill payment information")
     def fill_payment_information(self, name_on_card: str, card_number: str,
                                  cvc: str, expiry_month: str, expiry_year: str):
         """Fill payment form"""
-        self.fill(self.NAME_ON_CARD_INPUT, name_on_card)
-        self.fill(self.CARD_NUMBER_INPUT, card_number)
-        self.fill(self.CVC_INPUT, cvc)
-        self.fill(self.EXPIRY_MONTH_INPUT, expiry_month)
-        self.fill(self.EXPIRY_YEAR_INPUT, expiry_year)
-
-    @allure.step("Click Pay and Confirm Order button")
+        self.fill_form({
+            self.NAME_ON_CARD_INPUT: name_on_card,
+            self.CARD_NUMBER_INPUT: card_number,
+            self.CVC_INPUT: cvc,
+            self.EXPIRY_MONTH_INPUT: expiry_month,
+            self.EXPIRY_YEAR_INPUT: expiry_year,
+        })
+
+    @step("Click Pay and Confirm Order button")
     def click_pay_and_confirm(self):
         """Click on Pay and Confirm Order button"""
         self.click(self.PAY_CONFIRM_BUTTON)
 
-    @allure.step("Verify order is placed successfully")
+    @step("Verify order is placed successfully")
     def is_order_placed(self) -> bool:
         """Check if order was placed successfully"""
         try:
-            self.wait_for_element(self.ORDER_PLACED_MESSAGE, timeout=15000)
+            self.wait_for_element(self.ORDER_PLACED_MESSAGE, default_timeout=self.ORDER_CONFIRMATION_TIMEOUT)
             return True
-        except:
+        except PlaywrightTimeoutError:
             return False
 
-    @allure.step("Complete checkout process")
+    @step("Complete checkout process")
     def complete_checkout(self, payment_data: dict, comment: str = ""):
         """Complete full checkout process"""
         # Verify addresses
@@ -108,10 +122,10 @@ class CheckoutPage(BasePage):
         self.click_pay_and_confirm()
 
         # Verify order placed
-        self.wait_for_element(self.ORDER_PLACED_MESSAGE, timeout=15000)
+        self.wait_for_element(self.ORDER_PLACED_MESSAGE, default_timeout=self.ORDER_CONFIRMATION_TIMEOUT)
         self.take_screenshot("order_placed")
 
-    @allure.step("Get order confirmation message")
+    @step("Get order confirmation message")
     def get_confirmation_message(self) -> str:
         """Get order confirmation message"""
         return self.get_text(self.ORDER_PLACED_MESSAGE)
\ No newline at end of file
@@ -1,8 +1,9 @@
 """
 Home Page Object Model
 """
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from pages.base_page import BasePage
-import allure
+from utils.steps import step
 
 
 class HomePage(BasePage):
@@ -17,45 +18,58 @@ class HomePage(BasePage):
     DELETE_ACCOUNT_LINK = "a[href='/delete_account']"
     LOGOUT_LINK = "a[href='/logout']"
 
-    def __init__(self, page):
-        super().__init__(page)
+    READY_LOCATORS = (PRODUCTS_LINK, CART_LINK)
 
-    @allure.step("Open home page")
+    # How long is_user_logged_in waits for the "Logged in as" header (ms)
+    LOGIN_CHECK_TIMEOUT = 5000
+
+    def __init__(self, page, base_url: str = None):
+        super().__init__(page, base_url)
+
+    @step("Open home page")
     def open(self):
         """Navigate to home page"""
         self.navigate_to(self.base_url)
         return self
 
-    @allure.step("Click Signup/Login link")
+    @step("Click Signup/Login link")
     def click_signup_login(self):
         """Click on Signup/Login link"""
         self.click(self.SIGNUP_LOGIN_LINK)
 
-    @allure.step("Click Products link")
+    @step("Click Products link")
     def click_products(self):
         """Click on Products link"""
         self.click(self.PRODUCTS_LINK)
 
-    @allure.step("Click Cart link")
+    @step("Click Cart link")
     def click_cart(self):
         """Click on Cart link"""
         self.click(self.CART_LINK)
 
-    @allure.step("Verify user is logged in as: {username}")
-    def is_user_logged_in(self, username: str) -> bool:
-        """Check if user is logged in"""
-        try:
-            logged_in_text = self.get_text(self.LOGGED_IN_USER)
-            return username in logged_in_text
-        except:
-            return False
+    @step("Verify user is logged in as: {username}")
+    def is_user_logged_in(self, username: str, timeout: int = LOGIN_CHECK_TIMEOUT) -> bool:
+        """Check if user is logged in
+
+        Waits up to timeout ms for the "Logged in as" header; timeout=0 only
+        looks at the loaded page, for probes where a logged-out page is expected.
+        """
+        if timeout == 0:
+            if not self.is_visible(self.LOGGED_IN_USER):
+                return False
+        else:
+            try:
+                self.locator(self.LOGGED_IN_USER).wait_for(state="visible", timeout=timeout)
+            except PlaywrightTimeoutError:
+                return False
+        return username in self.get_text(self.LOGGED_IN_USER)
 
-    @allure.step("Click Logout link")
+    @step("Click Logout link")
     def click_logout(self):
         """Click on Logout link"""
         self.click(self.LOGOUT_LINK)
 
-    @allure.step("Click Delete Account link")
+    @step("Click Delete Account link")
     def click_delete_account(self):
         """Click on Delete Account link"""
         self.click(self.DELETE_ACCOUNT_LINK)
\ No newline at end of file
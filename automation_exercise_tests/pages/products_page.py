@@ -1,8 +1,9 @@
 """
 Products Page Object Model
 """
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from pages.base_page import BasePage
-import allure
+from utils.steps import step
 
 
 class ProductsPage(BasePage):
@@ -18,49 +19,59 @@ class ProductsPage(BasePage):
     SEARCH_INPUT = "#search_product"
     SEARCH_BUTTON = "#submit_search"
 
-    def __init__(self, page):
-        super().__init__(page)
+    READY_LOCATORS = (ALL_PRODUCTS_TITLE, PRODUCT_ITEM)
 
-    @allure.step("Verify products page is loaded")
+    def __init__(self, page, base_url: str = None):
+        super().__init__(page, base_url)
+
+    @step("Open products page")
+    def open(self):
+        """Navigate to products page"""
+        self.navigate_to(f"{self.base_url}/products")
+        return self
+
+    @step("Verify products page is loaded")
     def is_products_page_loaded(self) -> bool:
         """Check if products page is loaded"""
-        return self.is_visible(self.ALL_PRODUCTS_TITLE)
+        try:
+            self.wait_until_ready()
+            return True
+        except PlaywrightTimeoutError:
+            return False
 
-    @allure.step("Get product locator by index: {index}")
+    @step("Get product locator by index: {index}")
     def get_product_by_index(self, index: int) -> str:
-        """Get product element by index (1-based)"""
-        return f"({self.PRODUCT_ITEM})[{index}]"
+        """Get product selector by index (1-based)"""
+        return f"{self.PRODUCT_ITEM} >> nth={index - 1}"
 
-    @allure.step("Hover over product at index: {index}")
+    @step("Hover over product at index: {index}")
     def hover_on_product(self, index: int):
         """Hover over a product to reveal Add to Cart button"""
-        product_locator = self.get_product_by_index(index)
-        self.page.locator(product_locator).hover()
+        self.nth(self.PRODUCT_ITEM, index - 1).hover()
 
-    @allure.step("Add product to cart at index: {index}")
+    @step("Add product to cart at index: {index}")
     def add_product_to_cart(self, index: int):
         """Add a product to cart by index"""
-        product_locator = self.get_product_by_index(index)
         # Hover over product
-        self.page.locator(product_locator).hover()
+        self.nth(self.PRODUCT_ITEM, index - 1).hover()
         # Click add to cart button within the hovered product
-        add_to_cart = f"{product_locator} {self.ADD_TO_CART_BUTTON}"
+        add_to_cart = f"{self.get_product_by_index(index)} >> {self.ADD_TO_CART_BUTTON}"
         self.click(add_to_cart)
         # Wait for modal to appear
         self.wait_for_element(self.CONTINUE_SHOPPING_BUTTON)
         self.take_screenshot(f"product_{index}_added")
 
-    @allure.step("Continue shopping after adding product")
+    @step("Continue shopping after adding product")
     def click_continue_shopping(self):
         """Click Continue Shopping button in modal"""
         self.click(self.CONTINUE_SHOPPING_BUTTON)
 
-    @allure.step("View cart from modal")
+    @step("View cart from modal")
     def click_view_cart_modal(self):
         """Click View Cart link in modal"""
         self.click(self.VIEW_CART_MODAL_LINK)
 
-    @allure.step("Add multiple products to cart: {product_indices}")
+    @step("Add multiple products to cart: {product_indices}")
     def add_multiple_products(self, product_indices: list):
         """Add multiple products to cart"""
         for index in product_indices:
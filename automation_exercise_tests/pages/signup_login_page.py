@@ -2,7 +2,8 @@
 Signup/Login Page Object Model
 """
 from pages.base_page import BasePage
-import allure
+from utils.accounts import get_account_registry
+from utils.steps import step
 
 
 class SignupLoginPage(BasePage):
@@ -46,59 +47,71 @@ class SignupLoginPage(BasePage):
     ACCOUNT_CREATED_MESSAGE = "h2[data-qa='account-created']"
     CONTINUE_BUTTON = "a[data-qa='continue-button']"
 
-    def __init__(self, page):
-        super().__init__(page)
+    READY_LOCATORS = (SIGNUP_NAME_INPUT, LOGIN_EMAIL_INPUT)
 
-    @allure.step("Fill signup form with name: {name} and email: {email}")
+    def __init__(self, page, base_url: str = None):
+        super().__init__(page, base_url)
+
+    @step("Open Signup/Login page")
+    def open(self):
+        """Navigate to Signup/Login page"""
+        self.navigate_to(f"{self.base_url}/login")
+        return self
+
+    @step("Fill signup form with name: {name} and email: {email}")
     def fill_signup_form(self, name: str, email: str):
         """Fill the signup form"""
         self.fill(self.SIGNUP_NAME_INPUT, name)
         self.fill(self.SIGNUP_EMAIL_INPUT, email)
         self.click(self.SIGNUP_BUTTON)
 
-    @allure.step("Fill account information")
+    @step("Fill account information")
     def fill_account_information(self, password: str, day: str, month: str, year: str):
         """Fill account information form"""
-        self.click(self.GENDER_MR_RADIO)
-        self.fill(self.PASSWORD_INPUT, password)
-        self.select_dropdown(self.DAY_DROPDOWN, day)
-        self.select_dropdown(self.MONTH_DROPDOWN, month)
-        self.select_dropdown(self.YEAR_DROPDOWN, year)
-        self.click(self.NEWSLETTER_CHECKBOX)
-        self.click(self.OFFERS_CHECKBOX)
-
-    @allure.step("Fill address information")
+        self.fill_form({
+            self.GENDER_MR_RADIO: True,
+            self.PASSWORD_INPUT: password,
+            self.DAY_DROPDOWN: day,
+            self.MONTH_DROPDOWN: month,
+            self.YEAR_DROPDOWN: year,
+            self.NEWSLETTER_CHECKBOX: True,
+            self.OFFERS_CHECKBOX: True,
+        })
+
+    @step("Fill address information")
     def fill_address_information(self, first_name: str, last_name: str, company: str,
                                  address1: str, address2: str, country: str,
                                  state: str, city: str, zipcode: str, mobile: str):
         """Fill address information form"""
-        self.fill(self.FIRST_NAME_INPUT, first_name)
-        self.fill(self.LAST_NAME_INPUT, last_name)
-        self.fill(self.COMPANY_INPUT, company)
-        self.fill(self.ADDRESS1_INPUT, address1)
-        self.fill(self.ADDRESS2_INPUT, address2)
-        self.select_dropdown(self.COUNTRY_DROPDOWN, country)
-        self.fill(self.STATE_INPUT, state)
-        self.fill(self.CITY_INPUT, city)
-        self.fill(self.ZIPCODE_INPUT, zipcode)
-        self.fill(self.MOBILE_INPUT, mobile)
-
-    @allure.step("Click Create Account button")
+        self.fill_form({
+            self.FIRST_NAME_INPUT: first_name,
+            self.LAST_NAME_INPUT: last_name,
+            self.COMPANY_INPUT: company,
+            self.ADDRESS1_INPUT: address1,
+            self.ADDRESS2_INPUT: address2,
+            self.COUNTRY_DROPDOWN: country,
+            self.STATE_INPUT: state,
+            self.CITY_INPUT: city,
+            self.ZIPCODE_INPUT: zipcode,
+            self.MOBILE_INPUT: mobile,
+        })
+
+    @step("Click Create Account button")
     def click_create_account(self):
         """Click on Create Account button"""
         self.click(self.CREATE_ACCOUNT_BUTTON)
 
-    @allure.step("Verify account created")
+    @step("Verify account created")
     def is_account_created(self) -> bool:
         """Check if account was created successfully"""
         return self.is_visible(self.ACCOUNT_CREATED_MESSAGE)
 
-    @allure.step("Click Continue button")
+    @step("Click Continue button")
     def click_continue(self):
         """Click on Continue button after account creation"""
         self.click(self.CONTINUE_BUTTON)
 
-    @allure.step("Complete registration process")
+    @step("Complete registration process")
     def complete_registration(self, user_data: dict):
         """Complete full registration process"""
         self.fill_signup_form(user_data['name'], user_data['email'])
@@ -124,6 +137,8 @@ class SignupLoginPage(BasePage):
             user_data['mobile']
         )
 
+        # Recorded first, so the account is cleaned up even if the rest of the flow fails
+        get_account_registry().register(self.base_url, user_data)
         self.click_create_account()
         self.wait_for_element(self.ACCOUNT_CREATED_MESSAGE)
         self.take_screenshot("account_created")
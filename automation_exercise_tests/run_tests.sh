@@ -21,9 +21,14 @@ rm -rf reports/allure-results/*
 echo "✅ Previous results cleaned"
 echo ""
 
-# Run tests
+# Run tests (set WORKERS=N to shard across N parallel worker processes)
 echo "Running tests..."
-pytest -v --tb=short
+if [ -n "$WORKERS" ]; then
+    echo "Sharding tests across $WORKERS workers"
+    pytest -v --tb=short -n "$WORKERS" "$@"
+else
+    pytest -v --tb=short "$@"
+fi
 
 TEST_EXIT_CODE=$?
 
@@ -0,0 +1,11 @@
+"""
+Local Stand-in Server Package
+"""
+from server.app import StandInServer
+from server.store import SiteStore, PRODUCTS
+
+__all__ = [
+    'StandInServer',
+    'SiteStore',
+    'PRODUCTS'
+]
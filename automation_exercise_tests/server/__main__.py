@@ -0,0 +1,26 @@
+"""
+Run the local stand-in server: python -m server --port 8000
+"""
+import argparse
+
+from server import StandInServer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for automationexercise.com")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on")
+    args = parser.parse_args()
+
+    server = StandInServer(args.host, args.port)
+    print(f"Serving Automation Exercise stand-in on {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
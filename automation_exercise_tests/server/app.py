@@ -0,0 +1,357 @@
+"""
+Local stand-in for the Automation Exercise site
+
+Serves the pages, forms and endpoints used by the page objects from memory,
+so test runs do not depend on the latency of the public site.
+"""
+import json
+import threading
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from server import templates
+from server.store import PRODUCTS, PRODUCTS_BY_ID, SiteStore
+
+
+SESSION_COOKIE = "sessionid"
+
+
+class StandInRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the stand-in pages"""
+
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def store(self) -> SiteStore:
+        return self.server.store
+
+    def log_message(self, format, *args):
+        """Keep test output clean"""
+
+    # ------------------------------------------------------------------
+    # Request plumbing
+    # ------------------------------------------------------------------
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        self.query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        self.form = self._read_form() if method in ("POST", "DELETE") else {}
+        self.session_id, self.new_session = self._load_session()
+
+        path = url.path.rstrip("/") or "/"
+        handler = self.ROUTES.get((method, path))
+        if handler is None:
+            handler = self._match_prefix_route(method, path)
+        if handler is None:
+            self._send_html(templates.not_found(), status=HTTPStatus.NOT_FOUND)
+            return
+        handler(self)
+
+    def _match_prefix_route(self, method: str, path: str):
+        for (route_method, prefix), handler in self.PREFIX_ROUTES.items():
+            if route_method == method and path.startswith(prefix):
+                self.path_arg = path[len(prefix):]
+                return handler
+        return None
+
+    def _read_form(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8") if length else ""
+        return {key: values[0] for key, values in parse_qs(body, keep_blank_values=True).items()}
+
+    def _load_session(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(SESSION_COOKIE)
+        if morsel and self.store.get_session(morsel.value) is not None:
+            return morsel.value, False
+        return self.store.new_session(), True
+
+    def _session_headers(self) -> list:
+        if not self.new_session:
+            return []
+        return [("Set-Cookie", f"{SESSION_COOKIE}={self.session_id}; Path=/; HttpOnly; SameSite=Lax")]
+
+    def _send(self, body: bytes, content_type: str, status=HTTPStatus.OK, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for name, value in self._session_headers() + (headers or []):
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_html(self, html: str, status=HTTPStatus.OK):
+        self._send(html.encode("utf-8"), "text/html; charset=utf-8", status)
+
+    def _send_json(self, response_code: int, **payload):
+        """Mirror the real API: HTTP 200 with the status in responseCode"""
+        body = json.dumps({'responseCode': response_code, **payload}).encode("utf-8")
+        self._send(body, "application/json")
+
+    def _redirect(self, location: str):
+        self._send(b"", "text/plain", HTTPStatus.FOUND, [("Location", location)])
+
+    def _current_user(self):
+        session = self.store.get_session(self.session_id)
+        if session and session['email']:
+            return self.store.get_user(session['email'])
+        return None
+
+    # ------------------------------------------------------------------
+    # Pages
+    # ------------------------------------------------------------------
+
+    def home(self):
+        self._send_html(templates.home(self._current_user()))
+
+    def login_page(self):
+        self._send_html(templates.login(self._current_user()))
+
+    def login(self):
+        email = self.form.get("email", "")
+        if self.store.check_credentials(email, self.form.get("password", "")):
+            self.store.login(self.session_id, email)
+            self._redirect("/")
+        else:
+            self._send_html(templates.login(login_error="Your email or password is incorrect!"))
+
+    def logout(self):
+        self.store.logout(self.session_id)
+        self._redirect("/login")
+
+    def signup(self):
+        name, email = self.form.get("name", ""), self.form.get("email", "")
+        if self.store.get_user(email) is not None:
+            self._send_html(templates.login(signup_error="Email Address already exist!"))
+        else:
+            self._send_html(templates.signup(name, email))
+
+    def create_account(self):
+        user = {
+            'title': self.form.get("title", ""),
+            'name': self.form.get("name", ""),
+            'email': self.form.get("email", ""),
+            'password': self.form.get("password", ""),
+            'birth_date': self.form.get("days", ""),
+            'birth_month': self.form.get("months", ""),
+            'birth_year': self.form.get("years", ""),
+            'first_name': self.form.get("first_name", ""),
+            'last_name': self.form.get("last_name", ""),
+            'company': self.form.get("company", ""),
+            'address1': self.form.get("address1", ""),
+            'address2': self.form.get("address2", ""),
+            'country': self.form.get("country", ""),
+            'state': self.form.get("state", ""),
+            'city': self.form.get("city", ""),
+            'zipcode': self.form.get("zipcode", ""),
+            'mobile_number': self.form.get("mobile_number", ""),
+        }
+        if not self.store.create_user(user):
+            self._send_html(templates.login(signup_error="Email Address already exist!"))
+            return
+        self.store.login(self.session_id, user['email'])
+        self._redirect("/account_created")
+
+    def account_created(self):
+        self._send_html(templates.account_created(self._current_user()))
+
+    def delete_account(self):
+        user = self._current_user()
+        if user is None:
+            self._redirect("/login")
+            return
+        self.store.delete_user(user['email'])
+        self._send_html(templates.account_deleted())
+
+    def products(self):
+        self._send_html(templates.products(PRODUCTS, self._current_user()))
+
+    def add_to_cart(self):
+        try:
+            product_id = int(self.path_arg)
+        except ValueError:
+            product_id = None
+        if product_id not in PRODUCTS_BY_ID:
+            self._send(b"Product not found", "text/plain", HTTPStatus.NOT_FOUND)
+            return
+        self.store.add_to_cart(self.session_id, product_id)
+        self._send(b"Added", "text/plain")
+
+    def delete_from_cart(self):
+        if self.path_arg.isdigit():
+            self.store.remove_from_cart(self.session_id, int(self.path_arg))
+        self._redirect("/view_cart")
+
+    def view_cart(self):
+        items = self.store.cart_items(self.session_id)
+        self._send_html(templates.cart(items, self._current_user()))
+
+    def checkout(self):
+        user = self._current_user()
+        if user is None:
+            self._redirect("/login")
+            return
+        items = self.store.cart_items(self.session_id)
+        self._send_html(templates.checkout(items, user))
+
+    def payment_page(self):
+        user = self._current_user()
+        if user is None:
+            self._redirect("/login")
+            return
+        self._send_html(templates.payment(user))
+
+    def pay(self):
+        if self._current_user() is None:
+            self._redirect("/login")
+            return
+        order_id = self.store.place_order(self.session_id, dict(self.form))
+        self._redirect(f"/payment_done/{order_id}")
+
+    def payment_done(self):
+        order_id = int(self.path_arg) if self.path_arg.isdigit() else 0
+        self._send_html(templates.payment_done(order_id, self._current_user()))
+
+    def download_invoice(self):
+        session = self.store.get_session(self.session_id)
+        order = self.store.orders.get(session.get('last_order'))
+        if order is None:
+            self._send(b"No order found", "text/plain", HTTPStatus.NOT_FOUND)
+            return
+        total = sum(item['total'] for item in order['items'])
+        invoice = f"Hi {order['payment'].get('name_on_card', '')}, Your total purchase amount is {total}."
+        self._send(invoice.encode("utf-8"), "text/plain",
+                   headers=[("Content-Disposition", "attachment; filename=invoice.txt")])
+
+    # ------------------------------------------------------------------
+    # API
+    # ------------------------------------------------------------------
+
+    API_ACCOUNT_FIELDS = {
+        'name': 'name', 'email': 'email', 'password': 'password', 'title': 'title',
+        'birth_date': 'birth_date', 'birth_month': 'birth_month', 'birth_year': 'birth_year',
+        'firstname': 'first_name', 'lastname': 'last_name', 'company': 'company',
+        'address1': 'address1', 'address2': 'address2', 'country': 'country',
+        'zipcode': 'zipcode', 'state': 'state', 'city': 'city',
+        'mobile_number': 'mobile_number',
+    }
+
+    API_REQUIRED_FIELDS = ('name', 'email', 'password', 'firstname', 'lastname',
+                           'address1', 'country', 'zipcode', 'state', 'city', 'mobile_number')
+
+    def api_create_account(self):
+        for field in self.API_REQUIRED_FIELDS:
+            if not self.form.get(field):
+                self._send_json(400, message=f"Bad request, {field} parameter is missing in POST request.")
+                return
+        user = {key: self.form.get(field, "") for field, key in self.API_ACCOUNT_FIELDS.items()}
+        if not self.store.create_user(user):
+            self._send_json(400, message="Email already exists!")
+            return
+        self._send_json(201, message="User created!")
+
+    def api_verify_login(self):
+        email, password = self.form.get("email"), self.form.get("password")
+        if not email or not password:
+            self._send_json(400, message="Bad request, email or password parameter is missing in POST request.")
+        elif self.store.check_credentials(email, password):
+            self._send_json(200, message="User exists!")
+        else:
+            self._send_json(404, message="User not found!")
+
+    def api_delete_account(self):
+        email, password = self.form.get("email"), self.form.get("password")
+        if not email or not password:
+            self._send_json(400, message="Bad request, email or password parameter is missing in DELETE request.")
+        elif self.store.check_credentials(email, password):
+            self.store.delete_user(email)
+            self._send_json(200, message="Account deleted!")
+        else:
+            self._send_json(404, message="Account not found!")
+
+    def api_get_user_detail(self):
+        user = self.store.get_user(self.query.get("email", ""))
+        if user is None:
+            self._send_json(404, message="Account not found with this email, try another email!")
+            return
+        detail = {key: value for key, value in user.items() if key != 'password'}
+        self._send_json(200, user=detail)
+
+    ROUTES = {
+        ("GET", "/"): home,
+        ("GET", "/login"): login_page,
+        ("POST", "/login"): login,
+        ("GET", "/logout"): logout,
+        ("POST", "/signup"): signup,
+        ("POST", "/create_account"): create_account,
+        ("GET", "/account_created"): account_created,
+        ("GET", "/delete_account"): delete_account,
+        ("GET", "/products"): products,
+        ("GET", "/view_cart"): view_cart,
+        ("GET", "/checkout"): checkout,
+        ("GET", "/payment"): payment_page,
+        ("POST", "/payment"): pay,
+        ("GET", "/download_invoice"): download_invoice,
+        ("POST", "/api/createAccount"): api_create_account,
+        ("POST", "/api/verifyLogin"): api_verify_login,
+        ("DELETE", "/api/deleteAccount"): api_delete_account,
+        ("GET", "/api/getUserDetailByEmail"): api_get_user_detail,
+    }
+
+    PREFIX_ROUTES = {
+        ("GET", "/add_to_cart/"): add_to_cart,
+        ("GET", "/delete_cart/"): delete_from_cart,
+        ("GET", "/payment_done/"): payment_done,
+    }
+
+
+class StandInServer:
+    """Runs the stand-in site on a background thread"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = ThreadingHTTPServer((host, port), StandInRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.store = SiteStore()
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def store(self) -> SiteStore:
+        """Server-side state, useful for assertions and cleanup"""
+        return self.httpd.store
+
+    def start(self):
+        """Start serving in a daemon thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and release the socket"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,117 @@
+"""
+In-memory state for the local stand-in server (users, sessions, carts, orders)
+"""
+import itertools
+import secrets
+import threading
+
+
+PRODUCTS = [
+    {'id': 1, 'name': 'Blue Top', 'price': 500, 'category': 'Women > Tops'},
+    {'id': 2, 'name': 'Men Tshirt', 'price': 400, 'category': 'Men > Tshirts'},
+    {'id': 3, 'name': 'Sleeveless Dress', 'price': 1000, 'category': 'Women > Dress'},
+    {'id': 4, 'name': 'Stylish Dress', 'price': 1500, 'category': 'Women > Dress'},
+    {'id': 5, 'name': 'Winter Top', 'price': 600, 'category': 'Women > Tops'},
+    {'id': 6, 'name': 'Summer White Top', 'price': 400, 'category': 'Women > Tops'},
+    {'id': 7, 'name': 'Madame Top For Women', 'price': 1000, 'category': 'Women > Tops'},
+    {'id': 8, 'name': 'Fancy Green Top', 'price': 700, 'category': 'Women > Tops'},
+]
+
+PRODUCTS_BY_ID = {product['id']: product for product in PRODUCTS}
+
+
+class SiteStore:
+    """Thread-safe store shared by all request handler threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._order_ids = itertools.count(1)
+        self.users = {}
+        self.sessions = {}
+        self.orders = {}
+
+    def new_session(self) -> str:
+        """Create an anonymous session and return its id"""
+        session_id = secrets.token_hex(16)
+        with self._lock:
+            self.sessions[session_id] = {'email': None, 'cart': {}}
+        return session_id
+
+    def get_session(self, session_id: str):
+        """Return session data or None for unknown ids"""
+        with self._lock:
+            return self.sessions.get(session_id)
+
+    def create_user(self, user: dict) -> bool:
+        """Register a user; returns False if the email is already taken"""
+        with self._lock:
+            if user['email'] in self.users:
+                return False
+            self.users[user['email']] = user
+            return True
+
+    def get_user(self, email: str):
+        """Return user data by email"""
+        with self._lock:
+            return self.users.get(email)
+
+    def delete_user(self, email: str) -> bool:
+        """Delete a user and log out all of its sessions"""
+        with self._lock:
+            if self.users.pop(email, None) is None:
+                return False
+            for session in self.sessions.values():
+                if session['email'] == email:
+                    session['email'] = None
+            return True
+
+    def check_credentials(self, email: str, password: str) -> bool:
+        """Check an email/password pair"""
+        with self._lock:
+            user = self.users.get(email)
+            return user is not None and user['password'] == password
+
+    def login(self, session_id: str, email: str):
+        """Attach a user to a session"""
+        with self._lock:
+            self.sessions[session_id]['email'] = email
+
+    def logout(self, session_id: str):
+        """Detach the user from a session"""
+        with self._lock:
+            self.sessions[session_id]['email'] = None
+
+    def add_to_cart(self, session_id: str, product_id: int):
+        """Add one unit of a product to the session cart"""
+        with self._lock:
+            cart = self.sessions[session_id]['cart']
+            cart[product_id] = cart.get(product_id, 0) + 1
+
+    def remove_from_cart(self, session_id: str, product_id: int):
+        """Remove a product from the session cart"""
+        with self._lock:
+            self.sessions[session_id]['cart'].pop(product_id, None)
+
+    def cart_items(self, session_id: str) -> list:
+        """Return cart rows as product dicts with quantity and total"""
+        with self._lock:
+            cart = dict(self.sessions[session_id]['cart'])
+        items = []
+        for product_id, quantity in cart.items():
+            product = PRODUCTS_BY_ID[product_id]
+            items.append({**product, 'quantity': quantity, 'total': product['price'] * quantity})
+        return items
+
+    def place_order(self, session_id: str, payment: dict) -> int:
+        """Turn the session cart into an order and empty the cart"""
+        items = self.cart_items(session_id)
+        with self._lock:
+            order_id = next(self._order_ids)
+            self.orders[order_id] = {
+                'email': self.sessions[session_id]['email'],
+                'items': items,
+                'payment': payment,
+            }
+            self.sessions[session_id]['cart'] = {}
+            self.sessions[session_id]['last_order'] = order_id
+        return order_id
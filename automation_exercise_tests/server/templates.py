@@ -0,0 +1,327 @@
+"""
+HTML templates for the local stand-in server
+
+The markup mirrors the structure, ids, classes and data-qa attributes of
+automationexercise.com that the page objects rely on. No external assets
+are referenced, so page loads are fast and reproducible.
+"""
+from html import escape
+
+
+STYLE = """
+body { font-family: sans-serif; margin: 0; }
+header, section { padding: 10px 20px; }
+.nav a { margin-right: 15px; }
+.features_items { display: flex; flex-wrap: wrap; }
+.col-sm-4 { width: 30%; margin: 5px; border: 1px solid #ddd; }
+.single-products { position: relative; height: 120px; }
+.product-overlay { display: none; position: absolute; inset: 0; background: #fe980f; }
+.single-products:hover .product-overlay { display: block; }
+.modal { display: none; position: fixed; top: 30%; left: 35%; padding: 20px;
+         background: #fff; border: 1px solid #333; }
+.modal.show { display: block; }
+"""
+
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+COUNTRIES = ["India", "United States", "Canada", "Australia", "Israel",
+             "New Zealand", "Singapore"]
+
+
+def layout(title: str, body: str, user: dict = None) -> str:
+    """Wrap page content with the shared header navigation"""
+    if user:
+        account_links = (
+            "<a href='/logout'>Logout</a>"
+            "<a href='/delete_account'>Delete Account</a>"
+            f"<a>Logged in as <b>{escape(user['name'])}</b></a>"
+        )
+    else:
+        account_links = "<a href='/login'>Signup / Login</a>"
+
+    page_title = "Automation Exercise" if not title else f"Automation Exercise - {title}"
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{page_title}</title>
+<style>{STYLE}</style>
+</head>
+<body>
+<header id="header">
+  <div class="nav">
+    <a href='/'>Home</a>
+    <a href='/products'>Products</a>
+    <a href='/view_cart'>Cart</a>
+    {account_links}
+  </div>
+</header>
+{body}
+</body>
+</html>"""
+
+
+def home(user: dict = None) -> str:
+    """Home page"""
+    body = """<section id="slider"><h2 class="title text-center">Features Items</h2></section>"""
+    return layout("", body, user)
+
+
+def login(user: dict = None, signup_error: str = "", login_error: str = "") -> str:
+    """Signup / Login page"""
+    body = f"""<section id="form">
+  <div class="login-form">
+    <h2>Login to your account</h2>
+    <form action="/login" method="POST">
+      <input type="email" name="email" placeholder="Email Address" data-qa="login-email" required>
+      <input type="password" name="password" placeholder="Password" data-qa="login-password" required>
+      <p style="color: red;">{escape(login_error)}</p>
+      <button type="submit" data-qa="login-button">Login</button>
+    </form>
+  </div>
+  <div class="signup-form">
+    <h2>New User Signup!</h2>
+    <form action="/signup" method="POST">
+      <input type="text" name="name" placeholder="Name" data-qa="signup-name" required>
+      <input type="email" name="email" placeholder="Email Address" data-qa="signup-email" required>
+      <p style="color: red;">{escape(signup_error)}</p>
+      <button type="submit" data-qa="signup-button">Signup</button>
+    </form>
+  </div>
+</section>"""
+    return layout("Signup / Login", body, user)
+
+
+def _options(values, labels=None) -> str:
+    labels = labels or values
+    return "".join(f"<option value='{escape(str(value))}'>{escape(str(label))}</option>"
+                   for value, label in zip(values, labels))
+
+
+def signup(name: str, email: str) -> str:
+    """Account information form shown after the signup step"""
+    days = _options(range(1, 32))
+    months = _options(range(1, 13), MONTHS)
+    years = _options(range(2021, 1899, -1))
+    countries = _options(COUNTRIES)
+    body = f"""<section id="form">
+  <div class="login-form">
+    <h2 class="title text-center"><b>Enter Account Information</b></h2>
+    <form action="/create_account" method="POST">
+      <input type="radio" name="title" id="id_gender1" value="Mr">
+      <input type="radio" name="title" id="id_gender2" value="Mrs">
+      <input type="text" id="name" name="name" value="{escape(name)}" data-qa="name" required>
+      <input type="email" id="email" name="email" value="{escape(email)}" data-qa="email" readonly>
+      <input type="password" id="password" name="password" data-qa="password" required>
+      <select id="days" name="days" data-qa="days"><option value="">Day</option>{days}</select>
+      <select id="months" name="months" data-qa="months"><option value="">Month</option>{months}</select>
+      <select id="years" name="years" data-qa="years"><option value="">Year</option>{years}</select>
+      <input type="checkbox" name="newsletter" id="newsletter" value="1">
+      <input type="checkbox" name="optin" id="optin" value="1">
+      <h2 class="title text-center"><b>Address Information</b></h2>
+      <input type="text" id="first_name" name="first_name" data-qa="first_name" required>
+      <input type="text" id="last_name" name="last_name" data-qa="last_name" required>
+      <input type="text" id="company" name="company" data-qa="company">
+      <input type="text" id="address1" name="address1" data-qa="address" required>
+      <input type="text" id="address2" name="address2" data-qa="address2">
+      <select id="country" name="country" data-qa="country">{countries}</select>
+      <input type="text" id="state" name="state" data-qa="state" required>
+      <input type="text" id="city" name="city" data-qa="city" required>
+      <input type="text" id="zipcode" name="zipcode" data-qa="zipcode" required>
+      <input type="text" id="mobile_number" name="mobile_number" data-qa="mobile_number" required>
+      <button type="submit" data-qa="create-account">Create Account</button>
+    </form>
+  </div>
+</section>"""
+    return layout("Signup", body)
+
+
+def account_created(user: dict) -> str:
+    """Account created confirmation"""
+    body = """<section id="form">
+  <h2 class="title text-center" data-qa="account-created"><b>Account Created!</b></h2>
+  <p>Congratulations! Your new account has been successfully created!</p>
+  <a href="/" class="btn btn-primary" data-qa="continue-button">Continue</a>
+</section>"""
+    return layout("Account Created", body, user)
+
+
+def account_deleted() -> str:
+    """Account deleted confirmation"""
+    body = """<section id="form">
+  <h2 class="title text-center" data-qa="account-deleted"><b>Account Deleted!</b></h2>
+  <a href="/" class="btn btn-primary" data-qa="continue-button">Continue</a>
+</section>"""
+    return layout("Account Deleted", body)
+
+
+def products(products_list: list, user: dict = None) -> str:
+    """All products page with the add-to-cart modal"""
+    cards = "".join(f"""
+    <div class="col-sm-4">
+      <div class="product-image-wrapper">
+        <div class="single-products">
+          <div class="productinfo text-center">
+            <h2>Rs. {product['price']}</h2>
+            <p>{escape(product['name'])}</p>
+          </div>
+          <div class="product-overlay">
+            <div class="overlay-content">
+              <h2>Rs. {product['price']}</h2>
+              <p>{escape(product['name'])}</p>
+              <a href="#" data-product-id="{product['id']}" class="btn btn-default add-to-cart">Add to cart</a>
+            </div>
+          </div>
+        </div>
+      </div>
+    </div>""" for product in products_list)
+
+    body = f"""<section>
+  <input type="text" id="search_product" name="search" placeholder="Search Product">
+  <button type="button" id="submit_search">Search</button>
+  <div class="features_items">
+    <h2 class="title text-center">All Products</h2>
+    {cards}
+  </div>
+  <div class="modal" id="cartModal">
+    <h4 class="modal-title">Added!</h4>
+    <p class="text-center">Your product has been added to cart.</p>
+    <p class="text-center"><a href="/view_cart"><u>View Cart</u></a></p>
+    <button class="btn btn-success close-modal btn-block">Continue Shopping</button>
+  </div>
+</section>
+<script>
+const modal = document.getElementById('cartModal');
+document.querySelectorAll('.add-to-cart').forEach(function (button) {{
+  button.addEventListener('click', function (event) {{
+    event.preventDefault();
+    fetch('/add_to_cart/' + button.dataset.productId).then(function () {{
+      modal.classList.add('show');
+    }});
+  }});
+}});
+document.querySelector('.close-modal').addEventListener('click', function () {{
+  modal.classList.remove('show');
+}});
+</script>"""
+    return layout("All Products", body, user)
+
+
+def _cart_rows(items: list, with_delete: bool) -> str:
+    rows = []
+    for item in items:
+        delete_cell = (f"<td class='cart_delete'><a class='cart_quantity_delete' "
+                       f"href='/delete_cart/{item['id']}'>x</a></td>") if with_delete else ""
+        rows.append(f"""
+      <tr id="product-{item['id']}">
+        <td class="cart_product"><a href="/product_details/{item['id']}">#{item['id']}</a></td>
+        <td class="cart_description">
+          <h4><a href="/product_details/{item['id']}">{escape(item['name'])}</a></h4>
+          <p>{escape(item['category'])}</p>
+        </td>
+        <td class="cart_price"><p>Rs. {item['price']}</p></td>
+        <td class="cart_quantity"><button class="disabled">{item['quantity']}</button></td>
+        <td class="cart_total"><p class="cart_total_price">Rs. {item['total']}</p></td>
+        {delete_cell}
+      </tr>""")
+    return "".join(rows)
+
+
+CART_HEADER = """
+      <tr class="cart_menu">
+        <td class="image">Item</td>
+        <td class="description">Description</td>
+        <td class="price">Price</td>
+        <td class="quantity">Quantity</td>
+        <td class="total">Total</td>
+        <td></td>
+      </tr>"""
+
+
+def cart(items: list, user: dict = None) -> str:
+    """Shopping cart page"""
+    if items:
+        content = f"""<div class="table-responsive cart_info" id="cart_info">
+    <table class="table table-condensed" id="cart_info_table">
+      <tbody>{CART_HEADER}{_cart_rows(items, with_delete=True)}
+      </tbody>
+    </table>
+  </div>
+  <a href="/checkout" class="btn btn-default check_out">Proceed To Checkout</a>"""
+    else:
+        content = """<span id="empty_cart"><p class="text-center"><b>Cart is empty!</b>
+    Click <a href="/products"><u>here</u></a> to buy products.</p></span>"""
+    body = f"""<section id="cart_items">{content}</section>"""
+    return layout("Checkout", body, user)
+
+
+def _address(css_id: str, heading: str, user: dict) -> str:
+    return f"""<ul class="address item box {css_id}" id="{css_id}">
+      <li class="address_title"><h3 class="page-subheading">{heading}</h3></li>
+      <li class="address_firstname address_lastname">{escape(user['first_name'])} {escape(user['last_name'])}</li>
+      <li class="address_address1 address_address2">{escape(user['company'])}</li>
+      <li class="address_address1 address_address2">{escape(user['address1'])}</li>
+      <li class="address_address1 address_address2">{escape(user['address2'])}</li>
+      <li class="address_city address_state_name address_postcode">{escape(user['city'])} {escape(user['state'])} {escape(user['zipcode'])}</li>
+      <li class="address_country_name">{escape(user['country'])}</li>
+      <li class="address_phone">{escape(user['mobile_number'])}</li>
+    </ul>"""
+
+
+def checkout(items: list, user: dict) -> str:
+    """Checkout page with addresses, order review and comment box"""
+    total = sum(item['total'] for item in items)
+    body = f"""<section id="cart_items">
+  <div class="step-one"><h2 class="heading">Address Details</h2></div>
+  {_address("address_delivery", "Your delivery address", user)}
+  {_address("address_invoice", "Your billing address", user)}
+  <div class="step-one"><h2 class="heading">Review Your Order</h2></div>
+  <div class="table-responsive cart_info" id="cart_info">
+    <table class="table table-condensed">
+      <tbody>{CART_HEADER}{_cart_rows(items, with_delete=False)}
+      <tr><td colspan="4"><h4><b>Total Amount</b></h4></td>
+          <td><p class="cart_total_price">Rs. {total}</p></td></tr>
+      </tbody>
+    </table>
+  </div>
+  <div id="ordermsg">
+    <label>If you would like to add a comment about your order, please write it in the field below.</label>
+    <textarea class="form-control" name="message" rows="5"></textarea>
+  </div>
+  <a href="/payment" class="btn btn-default check_out">Place Order</a>
+</section>"""
+    return layout("Checkout", body, user)
+
+
+def payment(user: dict) -> str:
+    """Payment form"""
+    body = """<section id="cart_items">
+  <h2 class="heading">Payment</h2>
+  <form id="payment-form" action="/payment" method="POST">
+    <input type="text" name="name_on_card" class="form-control" data-qa="name-on-card" required>
+    <input type="text" name="card_number" class="form-control card-number" data-qa="card-number" required>
+    <input type="text" name="cvc" class="form-control card-cvc" placeholder="ex. 311" data-qa="cvc" required>
+    <input type="text" name="expiry_month" class="form-control card-expiry-month" placeholder="MM" data-qa="expiry-month" required>
+    <input type="text" name="expiry_year" class="form-control card-expiry-year" placeholder="YYYY" data-qa="expiry-year" required>
+    <button id="submit" type="submit" data-qa="pay-button" class="form-control btn btn-primary submit-button">Pay and Confirm Order</button>
+  </form>
+</section>"""
+    return layout("Payment", body, user)
+
+
+def payment_done(order_id: int, user: dict) -> str:
+    """Order confirmation page"""
+    body = f"""<section id="form">
+  <h2 class="title text-center" data-qa="order-placed"><b>Order Placed!</b></h2>
+  <p style="font-size: 20px;">Congratulations! Your order has been confirmed!</p>
+  <div class="alert-success alert">Your order #{order_id} has been placed successfully!</div>
+  <a href="/download_invoice" class="btn btn-default check_out">Download Invoice</a>
+  <a href="/" class="btn btn-primary" data-qa="continue-button">Continue</a>
+</section>"""
+    return layout("Order Placed", body, user)
+
+
+def not_found() -> str:
+    """404 page"""
+    return layout("Not Found", "<section><h2>Page not found</h2></section>")
@@ -0,0 +1,41 @@
+"""
+Account Cleanup Tests
+Test covers: Register accounts -> Concurrent delete over the API -> Kept and failed entries stay registered
+"""
+import pytest
+import allure
+from server import StandInServer
+from utils import AccountRegistry, AutomationExerciseApi, generate_user_data
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Run a private stand-in server for this module"""
+    with StandInServer() as stand_in:
+        yield stand_in
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Account Cleanup")
+class TestAccountCleanup:
+    """Test the account registry and its cleanup against the stand-in server"""
+
+    @allure.title("Registered accounts are deleted; kept and undeletable ones stay registered")
+    def test_cleanup(self, server, tmp_path):
+        registry = AccountRegistry(str(tmp_path), run_id="run1", worker_id="gw0", enabled=True)
+        api = AutomationExerciseApi(server.url)
+        users = [generate_user_data() for _ in range(4)]
+        for user in users:
+            api.create_account(user)
+        for user in users[:3]:
+            registry.register(server.url, user)
+        registry.register(server.url, users[3], keep_seconds=600)
+        registry.register("http://127.0.0.1:9", generate_user_data())  # nothing listens there
+
+        result = registry.cleanup(run_id="run1", concurrency=4, retries=0)
+        assert (result['deleted'], result['failed'], result['kept']) == (3, 1, 1)
+        assert not any(api.verify_login(user['email'], user['password']) for user in users[:3])
+        assert api.verify_login(users[3]['email'], users[3]['password'])
+
+        # What is left is picked up again by the next sweep
+        assert registry.cleanup(dry_run=True)['due'] == 1
@@ -0,0 +1,77 @@
+"""
+API Provisioning Tests
+Test covers: Create account over HTTP -> Inject session -> Checkout without UI registration
+"""
+import pytest
+import allure
+from pages import HomePage, ProductsPage, CartPage, CheckoutPage
+from server import StandInServer
+from utils import ApiError, AutomationExerciseApi, generate_user_data
+
+
+@pytest.fixture(scope="module")
+def api_server():
+    """Run a private stand-in server for the HTTP-only tests"""
+    with StandInServer() as stand_in:
+        yield stand_in
+
+
+@allure.epic("Infrastructure")
+@allure.feature("API Provisioning")
+class TestAccountApi:
+    """Test the account API client against the stand-in server"""
+
+    @allure.title("Create account and log in over HTTP")
+    def test_create_account_and_login(self, api_server):
+        user = generate_user_data()
+        api = AutomationExerciseApi(api_server.url)
+
+        api.create_account(user)
+        assert api.verify_login(user['email'], user['password'])
+
+        cookies = api.login(user['email'], user['password'])
+        session = api_server.store.get_session(cookies[0]['value'])
+        assert session['email'] == user['email']
+
+    @allure.title("Duplicate account is rejected")
+    def test_duplicate_account(self, api_server):
+        user = generate_user_data()
+        api = AutomationExerciseApi(api_server.url)
+        api.create_account(user)
+
+        with pytest.raises(ApiError):
+            api.create_account(user)
+
+
+@allure.epic("E-Commerce")
+@allure.feature("Checkout")
+@allure.story("Checkout as Existing User")
+@pytest.mark.checkout
+class TestCheckoutForExistingUser:
+    """Test checkout with an account provisioned over the API"""
+
+    @allure.title("Checkout With Provisioned User")
+    @allure.severity(allure.severity_level.NORMAL)
+    def test_checkout_with_provisioned_user(self, logged_in_user: dict,
+                                            home_page: HomePage,
+                                            products_page: ProductsPage,
+                                            cart_page: CartPage,
+                                            checkout_page: CheckoutPage,
+                                            payment_data: dict):
+        """Test checkout skipping the registration UI"""
+
+        with allure.step("Open home page as provisioned user"):
+            home_page.open()
+            assert home_page.is_user_logged_in(logged_in_user['name']), \
+                "Provisioned session was not picked up by the browser"
+
+        with allure.step("Add product and checkout"):
+            home_page.click_products()
+            products_page.add_product_to_cart(1)
+            products_page.click_view_cart_modal()
+            cart_page.click_proceed_to_checkout()
+            checkout_page.complete_checkout(payment_data)
+
+        with allure.step("Verify order"):
+            assert checkout_page.is_order_placed(), \
+                "Order was not placed successfully"
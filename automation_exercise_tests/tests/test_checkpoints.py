@@ -0,0 +1,107 @@
+"""
+Flow Checkpoint Tests
+Test covers: Save -> Load fresh checkpoints -> Drop expired ones -> Clear -> Skip resumed phases -> Reject stale checkpoints
+"""
+import time
+
+import pytest
+import allure
+from playwright.sync_api import Page
+from server import StandInServer
+from utils import CheckpointStore, FlowCheckpoints, CHECKPOINTS_RESUME, CHECKPOINTS_SAVE
+
+
+NODEID = "tests/test_e2e_purchase_flow.py::TestCompletePurchaseFlow::test_complete_purchase_flow"
+STEPS = ["Step 1: Open home page", "Step 2: Add product", "Step 3: View cart"]
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Flow Checkpoints")
+class TestCheckpointStore:
+    """Test the on-disk checkpoint store"""
+
+    @allure.title("Only checkpoints younger than max age are loaded")
+    def test_freshness(self, tmp_path):
+        store = CheckpointStore(str(tmp_path), max_age_seconds=60)
+        store.save(NODEID, [
+            {'phase': "Step 1: Open home page", 'saved_at': time.time() - 120},
+            {'phase': "Step 2: Navigate to Signup/Login page", 'saved_at': time.time()},
+        ])
+
+        assert [checkpoint['phase'] for checkpoint in store.load(NODEID)] == ["Step 2: Navigate to Signup/Login page"]
+        assert store.load("tests/test_other.py::test_other") == []
+
+        store.clear(NODEID)
+        assert store.load(NODEID) == []
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Run a private stand-in server for this module"""
+    with StandInServer() as stand_in:
+        yield stand_in
+
+
+def add_to_cart(page: Page, base_url: str, product_id: int):
+    """Add a product to the session's server-side cart, as the products page does"""
+    page.context.request.get(f"{base_url}/add_to_cart/{product_id}")
+
+
+def run_phases(checkpoints: FlowCheckpoints, titles: list) -> list:
+    """Enter each phase and return the titles whose body actually ran"""
+    executed = []
+    for title in titles:
+        with checkpoints.phase(title) as run:
+            if run:
+                executed.append(title)
+    return executed
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Flow Checkpoints")
+class TestFlowCheckpoints:
+    """Test saving and resuming a flow against the stand-in server"""
+
+    @allure.title("Resuming skips the phases before the checkpoint and restores their data")
+    def test_resume_skips_phases(self, page: Page, server, tmp_path):
+        store = CheckpointStore(str(tmp_path))
+        flow = FlowCheckpoints(store, NODEID, page, server.url, mode=CHECKPOINTS_SAVE)
+        with flow.phase("Step 1: Open home page"):
+            page.goto(server.url)
+            flow.data['user'] = {'name': "Test User"}
+        with flow.phase("Step 2: Add product"):
+            add_to_cart(page, server.url, 1)
+            flow.data['products'] = [1]
+
+        saved = store.load(NODEID)
+        assert [checkpoint['cart'] for checkpoint in saved] == [[], [1]]
+        assert 'products' not in saved[0]['data'], "Later data leaked into an earlier checkpoint"
+
+        page.context.clear_cookies()
+        resumed = FlowCheckpoints(store, NODEID, page, server.url, mode=CHECKPOINTS_RESUME)
+        assert resumed.resume() == "Step 2: Add product"
+        assert resumed.data == {'user': {'name': "Test User"}, 'products': [1]}
+        assert run_phases(resumed, STEPS) == ["Step 3: View cart"]
+
+        resumed.finish(passed=False)
+        assert len(store.load(NODEID)) == 3
+        resumed.finish(passed=True)
+        assert store.load(NODEID) == []
+
+    @allure.title("Checkpoints whose cart is gone or that fail validation are not resumed")
+    def test_resume_rejects_invalid(self, page: Page, server, tmp_path):
+        store = CheckpointStore(str(tmp_path))
+        flow = FlowCheckpoints(store, NODEID, page, server.url, mode=CHECKPOINTS_SAVE)
+        with flow.phase("Step 1: Open home page"):
+            page.goto(server.url)
+        with flow.phase("Step 2: Add product"):
+            add_to_cart(page, server.url, 1)
+
+        # The server dropped the cart: only the checkpoint taken before adding still matches
+        page.context.request.get(f"{server.url}/delete_cart/1")
+        assert FlowCheckpoints(store, NODEID, page, server.url, mode=CHECKPOINTS_RESUME).resume() == \
+            "Step 1: Open home page"
+
+        rejected = FlowCheckpoints(store, NODEID, page, server.url, mode=CHECKPOINTS_RESUME)
+        assert rejected.resume(validate=lambda data: False) is None
+        assert run_phases(rejected, STEPS) == STEPS
@@ -0,0 +1,36 @@
+"""
+Data Pool Tests
+Test covers: Seeded generation -> Memory-mapped reads -> Unique users -> Regeneration of stale files
+"""
+import allure
+from utils import DataPool
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Test Data Pool")
+class TestDataPool:
+    """Test the pre-generated, memory-mapped data pool"""
+
+    @allure.title("The same seed yields the same records; users stay unique")
+    def test_seeded_and_unique(self, tmp_path):
+        first = DataPool(str(tmp_path), seed=42, size=5)
+        users = [first.next_user() for _ in range(8)]
+        assert len({user['email'] for user in users}) == 8
+        # Records cycle once the pool is exhausted
+        assert users[5]['first_name'] == users[0]['first_name']
+
+        second = DataPool(str(tmp_path), seed=42, size=5)
+        assert second.record(3) == first.record(3)
+
+    @allure.title("A pool file with a stale layout is regenerated")
+    def test_regenerates_stale_file(self, tmp_path):
+        pool = DataPool(str(tmp_path), seed=1, size=20)
+        expected = pool.record(7)
+        pool.close()
+        with open(pool.path, "r+b") as pool_file:
+            pool_file.write(b'{"version": 0}')
+
+        fresh = DataPool(str(tmp_path), seed=1, size=20)
+        assert not fresh._is_current()
+        assert fresh.record(7) == expected
+        assert fresh._is_current()
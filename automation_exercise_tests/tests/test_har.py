@@ -0,0 +1,50 @@
+"""
+HAR Archive Tests
+Test covers: Per-test HAR paths -> Manifest round trip -> Pruning of unreferenced bodies -> Deterministic test data
+"""
+import json
+import os
+
+import allure
+from utils import DataPool, HarArchive, HAR_RECORD, next_unique_id, seed_test_data
+
+
+@allure.epic("Infrastructure")
+@allure.feature("HAR Record and Replay")
+class TestHarArchive:
+    """Test the on-disk layout of recorded HARs"""
+
+    @allure.title("Bodies no HAR references any more are pruned")
+    def test_prune(self, tmp_path):
+        archive = HarArchive(str(tmp_path), mode=HAR_RECORD)
+        archive.write_manifest(run_id="abc123", data_seed=1, base_url="http://127.0.0.1:8000")
+        har = {'log': {'entries': [{'response': {'content': {'_file': "shared.html"}}}]}}
+        with open(archive.path_for("tests/test_x.py::TestX::test_y"), "w", encoding="utf-8") as har_file:
+            json.dump(har, har_file)
+        for body in ("shared.html", "stale.js"):
+            (tmp_path / body).write_text("body")
+
+        assert archive.prune() == 1
+        assert sorted(os.listdir(tmp_path)) == ["manifest.json", "shared.html", "tests_test_x.py_TestX_test_y.har"]
+        assert archive.read_manifest()['run_id'] == "abc123"
+
+    @allure.title("Test data depends only on the recording run and the test")
+    def test_seeded_test_data(self, tmp_path):
+        pool = DataPool(str(tmp_path), size=50)
+        before = next_unique_id()
+        try:
+            with seed_test_data("abc123", "tests/test_x.py::test_y", pool=pool):
+                first = pool.next_user()
+            with seed_test_data("abc123", "tests/test_x.py::test_y", pool=pool):
+                assert pool.next_user() == first
+            with seed_test_data("abc123", "tests/test_x.py::test_z", pool=pool):
+                assert pool.next_user()['email'] != first['email']
+
+            # Outside the block the run's own allocator continues where it stopped...
+            prefix, _, number = before.rpartition("n")
+            assert next_unique_id() == f"{prefix}n{int(number) + 1}"
+            # ...and so does the pool position
+            assert pool.next_record() == pool.record(0)
+            assert pool.next_user()['email'] != first['email']
+        finally:
+            pool.close()
@@ -0,0 +1,76 @@
+"""
+Timing Instrumentation Tests
+Test covers: Nearest-rank percentiles -> Aggregation per action and locator -> Regression threshold -> Compare CLI exit code
+"""
+import allure
+from utils import Instrumentation, find_regressions
+from utils.instrumentation import main, percentile
+
+
+def record(action: str, seconds: float, locator: str = None, wait_seconds: float = 0.0,
+           overhead_seconds: float = 0.0) -> dict:
+    return {'action': action, 'locator': locator, 'seconds': seconds,
+            'wait_seconds': wait_seconds, 'overhead_seconds': overhead_seconds}
+
+
+def export(by_action: dict, profile: str = "perf") -> dict:
+    """An export with only what the comparison reads"""
+    return {'environment': {'profile': profile}, 'summary': {'by_action': by_action}}
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Timing Instrumentation")
+class TestInstrumentation:
+    """Test timing aggregation and the regression comparison"""
+
+    @allure.title("Percentiles use the nearest rank")
+    def test_percentile(self):
+        values = [float(value) for value in range(1, 11)]
+        assert percentile(values, 0.50) == 5.0
+        assert percentile(values, 0.90) == 9.0
+        assert percentile(values, 0.99) == 10.0
+        assert percentile(values, 0.0) == 1.0
+        assert percentile([], 0.5) == 0.0
+
+    @allure.title("Records are summarised per action and per locator")
+    def test_summary(self):
+        instrumentation = Instrumentation()
+        instrumentation.records = [
+            record("BasePage.click", 0.1, "#a", wait_seconds=0.05, overhead_seconds=0.01),
+            record("BasePage.click", 0.3, "#b", wait_seconds=0.15, overhead_seconds=0.01),
+            record("CartPage.get_cart_snapshot", 0.2),
+        ]
+        summary = instrumentation.summary()
+
+        click = summary['by_action']['BasePage.click']
+        assert (click['count'], click['total'], click['p50'], click['max']) == (2, 0.4, 0.1, 0.3)
+        assert (click['wait_share'], click['overhead']) == (0.5, 0.02)
+        assert sorted(summary['by_locator']) == ["#a", "#b"]
+
+    @allure.title("Only growth beyond the threshold counts as a regression")
+    def test_find_regressions(self):
+        baseline = export({'click': {'p50': 0.100}, 'fill': {'p50': 0.100}, 'hover': {'p50': 0.0},
+                           'tiny': {'p50': 0.001}})
+        current = export({'click': {'p50': 0.110}, 'fill': {'p50': 0.121}, 'hover': {'p50': 0.010},
+                          'tiny': {'p50': 0.004}, 'new_action': {'p50': 1.0}})
+
+        regressions = find_regressions(baseline, current, threshold=0.2)
+        # click grew by 10%, tiny stays below min_seconds, new_action has no baseline
+        assert sorted(action for action, _, _ in regressions) == ["fill", "hover"]
+        assert find_regressions(baseline, current, threshold=0.25) == [("hover", 0.0, 0.010)]
+
+    @allure.title("The compare CLI exits 1 on regressions and warns about mixed profiles")
+    def test_main_exit_code(self, tmp_path, capsys):
+        baseline, slower = tmp_path / "base.json", tmp_path / "slower.json"
+        instrumentation = Instrumentation()
+        instrumentation.records = [record("click", 0.1)]
+        instrumentation.export(str(baseline), environment={'profile': "perf"})
+        instrumentation.records = [record("click", 0.2)]
+        instrumentation.export(str(slower), environment={'profile': "local"})
+
+        assert main([str(baseline), str(baseline)]) == 0
+        assert main([str(baseline), str(slower)]) == 1
+        assert main([str(baseline), str(slower), "--threshold", "1.5"]) == 0
+        output = capsys.readouterr().out
+        assert "REGRESSED click: p50 100.0 ms -> 200.0 ms (+100%)" in output
+        assert "WARNING: comparing runs of different profiles: perf vs local" in output
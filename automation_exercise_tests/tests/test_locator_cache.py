@@ -0,0 +1,74 @@
+"""
+Locator Cache Tests
+Test covers: Hits and misses -> Main-frame navigation invalidates -> Child-frame navigation keeps -> Frame detach invalidates
+"""
+import allure
+from utils import CacheStats, LocatorCache
+
+
+class FakeLocator:
+    """Stands in for a lazy Locator: just the selector it was built from"""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+
+    def nth(self, index: int) -> "FakeLocator":
+        return FakeLocator(f"{self.selector} >> nth={index}")
+
+
+class FakePage:
+    """Stands in for a Page: builds locators and fires frame events on demand"""
+
+    def __init__(self):
+        self.main_frame = object()
+        self.handlers = {}
+        self.built = 0
+
+    def on(self, event: str, handler):
+        self.handlers[event] = handler
+
+    def locator(self, selector: str) -> FakeLocator:
+        self.built += 1
+        return FakeLocator(selector)
+
+    def emit(self, event: str, frame):
+        self.handlers[event](frame)
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Locator Cache")
+class TestLocatorCache:
+    """Test the per-page locator cache and its invalidation"""
+
+    @allure.title("Repeated lookups are hits and build no new Locator")
+    def test_hits_and_misses(self):
+        page, totals = FakePage(), CacheStats()
+        cache = LocatorCache.for_page(page)
+        assert LocatorCache.for_page(page) is cache
+        cache.totals = totals
+
+        first = cache.get(".col-sm-4")
+        assert cache.get(".col-sm-4") is first
+        assert cache.nth(".col-sm-4", 1).selector == ".col-sm-4 >> nth=1"
+        assert cache.nth(".col-sm-4", 1) is cache.nth(".col-sm-4", 1)
+
+        assert (cache.stats.hits, cache.stats.misses, page.built) == (3, 2, 2)
+        assert totals.snapshot() == {'hits': 3, 'misses': 2, 'invalidations': 0, 'hit_rate': 0.6}
+
+    @allure.title("Main-frame navigation and frame detach clear the cache, child frames do not")
+    def test_invalidation(self):
+        page = FakePage()
+        cache = LocatorCache(page, totals=CacheStats())
+        first = cache.get("#cart_info_table")
+
+        page.emit("framenavigated", object())  # an iframe (e.g. an ad) navigated
+        assert cache.get("#cart_info_table") is first
+
+        page.emit("framenavigated", page.main_frame)
+        assert cache.get("#cart_info_table") is not first
+        assert cache.stats.invalidations == 1
+
+        page.emit("framedetached", object())
+        page.emit("framedetached", object())  # nothing cached any more: not counted
+        assert cache.stats.invalidations == 2
+        assert cache.totals.invalidations == 2
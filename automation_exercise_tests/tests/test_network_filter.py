@@ -0,0 +1,54 @@
+"""
+Network Filter Tests
+Test covers: Allowed, blocked and stubbed requests -> Domain rules before resource types -> Counters since a snapshot
+"""
+import allure
+from utils import FilterStats, NetworkFilter
+
+
+SITE = "https://automationexercise.com"
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Network Filter")
+class TestNetworkFilter:
+    """Test request decisions and traffic counters of the network filter"""
+
+    @allure.title("Requests are allowed, blocked or stubbed by domain and resource type")
+    def test_decide(self):
+        network_filter = NetworkFilter(block_resource_types=("image", "font"))
+        assert network_filter.decide(f"{SITE}/products", "document") == 'allowed'
+        assert network_filter.decide("https://pagead2.googlesyndication.com/pagead/show_ads.js", "script") == 'blocked'
+        assert network_filter.decide("https://www.google-analytics.com/analytics.js", "script") == 'stubbed'
+        assert network_filter.decide(f"{SITE}/static/images/home/logo.png", "image") == 'blocked'
+        assert network_filter.decide("data:image/png;base64,AAAA", "image") == 'allowed'
+        # Subdomains match, look-alike hosts do not
+        assert network_filter.decide("https://notdoubleclick.net/x.js", "script") == 'allowed'
+
+    @allure.title("Domain rules take precedence over resource types")
+    def test_precedence(self):
+        network_filter = NetworkFilter(allow_domains=("automationexercise.com",), block_resource_types=("script",),
+                                       stub_domains=("googletagmanager.com",))
+        # A stubbed domain stays stubbed even for a blocked resource type
+        assert network_filter.decide("https://www.googletagmanager.com/gtm.js", "script") == 'stubbed'
+        # Outside the allow list everything is blocked, inside it resource types still apply
+        assert network_filter.decide("https://cdn.example.com/app.css", "stylesheet") == 'blocked'
+        assert network_filter.decide(f"{SITE}/static/app.js", "script") == 'blocked'
+        assert network_filter.decide(f"{SITE}/static/app.css", "stylesheet") == 'allowed'
+
+    @allure.title("Counters since a snapshot cover only the later traffic")
+    def test_stats_since(self):
+        stats = FilterStats()
+        stats.record('blocked', "image")
+        stats.record_response_size("image", 1000)
+        earlier = stats.snapshot()
+
+        stats.record('allowed', "document")
+        stats.record('blocked', "script")
+        stats.record('stubbed', "script")
+        stats.record_response_size("document", 300)
+
+        delta = stats.since(earlier)
+        assert (delta['allowed'], delta['blocked'], delta['stubbed'], delta['bytes_allowed']) == (1, 1, 1, 300)
+        assert delta['blocked_by_type'] == {'script': 2}
+        assert delta['estimated_bytes_saved'] == 2 * 50000
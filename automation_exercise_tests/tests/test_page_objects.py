@@ -0,0 +1,116 @@
+"""
+Page Object Tests
+Test covers: Product selectors by index (sync and async twins) against the stand-in server -> Bulk form fill -> Cart table snapshot
+"""
+import pytest
+import allure
+from playwright.sync_api import Page
+from pages import CartItem, CartPage, ProductsPage
+from pages.base_page import BasePage, FormFillError
+from pages.cart_page import _to_number
+from pages.aio import AsyncProductsPage
+from server import StandInServer
+
+
+FORM = """<form>
+  <input id="name" type="text">
+  <textarea id="comment"></textarea>
+  <select id="month"><option value="1">January</option><option value="7">July</option></select>
+  <input id="newsletter" type="checkbox">
+  <input id="offers" type="checkbox" checked>
+  <input id="email" type="email" disabled>
+</form>"""
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Run a private stand-in server for this module"""
+    with StandInServer() as stand_in:
+        yield stand_in
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Page Objects")
+class TestProductSelectors:
+    """Test the product selectors built by index"""
+
+    @allure.title("The product selector by index matches exactly that product")
+    def test_product_by_index(self, page: Page, server):
+        products_page = ProductsPage(page, server.url).open()
+        selector = products_page.get_product_by_index(2)
+        assert selector == AsyncProductsPage(None, server.url).get_product_by_index(2)
+
+        product = page.locator(selector)
+        assert product.count() == 1
+        assert "Men Tshirt" in product.inner_text()
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Page Objects")
+class TestFillForm:
+    """Test filling several fields in one browser round trip"""
+
+    @allure.title("Inputs, selects by value or label and checkboxes are filled")
+    def test_fill_form(self, page: Page):
+        page.set_content(FORM)
+        BasePage(page).fill_form({
+            "#name": "Test User",
+            "#comment": "Leave at the door",
+            "#month": "July",
+            "#newsletter": True,
+            "#offers": False,
+        })
+        assert page.input_value("#name") == "Test User"
+        assert page.input_value("#comment") == "Leave at the door"
+        assert page.input_value("#month") == "7"
+        assert page.is_checked("#newsletter") and not page.is_checked("#offers")
+
+        BasePage(page).fill_form({"#month": "1"})
+        assert page.input_value("#month") == "1"
+
+    @allure.title("Every field that cannot be filled is reported, the others are still filled")
+    def test_fill_form_errors(self, page: Page):
+        page.set_content(FORM)
+        with pytest.raises(FormFillError) as error:
+            BasePage(page).fill_form({
+                "#name": "Test User",
+                "#missing": "x",
+                "#email": "test@testmail.com",
+                "#month": "December",
+                "#comment": True,
+            })
+        assert error.value.failures == {
+            "#missing": "element not found",
+            "#email": "element is not editable",
+            "#month": 'no option "December"',
+            "#comment": "boolean value for non-checkable textarea",
+        }
+        assert str(error.value).startswith("Could not fill 4 field(s): #missing: element not found; ")
+        assert page.input_value("#name") == "Test User"
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Page Objects")
+class TestCartSnapshot:
+    """Test reading the cart table in one browser round trip"""
+
+    @allure.title("Displayed amounts are parsed to numbers")
+    def test_to_number(self):
+        assert _to_number("Rs. 500") == 500
+        assert _to_number("Rs. 1,500") == 1500
+        assert _to_number(" 2 ") == 2
+        assert _to_number("") == 0
+
+    @allure.title("The snapshot holds name, price, quantity and total of every row")
+    def test_cart_snapshot(self, page: Page, server):
+        for product_id in (1, 1, 4):
+            page.context.request.get(f"{server.url}/add_to_cart/{product_id}")
+        cart_page = CartPage(page, server.url).open()
+
+        snapshot = cart_page.get_cart_snapshot()
+        assert snapshot == [
+            CartItem("Blue Top", 500, 2, 1000, "Rs. 500", "2", "Rs. 1000"),
+            CartItem("Stylish Dress", 1500, 1, 1500, "Rs. 1500", "1", "Rs. 1500"),
+        ]
+        assert snapshot[0].as_dict() == cart_page.get_all_products_info()[0]
+        assert cart_page.verify_cart_items_count(2)
@@ -0,0 +1,58 @@
+"""
+Execution Profile Tests
+Test covers: Profile fills unset options -> Explicit options win, also when they equal Playwright's defaults -> Recorded in the Allure environment
+"""
+from types import SimpleNamespace
+
+import allure
+from utils import PROFILES, apply_profile, write_allure_environment
+
+
+def unset_options(**explicit) -> SimpleNamespace:
+    """Options as parsed without any of the profile's settings given"""
+    options = dict(headed=None, slowmo=None, tracing=None, ring_tracing=None, viewport=None, video_policy=None,
+                   screenshot_policy=None, step_backend=None)
+    return SimpleNamespace(**{**options, **explicit})
+
+
+def parse_options(pytestconfig, *args):
+    """Options as the command line parser returns them for args"""
+    return pytestconfig._parser.parse_known_args(list(args))
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Execution Profiles")
+class TestProfiles:
+    """Test resolving and recording execution profiles"""
+
+    @allure.title("The profile fills unset options and explicit ones override it")
+    def test_apply_profile(self, tmp_path):
+        options = unset_options()
+        effective = apply_profile(options, PROFILES["debug"])
+        assert (options.headed, options.slowmo, options.tracing) == (True, 500, "on")
+        assert effective == PROFILES["debug"]
+
+        options = unset_options(video_policy="on", slowmo=100)
+        effective = apply_profile(options, PROFILES["ci-fast"])
+        assert (options.video_policy, options.slowmo, options.headed) == ("on", 100, False)
+        assert effective.name == "ci-fast" and effective.video_policy == "on"
+        assert options.ring_tracing and options.tracing == "off"
+
+        write_allure_environment(str(tmp_path), effective, target="local stand-in")
+        properties = (tmp_path / "environment.properties").read_text(encoding="utf-8")
+        assert "profile=ci-fast\n" in properties and "video_policy=on\n" in properties
+
+    @allure.title("Explicit --slowmo 0, --tracing off and --headless override a debug profile")
+    def test_explicit_defaults_win(self, pytestconfig):
+        options = parse_options(pytestconfig, "--profile", "debug", "--slowmo", "0", "--tracing", "off")
+        effective = apply_profile(options, PROFILES[options.profile])
+        assert (options.slowmo, options.tracing, options.ring_tracing) == (0, "off", False)
+        assert (effective.slowmo, effective.tracing, effective.headed) == (0, "off", True)
+
+        options = parse_options(pytestconfig, "--profile", "debug", "--headless")
+        apply_profile(options, PROFILES[options.profile])
+        assert (options.headed, options.slowmo, options.tracing) == (False, 500, "on")
+
+        options = parse_options(pytestconfig, "--profile", "ci-fast", "--tracing", "off")
+        assert apply_profile(options, PROFILES[options.profile]).tracing == "off"
+        assert not options.ring_tracing
@@ -0,0 +1,72 @@
+"""
+Ring-buffer Tracing Tests
+Test covers: Chunk per outermost step -> Only the last chunks kept -> Persist on failure -> Cleanup
+"""
+import os
+from types import SimpleNamespace
+
+import allure
+from utils import RingTracer, TracingStats, set_step_listener, step
+
+
+class RecordingTracing:
+    """Stands in for BrowserContext.tracing: every stopped chunk becomes a file"""
+
+    def __init__(self):
+        self.running = False
+
+    def start(self, **options):
+        self.running = True
+
+    def start_chunk(self):
+        pass
+
+    def stop_chunk(self, path: str):
+        with open(path, "w", encoding="utf-8") as chunk_file:
+            chunk_file.write(path)
+
+    def stop(self):
+        self.running = False
+
+
+class FakePage:
+    @step("Inner step", primitive=True)
+    def inner(self):
+        pass
+
+    @step("Outer step {number}")
+    def outer(self, number: int):
+        self.inner()
+        self.inner()
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Ring-buffer Tracing")
+class TestRingTracer:
+    """Test chunk rotation and retention of the ring tracer"""
+
+    @allure.title("Only the last chunks are kept and saved on failure")
+    def test_ring(self, tmp_path):
+        context = SimpleNamespace(tracing=RecordingTracing())
+        stats = TracingStats()
+        tracer = RingTracer(context, chunk_steps=2, keep_chunks=2, stats=stats)
+        tracer.start()
+        set_step_listener(tracer.step_finished)
+        try:
+            page = FakePage()
+            for number in range(1, 8):
+                page.outer(number)
+        finally:
+            set_step_listener(None)
+
+        # 7 outer steps (nested steps do not count) = 3 full chunks of 2, the oldest evicted
+        assert [os.path.basename(chunk) for chunk in tracer.chunks] == ["002-Outer_step_3.zip", "003-Outer_step_5.zip"]
+
+        saved = tracer.persist(str(tmp_path / "failed"))
+        assert [os.path.basename(chunk) for chunk in saved] == [
+            "002-Outer_step_3.zip", "003-Outer_step_5.zip", "004-Outer_step_7.zip"]
+        assert (stats.tests, stats.chunks, stats.persisted) == (1, 4, 1)
+
+        temp_dir = os.path.dirname(tracer.chunks[0])
+        tracer.stop()
+        assert not context.tracing.running and not os.path.exists(temp_dir)
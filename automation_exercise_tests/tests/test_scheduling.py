@@ -0,0 +1,57 @@
+"""
+Duration-aware Scheduling Tests
+Test covers: Failed first -> Longest first -> Unknown tests at the median -> Predicted makespan with xdist's initial chunks -> History round trip
+"""
+from types import SimpleNamespace
+
+import allure
+from utils import DurationHistory, initial_chunk, order_items, predict_makespan
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Scheduling")
+class TestScheduling:
+    """Test test ordering and makespan prediction from the duration history"""
+
+    @allure.title("Recently failed tests run first, then the rest longest-first")
+    def test_order(self, tmp_path):
+        history = DurationHistory(str(tmp_path / "durations.json"))
+        history.update("test_purchase", 60.0, failed=False)
+        history.update("test_cart", 10.0, failed=False)
+        history.update("test_register", 20.0, failed=True)
+        history.update("test_login", 5.0, failed=False)
+        items = [SimpleNamespace(nodeid=nodeid) for nodeid in
+                 ("test_login", "test_new", "test_cart", "test_purchase", "test_register")]
+
+        ordered = [item.nodeid for item in order_items(items, history)]
+        # test_new has no history and is estimated at the median (15s)
+        assert ordered == ["test_register", "test_purchase", "test_new", "test_cart", "test_login"]
+
+        assert predict_makespan([60.0, 20.0, 15.0, 10.0, 5.0], 2) == 60.0
+        assert predict_makespan([20.0, 15.0, 10.0, 5.0], 2) == 25.0
+        assert predict_makespan([20.0, 15.0], 1) == 35.0
+
+    @allure.title("The prediction models the consecutive chunks xdist sends first")
+    def test_initial_chunks(self):
+        # --dist load: a quarter of each worker's share, at least 2, capped by --maxschedchunk
+        assert initial_chunk(40, 4) == 2
+        assert initial_chunk(80, 2) == 10
+        assert initial_chunk(80, 2, max_chunk=3) == 3
+        assert initial_chunk(5, 4) == 1
+        assert initial_chunk(80, 1) == 1
+
+        # Worker 1 starts with 60 + 20, worker 2 with 15 + 10; the 5 goes to the latter
+        assert predict_makespan([60.0, 20.0, 15.0, 10.0, 5.0], 2, chunk=2) == 80.0
+        assert predict_makespan([60.0, 20.0, 15.0, 10.0, 5.0], 2, chunk=1) == 60.0
+
+    @allure.title("Durations are smoothed and survive a save/load round trip")
+    def test_history_round_trip(self, tmp_path):
+        history = DurationHistory(str(tmp_path / "nested" / "durations.json"), smoothing=0.5)
+        history.update("test_cart", 10.0, failed=True)
+        history.update("test_cart", 20.0, failed=False)
+        history.save()
+
+        loaded = DurationHistory(history.path).load()
+        assert loaded.duration("test_cart") == 15.0
+        assert not loaded.failed_last("test_cart")
+        assert DurationHistory(str(tmp_path / "missing.json")).load().tests == {}
@@ -0,0 +1,58 @@
+"""
+Screenshot Pipeline Tests
+Test covers: On-failure policy holds step screenshots -> Released when a phase fails -> Joined once after teardown -> Write errors do not break the flush
+"""
+import os
+
+import allure
+from utils import ScreenshotPipeline
+
+
+class FakePage:
+    """Stands in for a Page: every screenshot is a few fixed bytes"""
+
+    def screenshot(self, **options) -> bytes:
+        return b"\x89PNG fake"
+
+
+def saved_files(directory) -> list:
+    return sorted(file_name for _, _, file_names in os.walk(directory) for file_name in file_names)
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Screenshot Policies")
+class TestScreenshotPipeline:
+    """Test the capture policies and background writes of the pipeline"""
+
+    @allure.title("On-failure keeps step screenshots only for failing tests")
+    def test_on_failure(self, tmp_path):
+        pipeline = ScreenshotPipeline("on-failure", output_dir=str(tmp_path))
+        try:
+            pipeline.start_test("tests/test_x.py::test_passes")
+            pipeline.capture(FakePage(), "home_page")
+            pipeline.flush(failed=False)
+            assert saved_files(tmp_path) == []
+
+            pipeline.start_test("tests/test_x.py::test_fails")
+            pipeline.capture(FakePage(), "home_page")
+            pipeline.capture(FakePage(), "cart_state")
+            pipeline.capture(FakePage(), "failure_screenshot", force=True)
+            pipeline.flush(failed=True, test_finished=False)
+            assert len(pipeline._pending) == 3
+            pipeline.flush()
+            assert pipeline._pending == []
+            assert saved_files(tmp_path) == ["001_home_page.png", "002_cart_state.png", "003_failure_screenshot.png"]
+        finally:
+            pipeline.close()
+
+    @allure.title("A screenshot that cannot be written does not break the flush")
+    def test_write_error(self, tmp_path):
+        (tmp_path / "blocked").write_text("a file where the screenshot folder should be")
+        pipeline = ScreenshotPipeline("always", output_dir=str(tmp_path / "blocked"))
+        try:
+            pipeline.start_test("tests/test_x.py::test_y")
+            pipeline.capture(FakePage(), "home_page")
+            pipeline.flush()
+            assert pipeline._pending == []
+        finally:
+            pipeline.close()
@@ -0,0 +1,86 @@
+"""
+Session Cache Tests
+Test covers: Save storage state -> Load -> TTL expiry -> Oldest-first eviction -> Cached login skips registration
+"""
+import os
+import time
+
+import pytest
+import allure
+from utils import AutomationExerciseApi, SessionCache, generate_user_data
+
+
+STATE = {'cookies': [{'name': 'sessionid', 'value': 'abc', 'url': 'http://127.0.0.1'}], 'origins': []}
+USER = {'name': 'Test User', 'email': 'test@testmail.com'}
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Session Cache")
+class TestSessionCache:
+    """Test the on-disk storage-state cache"""
+
+    @allure.title("Saved entries are loaded until they expire")
+    def test_ttl(self, tmp_path):
+        cache = SessionCache(str(tmp_path), ttl_seconds=60)
+        key = SessionCache.make_key("http://127.0.0.1:8000", worker_id="gw0")
+
+        cache.save(key, USER, STATE)
+        assert cache.load(key)['storage_state'] == STATE
+
+        cache.ttl_seconds = 0
+        time.sleep(0.01)
+        assert cache.load(key) is None
+        assert not os.listdir(tmp_path)
+
+    @allure.title("Oldest entries are evicted above max_entries")
+    def test_eviction(self, tmp_path):
+        cache = SessionCache(str(tmp_path), max_entries=2)
+        keys = [SessionCache.make_key("http://site", profile=f"p{index}") for index in range(3)]
+        for offset, key in enumerate(keys):
+            cache.save(key, USER, STATE)
+            os.utime(cache._path(key), (offset, time.time() - 10 + offset))
+
+        cache.evict()
+        assert cache.load(keys[0]) is None
+        assert cache.load(keys[1]) is not None
+        assert cache.load(keys[2]) is not None
+
+
+@pytest.fixture(scope="module")
+def session_cache(tmp_path_factory) -> SessionCache:
+    """A private cache, so these tests neither see nor leave the run's entries"""
+    return SessionCache(str(tmp_path_factory.mktemp("session-cache")))
+
+
+@pytest.fixture(scope="function")
+def stand_in(local_server):
+    """The session's stand-in server; its user store shows which accounts were created"""
+    if local_server is None:
+        pytest.skip("needs the stand-in server (not started for HAR replay)")
+    return local_server
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Session Cache")
+@pytest.mark.skipif("not config.getoption('local_server')", reason="needs the stand-in server (--local-server)")
+class TestCachedLoggedInUser:
+    """Test the cached_logged_in_user fixture against the stand-in server"""
+
+    @allure.title("A cached session is restored without registering an account")
+    def test_cache_hit(self, stand_in, session_cache, worker_id, request):
+        user = generate_user_data()
+        api = AutomationExerciseApi(stand_in.url)
+        api.create_account(user)
+        state = {'cookies': api.login(user['email'], user['password']), 'origins': []}
+        session_cache.save(SessionCache.make_key(stand_in.url, "default", worker_id), user, state)
+        accounts = len(stand_in.store.users)
+
+        assert request.getfixturevalue("cached_logged_in_user") == user
+        assert len(stand_in.store.users) == accounts
+
+    @allure.title("Without a cached session an account is provisioned and cached")
+    @pytest.mark.parametrize("cached_logged_in_user", ["empty-cache"], indirect=True)
+    def test_cache_miss(self, stand_in, session_cache, worker_id, cached_logged_in_user):
+        assert stand_in.store.get_user(cached_logged_in_user['email']) is not None
+        entry = session_cache.load(SessionCache.make_key(stand_in.url, "empty-cache", worker_id))
+        assert entry['user'] == cached_logged_in_user
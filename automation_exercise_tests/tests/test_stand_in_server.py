@@ -0,0 +1,95 @@
+"""
+Stand-in Server Tests
+Test covers: the local stand-in serves the pages and flows the page objects use
+"""
+import http.cookiejar
+import urllib.parse
+import urllib.request
+
+import pytest
+import allure
+from server import StandInServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Run a private stand-in server for this module"""
+    with StandInServer() as stand_in:
+        yield stand_in
+
+
+@pytest.fixture(scope="function")
+def browser_session():
+    """HTTP opener that keeps cookies like a browser would"""
+    return urllib.request.build_opener(
+        urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+    )
+
+
+def fetch(opener, url: str, form: dict = None) -> str:
+    """GET (or POST when form is given) and return the decoded body"""
+    data = urllib.parse.urlencode(form).encode() if form is not None else None
+    with opener.open(url, data=data) as response:
+        return response.read().decode("utf-8")
+
+
+def register(opener, base_url: str, email: str):
+    """Run the signup + create account form posts"""
+    fetch(opener, f"{base_url}/signup", {"name": "Test User", "email": email})
+    return fetch(opener, f"{base_url}/create_account", {
+        "title": "Mr", "name": "Test User", "email": email, "password": "secret",
+        "days": "1", "months": "1", "years": "1990", "first_name": "Test",
+        "last_name": "User", "company": "", "address1": "Street 1", "address2": "",
+        "country": "India", "state": "State", "city": "City", "zipcode": "12345",
+        "mobile_number": "1234567890",
+    })
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Local Stand-in Server")
+class TestStandInServer:
+    """Test the stand-in pages over plain HTTP"""
+
+    @allure.title("Pages expose the locators used by the page objects")
+    def test_pages_expose_locators(self, server, browser_session):
+        home = fetch(browser_session, server.url)
+        assert "<title>Automation Exercise</title>" in home
+        assert "href='/login'" in home
+
+        login = fetch(browser_session, f"{server.url}/login")
+        assert "data-qa=\"signup-name\"" in login
+        assert "data-qa=\"login-email\"" in login
+
+        products = fetch(browser_session, f"{server.url}/products")
+        assert "All Products" in products
+        assert products.count("class=\"col-sm-4\"") == 8
+
+    @allure.title("Registration, cart and payment flow")
+    def test_purchase_flow(self, server, browser_session):
+        created = register(browser_session, server.url, "flow@testmail.com")
+        assert "data-qa=\"account-created\"" in created
+        assert "Logged in as <b>Test User</b>" in fetch(browser_session, server.url)
+
+        fetch(browser_session, f"{server.url}/add_to_cart/1")
+        fetch(browser_session, f"{server.url}/add_to_cart/2")
+        cart = fetch(browser_session, f"{server.url}/view_cart")
+        assert "id=\"cart_info_table\"" in cart
+        assert cart.count("class=\"cart_description\"") == 2
+
+        checkout = fetch(browser_session, f"{server.url}/checkout")
+        assert "address_delivery" in checkout
+        assert "href=\"/payment\"" in checkout
+
+        confirmation = fetch(browser_session, f"{server.url}/payment", {
+            "name_on_card": "Test User", "card_number": "4532015112830366",
+            "cvc": "123", "expiry_month": "12", "expiry_year": "2027",
+        })
+        assert "Congratulations! Your order has been confirmed!" in confirmation
+        assert "id=\"empty_cart\"" in fetch(browser_session, f"{server.url}/view_cart")
+
+    @allure.title("Duplicate signup is rejected")
+    def test_duplicate_email(self, server, browser_session):
+        register(browser_session, server.url, "duplicate@testmail.com")
+        response = fetch(browser_session, f"{server.url}/signup",
+                         {"name": "Other", "email": "duplicate@testmail.com"})
+        assert "Email Address already exist!" in response
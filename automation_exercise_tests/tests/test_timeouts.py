@@ -0,0 +1,83 @@
+"""
+Adaptive Timeout Tests
+Test covers: Default without history -> Percentile x margin -> Clamping -> Never below the default -> Timed-out waits -> History shared across workers and scoped by target
+"""
+import allure
+from utils import TimeoutService, TIMEOUTS_ADAPTIVE, TIMEOUTS_FIXED, history_scope
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Adaptive Timeouts")
+class TestTimeoutService:
+    """Test timeouts derived from per-locator latency history"""
+
+    @allure.title("Timeouts follow the observed latency, within floor and ceiling")
+    def test_derived_timeout(self, tmp_path):
+        service = TimeoutService(TIMEOUTS_ADAPTIVE, str(tmp_path), margin=3.0, floor_ms=500,
+                                 ceiling_ms=5000, min_samples=3, allow_shorter=True)
+        assert service.timeout_for("#slow", 10000) == 10000
+
+        for elapsed in (800, 900, 1000):
+            service.record("#slow", elapsed, 10000, timed_out=False)
+        assert service.timeout_for("#slow", 10000) == 3000
+
+        service.record("#slow", 4000, 10000, timed_out=False)
+        assert service.timeout_for("#slow", 10000) == 5000
+
+        for elapsed in (10, 20, 30):
+            service.record("#fast", elapsed, 10000, timed_out=False)
+        assert service.timeout_for("#fast", 10000) == 500
+
+    @allure.title("Without opting in, a derived timeout only raises the default")
+    def test_never_below_default(self, tmp_path):
+        service = TimeoutService(TIMEOUTS_ADAPTIVE, str(tmp_path), margin=3.0, floor_ms=0, min_samples=3)
+        for elapsed in (100, 200, 300):
+            service.record("#fast", elapsed, 10000, timed_out=False)
+        assert service.timeout_for("#fast", 10000) == 10000
+        assert service.timeout_for("#fast", 500) == 900
+
+    @allure.title("Timed-out waits count at their timeout and restore the default")
+    def test_timed_out_waits(self, tmp_path):
+        service = TimeoutService(TIMEOUTS_ADAPTIVE, str(tmp_path), margin=2.0, floor_ms=0, min_samples=3,
+                                 allow_shorter=True)
+        for elapsed in (100, 100, 100):
+            service.record("#cart", elapsed, 10000, timed_out=False)
+        assert service.timeout_for("#cart", 10000) == 200
+
+        service.record("#cart", 180, 200, timed_out=True)
+        assert service.timeout_for("#cart", 10000) == 10000
+        service.save()
+
+        # The next run sees the timeout as a sample, so the locator's timeout grows
+        next_run = TimeoutService(TIMEOUTS_ADAPTIVE, str(tmp_path), margin=2.0, floor_ms=0, min_samples=3,
+                                  allow_shorter=True)
+        assert next_run.timeout_for("#cart", 10000) == 400
+
+    @allure.title("History saved by one worker is used by the next run of another")
+    def test_history_across_runs(self, tmp_path):
+        first = TimeoutService(TIMEOUTS_ADAPTIVE, str(tmp_path), worker_id="gw0", floor_ms=0, min_samples=2)
+        first.timeout_for("#cart", 10000)
+        first.record("#cart", 400, 1000, timed_out=False)
+        first.record("#cart", 500, 1000, timed_out=False)
+        first.record("#cart", 900, 1000, timed_out=True)
+        assert first.summary()['#cart']['timed_out'] == 1
+        first.save()
+
+        second = TimeoutService(TIMEOUTS_ADAPTIVE, str(tmp_path), worker_id="gw1", floor_ms=0, min_samples=2)
+        assert second.timeout_for("#cart", 1000) == 3000
+        assert TimeoutService(TIMEOUTS_FIXED, str(tmp_path)).timeout_for("#cart", 1000) == 1000
+
+    @allure.title("History of one target and profile does not shape another's timeouts")
+    def test_scoped_history(self, tmp_path):
+        stand_in = history_scope("local stand-in", "ci-fast")
+        assert stand_in == "ci-fast-local_stand-in"
+        local = TimeoutService(TIMEOUTS_ADAPTIVE, str(tmp_path), scope=stand_in, floor_ms=0, min_samples=1,
+                               allow_shorter=True)
+        local.record("#cart", 10, 10000, timed_out=False)
+        local.save()
+        assert TimeoutService(TIMEOUTS_ADAPTIVE, str(tmp_path), scope=stand_in, floor_ms=0, min_samples=1,
+                              allow_shorter=True).timeout_for("#cart", 10000) == 30
+
+        live = TimeoutService(TIMEOUTS_ADAPTIVE, str(tmp_path), floor_ms=0, min_samples=1, allow_shorter=True,
+                              scope=history_scope("https://automationexercise.com", "ci-fast"))
+        assert live.timeout_for("#cart", 10000) == 10000
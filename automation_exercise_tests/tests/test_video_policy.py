@@ -0,0 +1,34 @@
+"""
+Video Policy Tests
+Test covers: Videos of several workers -> One shared disk budget -> Oldest evicted first
+"""
+import os
+
+import allure
+from utils import VideoPolicy
+
+
+def write_video(path, size: int, mtime: int):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as video_file:
+        video_file.write(b"\0" * size)
+    os.utime(path, (mtime, mtime))
+
+
+@allure.epic("Infrastructure")
+@allure.feature("Video Policy")
+class TestVideoPolicy:
+    """Test the disk budget of the video folder"""
+
+    @allure.title("The budget covers the videos of all workers together")
+    def test_shared_budget(self, tmp_path):
+        megabyte = 1024 * 1024
+        write_video(str(tmp_path / "gw0" / "a.webm"), megabyte, mtime=1000)
+        write_video(str(tmp_path / "gw1" / "b.webm"), megabyte, mtime=2000)
+        write_video(str(tmp_path / "gw0" / "c.webm"), megabyte, mtime=3000)
+
+        policy = VideoPolicy(video_dir=str(tmp_path / "gw0"), budget_mb=2, budget_dir=str(tmp_path))
+        policy.enforce_budget()
+
+        remaining = sorted(file_name for _, _, file_names in os.walk(tmp_path) for file_name in file_names)
+        assert remaining == ["b.webm", "c.webm"]
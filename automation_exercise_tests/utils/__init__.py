@@ -8,11 +8,219 @@ from utils.test_data import (
     generate_payment_data,
     get_test_comment
 )
+from utils.data_pool import DataPool, configure_data_pool, get_data_pool
+from utils.workers import (
+    get_worker_id,
+    get_run_id,
+    worker_dir,
+    UniqueIdAllocator,
+    configure_unique_ids,
+    restore_unique_ids,
+    next_unique_id
+)
+from utils.context_pool import ContextPool
+from utils.api_client import (
+    ApiError,
+    AutomationExerciseApi,
+    inject_session,
+    provision_account
+)
+from utils.session_cache import (
+    SessionCache,
+    restore_cookies,
+    restore_local_storage
+)
+from utils.network_filter import (
+    NetworkFilter,
+    FilterStats,
+    DEFAULT_DENY_DOMAINS,
+    DEFAULT_STUB_DOMAINS,
+    parse_list_option
+)
+from utils.page_timings import PageTimings, page_timings
+from utils.instrumentation import Instrumentation, instrumentation, find_regressions
+from utils.locator_cache import LocatorCache, CacheStats, locator_cache_totals
+from utils.har import (
+    HarArchive,
+    seed_test_data,
+    HAR_MODES,
+    HAR_OFF,
+    HAR_RECORD,
+    HAR_REPLAY,
+    NOT_FOUND_ACTIONS
+)
+from utils.accounts import (
+    AccountRegistry,
+    configure_account_registry,
+    get_account_registry,
+    delete_accounts
+)
+from utils.checkpoints import (
+    CheckpointStore,
+    FlowCheckpoints,
+    read_server_cart,
+    CHECKPOINT_MODES,
+    CHECKPOINTS_OFF,
+    CHECKPOINTS_SAVE,
+    CHECKPOINTS_RESUME
+)
+from utils.scheduling import (
+    DurationHistory,
+    RunRecorder,
+    run_recorder,
+    order_items,
+    initial_chunk,
+    predict_makespan,
+    SCHEDULE_MODES,
+    SCHEDULE_DURATION,
+    SCHEDULE_OFF
+)
+from utils.timeouts import (
+    TimeoutService,
+    configure_timeouts,
+    get_timeouts,
+    history_scope,
+    TIMEOUT_MODES,
+    TIMEOUTS_ADAPTIVE,
+    TIMEOUTS_FIXED
+)
+from utils.screenshots import (
+    ScreenshotPipeline,
+    configure_screenshots,
+    get_screenshot_pipeline,
+    POLICIES as SCREENSHOT_POLICIES,
+    FORMATS as SCREENSHOT_FORMATS
+)
+from utils.video_policy import (
+    VideoPolicy,
+    VIDEO_MODES,
+    VIDEO_ON,
+    VIDEO_OFF,
+    VIDEO_RETAIN_ON_FAILURE,
+    VIDEO_SAMPLED,
+    parse_size
+)
+from utils.profiles import (
+    Profile,
+    PROFILES,
+    default_profile_name,
+    apply_profile,
+    write_allure_environment,
+    TRACING_RING
+)
+from utils.tracing import RingTracer, TracingStats, tracing_totals, trace_dir_for
+from utils.steps import (
+    step,
+    set_step_backend,
+    set_step_listener,
+    flush_steps,
+    BACKENDS as STEP_BACKENDS,
+    BACKEND_ALLURE,
+    BACKEND_TOP_LEVEL,
+    BACKEND_BUFFERED,
+    BACKEND_OFF
+)
 
 __all__ = [
     'generate_random_email',
     'generate_random_password',
     'generate_user_data',
     'generate_payment_data',
-    'get_test_comment'
+    'get_test_comment',
+    'DataPool',
+    'configure_data_pool',
+    'get_data_pool',
+    'get_worker_id',
+    'get_run_id',
+    'worker_dir',
+    'UniqueIdAllocator',
+    'configure_unique_ids',
+    'restore_unique_ids',
+    'next_unique_id',
+    'ContextPool',
+    'ApiError',
+    'AutomationExerciseApi',
+    'inject_session',
+    'provision_account',
+    'SessionCache',
+    'restore_cookies',
+    'restore_local_storage',
+    'NetworkFilter',
+    'FilterStats',
+    'DEFAULT_DENY_DOMAINS',
+    'DEFAULT_STUB_DOMAINS',
+    'parse_list_option',
+    'PageTimings',
+    'page_timings',
+    'Instrumentation',
+    'instrumentation',
+    'find_regressions',
+    'LocatorCache',
+    'CacheStats',
+    'locator_cache_totals',
+    'HarArchive',
+    'seed_test_data',
+    'HAR_MODES',
+    'HAR_OFF',
+    'HAR_RECORD',
+    'HAR_REPLAY',
+    'NOT_FOUND_ACTIONS',
+    'AccountRegistry',
+    'configure_account_registry',
+    'get_account_registry',
+    'delete_accounts',
+    'CheckpointStore',
+    'FlowCheckpoints',
+    'read_server_cart',
+    'CHECKPOINT_MODES',
+    'CHECKPOINTS_OFF',
+    'CHECKPOINTS_SAVE',
+    'CHECKPOINTS_RESUME',
+    'DurationHistory',
+    'RunRecorder',
+    'run_recorder',
+    'order_items',
+    'initial_chunk',
+    'predict_makespan',
+    'SCHEDULE_MODES',
+    'SCHEDULE_DURATION',
+    'SCHEDULE_OFF',
+    'TimeoutService',
+    'configure_timeouts',
+    'get_timeouts',
+    'history_scope',
+    'TIMEOUT_MODES',
+    'TIMEOUTS_ADAPTIVE',
+    'TIMEOUTS_FIXED',
+    'ScreenshotPipeline',
+    'configure_screenshots',
+    'get_screenshot_pipeline',
+    'SCREENSHOT_POLICIES',
+    'SCREENSHOT_FORMATS',
+    'VideoPolicy',
+    'VIDEO_MODES',
+    'VIDEO_ON',
+    'VIDEO_OFF',
+    'VIDEO_RETAIN_ON_FAILURE',
+    'VIDEO_SAMPLED',
+    'parse_size',
+    'Profile',
+    'PROFILES',
+    'default_profile_name',
+    'apply_profile',
+    'write_allure_environment',
+    'TRACING_RING',
+    'RingTracer',
+    'TracingStats',
+    'tracing_totals',
+    'trace_dir_for',
+    'step',
+    'set_step_backend',
+    'set_step_listener',
+    'flush_steps',
+    'STEP_BACKENDS',
+    'BACKEND_ALLURE',
+    'BACKEND_TOP_LEVEL',
+    'BACKEND_BUFFERED',
+    'BACKEND_OFF'
 ]
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""
+Test Account Registry and Cleanup
+
+Every account a test creates is appended to a per-worker registry file
+(<registry_dir>/<run_id>-<worker>.jsonl) the moment it exists, so even a
+crashed run leaves a record of what it created. At the end of the session
+the controller deletes the run's accounts over /api/deleteAccount with
+bounded parallelism and retries; the sweeper does the same for the
+registry files of earlier runs that never got that far:
+
+    python -m utils.accounts                      # files older than an hour
+    python -m utils.accounts --older-than 0 --dry-run
+
+Accounts kept on purpose (cached logged-in sessions) carry keep_until and
+are only deleted once it has passed.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.api_client import ApiError, AutomationExerciseApi
+from utils.workers import MASTER_WORKER_ID
+
+
+class AccountRegistry:
+    """Append-only record of the accounts created by this worker"""
+
+    def __init__(self, registry_dir: str = "playwright/.accounts", run_id: str = "local",
+                 worker_id: str = MASTER_WORKER_ID, enabled: bool = False):
+        self.registry_dir = registry_dir
+        self.run_id = run_id
+        self.worker_id = worker_id
+        self.enabled = enabled
+        self.path = os.path.join(registry_dir, f"{run_id}-{worker_id}.jsonl")
+        self._lock = threading.Lock()
+
+    def register(self, base_url: str, user: dict, keep_seconds: float = None):
+        """Record an account (before anything else can fail)"""
+        if not self.enabled:
+            return
+        entry = {'base_url': base_url.rstrip("/"), 'email': user['email'], 'password': user['password'],
+                 'created': time.time()}
+        if keep_seconds:
+            entry['keep_until'] = entry['created'] + keep_seconds
+        with self._lock:
+            os.makedirs(self.registry_dir, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as registry_file:
+                registry_file.write(json.dumps(entry) + "\n")
+
+    def files(self, run_id: str = None, older_than: float = None) -> list:
+        """Registry files of one run (or all), optionally only those untouched for older_than seconds"""
+        paths = sorted(glob.glob(os.path.join(self.registry_dir, f"{run_id or '*'}-*.jsonl")))
+        if older_than is not None:
+            paths = [path for path in paths if time.time() - os.path.getmtime(path) >= older_than]
+        return paths
+
+    def cleanup(self, run_id: str = None, older_than: float = None, concurrency: int = 8,
+                retries: int = 3, dry_run: bool = False) -> dict:
+        """Delete the accounts of the selected registry files; keep the entries that could not be deleted"""
+        started = time.perf_counter()
+        due, kept = {}, {}
+        now = time.time()
+        for path in self.files(run_id, older_than):
+            for entry in read_entries(path):
+                bucket = kept if entry.get('keep_until', 0) > now else due
+                bucket.setdefault(path, []).append(entry)
+
+        entries = [entry for path_entries in due.values() for entry in path_entries]
+        failed = [] if dry_run else delete_accounts(entries, concurrency, retries)
+        if not dry_run:
+            failed_ids = {id(entry) for entry in failed}
+            for path in set(due) | set(kept):
+                remaining = kept.get(path, []) + [entry for entry in due.get(path, ()) if id(entry) in failed_ids]
+                write_entries(path, remaining)
+        return {
+            'deleted': 0 if dry_run else len(entries) - len(failed),
+            'due': len(entries),
+            'failed': len(failed),
+            'kept': sum(len(path_entries) for path_entries in kept.values()),
+            'seconds': round(time.perf_counter() - started, 2),
+        }
+
+
+def read_entries(path: str) -> list:
+    entries = []
+    with open(path, encoding="utf-8") as registry_file:
+        for line in registry_file:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue  # torn last line of a crashed worker
+    return entries
+
+
+def write_entries(path: str, entries: list):
+    """Rewrite a registry file with entries, or remove it when none are left"""
+    if not entries:
+        os.remove(path)
+        return
+    with open(f"{path}.tmp", "w", encoding="utf-8") as registry_file:
+        registry_file.writelines(json.dumps(entry) + "\n" for entry in entries)
+    os.replace(f"{path}.tmp", path)
+
+
+def delete_account(entry: dict, retries: int = 3, backoff: float = 0.5) -> bool:
+    """Delete one account, retrying transient failures; True once it is gone"""
+    for attempt in range(retries + 1):
+        try:
+            AutomationExerciseApi(entry['base_url'], timeout=15).delete_account(entry['email'], entry['password'])
+            return True
+        except (ApiError, OSError, ValueError):
+            # URLError and timeouts are OSErrors; ValueError covers non-JSON error pages
+            if attempt < retries:
+                time.sleep(backoff * 2 ** attempt)
+    return False
+
+
+def delete_accounts(entries: list, concurrency: int = 8, retries: int = 3) -> list:
+    """Delete accounts concurrently; returns the entries that could not be deleted"""
+    if not entries:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        results = list(executor.map(lambda entry: delete_account(entry, retries), entries))
+    return [entry for entry, deleted in zip(entries, results) if not deleted]
+
+
+account_registry = AccountRegistry()
+
+
+def configure_account_registry(**settings) -> AccountRegistry:
+    """Replace the process-wide registry with one built from settings"""
+    global account_registry
+    account_registry = AccountRegistry(**settings)
+    return account_registry
+
+
+def get_account_registry() -> AccountRegistry:
+    """Return the process-wide registry"""
+    return account_registry
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Delete the accounts left behind by earlier (crashed or kept) runs")
+    parser.add_argument("--registry-dir", default="playwright/.accounts", help="Account registry directory")
+    parser.add_argument("--run-id", help="Only sweep this run")
+    parser.add_argument("--older-than", type=float, default=3600,
+                        help="Only sweep registry files untouched for this many seconds (skips live runs)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Parallel delete requests")
+    parser.add_argument("--retries", type=int, default=3, help="Retries per account")
+    parser.add_argument("--dry-run", action="store_true", help="Only report what would be deleted")
+    args = parser.parse_args(argv)
+
+    result = AccountRegistry(args.registry_dir).cleanup(args.run_id, args.older_than, args.concurrency,
+                                                        args.retries, args.dry_run)
+    print(f"accounts due: {result['due']}  deleted: {result['deleted']}  failed: {result['failed']}  "
+          f"kept: {result['kept']}  ({result['seconds']}s)")
+    return 1 if result['failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
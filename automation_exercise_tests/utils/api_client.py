@@ -0,0 +1,133 @@
+"""
+Automation Exercise API Client
+
+Creates accounts and logs in over plain HTTP, so tests that only need a
+logged-in user can skip the ~20 UI actions of the registration form. The
+resulting session cookies are injected into a Playwright browser context.
+"""
+import http.cookiejar
+import json
+import re
+import urllib.parse
+import urllib.request
+
+from playwright.sync_api import BrowserContext
+
+
+CSRF_TOKEN_PATTERN = re.compile(r"name=['\"]csrfmiddlewaretoken['\"]\s+value=['\"]([^'\"]+)['\"]")
+
+
+class ApiError(Exception):
+    """Raised when the site API rejects a request"""
+
+    def __init__(self, endpoint: str, response: dict):
+        self.endpoint = endpoint
+        self.response = response
+        super().__init__(f"{endpoint} failed: {response.get('responseCode')} {response.get('message')}")
+
+
+class AutomationExerciseApi:
+    """HTTP client for the Automation Exercise API and login form"""
+
+    def __init__(self, base_url: str, timeout: float = 30):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.cookies = http.cookiejar.CookieJar()
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookies))
+
+    def _request(self, method: str, path: str, form: dict = None) -> str:
+        data = urllib.parse.urlencode(form).encode() if form is not None else None
+        request = urllib.request.Request(
+            f"{self.base_url}{path}",
+            data=data,
+            method=method,
+            headers={"Referer": f"{self.base_url}/login"},
+        )
+        with self.opener.open(request, timeout=self.timeout) as response:
+            return response.read().decode("utf-8")
+
+    def _call(self, method: str, endpoint: str, form: dict = None) -> dict:
+        return json.loads(self._request(method, endpoint, form))
+
+    def create_account(self, user_data: dict) -> dict:
+        """Create an account from generate_user_data() output"""
+        form = {
+            'name': user_data['name'],
+            'email': user_data['email'],
+            'password': user_data['password'],
+            'title': 'Mr',
+            'birth_date': user_data['day'],
+            'birth_month': user_data['month'],
+            'birth_year': user_data['year'],
+            'firstname': user_data['first_name'],
+            'lastname': user_data['last_name'],
+            'company': user_data['company'],
+            'address1': user_data['address1'],
+            'address2': user_data['address2'],
+            'country': user_data['country'],
+            'zipcode': user_data['zipcode'],
+            'state': user_data['state'],
+            'city': user_data['city'],
+            'mobile_number': user_data['mobile'],
+        }
+        response = self._call("POST", "/api/createAccount", form)
+        if response.get('responseCode') != 201:
+            raise ApiError("createAccount", response)
+        return response
+
+    def verify_login(self, email: str, password: str) -> bool:
+        """Check credentials through the API"""
+        response = self._call("POST", "/api/verifyLogin", {'email': email, 'password': password})
+        return response.get('responseCode') == 200
+
+    def delete_account(self, email: str, password: str) -> bool:
+        """Delete an account; False if it no longer exists"""
+        response = self._call("DELETE", "/api/deleteAccount", {'email': email, 'password': password})
+        if response.get('responseCode') == 404:
+            return False
+        if response.get('responseCode') != 200:
+            raise ApiError("deleteAccount", response)
+        return True
+
+    def login(self, email: str, password: str) -> list:
+        """Log in through the login form and return the session cookies"""
+        login_page = self._request("GET", "/login")
+        form = {'email': email, 'password': password}
+        token = CSRF_TOKEN_PATTERN.search(login_page)
+        if token:
+            form['csrfmiddlewaretoken'] = token.group(1)
+        self._request("POST", "/login", form)
+        return self.browser_cookies()
+
+    def browser_cookies(self) -> list:
+        """Convert the cookie jar to Playwright's add_cookies() format"""
+        cookies = []
+        for cookie in self.cookies:
+            browser_cookie = {
+                'name': cookie.name,
+                'value': cookie.value,
+                'secure': cookie.secure,
+                'httpOnly': cookie.has_nonstandard_attr('HttpOnly'),
+                'sameSite': 'Lax',
+            }
+            if cookie.domain_specified:
+                browser_cookie.update(domain=cookie.domain, path=cookie.path)
+            else:
+                browser_cookie['url'] = self.base_url
+            if cookie.expires:
+                browser_cookie['expires'] = cookie.expires
+            cookies.append(browser_cookie)
+        return cookies
+
+
+def inject_session(context: BrowserContext, cookies: list):
+    """Add session cookies to a browser context"""
+    context.add_cookies(cookies)
+
+
+def provision_account(base_url: str, context: BrowserContext, user_data: dict) -> dict:
+    """Create an account over HTTP and log the browser context in as that user"""
+    api = AutomationExerciseApi(base_url)
+    api.create_account(user_data)
+    inject_session(context, api.login(user_data['email'], user_data['password']))
+    return user_data
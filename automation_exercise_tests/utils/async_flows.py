@@ -0,0 +1,163 @@
+"""
+Concurrent Purchase Flows
+
+Runs the registration -> add to cart -> checkout journey with the async page
+objects (pages/aio). Every context is driven by its own coroutine and works
+through the queued flows one after the other, so N contexts keep N flows in
+flight on a single event loop.
+
+    python -m utils.async_flows --local-server --flows 24 --contexts 6
+"""
+import argparse
+import asyncio
+import sys
+import time
+from contextlib import nullcontext
+
+from playwright.async_api import async_playwright
+
+from pages.aio import (
+    AsyncHomePage,
+    AsyncSignupLoginPage,
+    AsyncProductsPage,
+    AsyncCartPage,
+    AsyncCheckoutPage
+)
+from utils.screenshots import configure_screenshots
+from utils.steps import set_step_backend, BACKEND_OFF
+from utils.test_data import generate_user_data, generate_payment_data, get_test_comment
+
+
+FLOW_STEPS = ("register", "add_product", "view_cart", "place_order", "pay")
+
+
+def _untimed(name: str):
+    return nullcontext()
+
+
+async def purchase_flow(page, base_url: str, user_data: dict, payment_data: dict,
+                        product_indices: tuple = (1, 2), phase=_untimed) -> str:
+    """Register, add products, check out; returns the confirmation message
+
+    phase(name) returns a context manager wrapped around each of FLOW_STEPS,
+    e.g. to time them.
+    """
+    home_page = AsyncHomePage(page, base_url)
+    signup_login_page = AsyncSignupLoginPage(page, base_url)
+    products_page = AsyncProductsPage(page, base_url)
+    cart_page = AsyncCartPage(page, base_url)
+    checkout_page = AsyncCheckoutPage(page, base_url)
+
+    with phase("register"):
+        await signup_login_page.open()
+        await signup_login_page.complete_registration(user_data)
+        assert await home_page.is_user_logged_in(user_data['name']), "User is not logged in after registration"
+
+    with phase("add_product"):
+        await products_page.open()
+        await products_page.add_multiple_products(list(product_indices))
+
+    with phase("view_cart"):
+        await products_page.click_view_cart_modal()
+        await cart_page.wait_until_ready()
+        assert await cart_page.verify_cart_items_count(len(product_indices)), \
+            f"Cart does not contain {len(product_indices)} products"
+
+    with phase("place_order"):
+        await cart_page.click_proceed_to_checkout()
+        await checkout_page.wait_until_ready()
+        await checkout_page.add_order_comment(get_test_comment())
+        await checkout_page.click_place_order()
+        await checkout_page.wait_for_element(checkout_page.NAME_ON_CARD_INPUT)
+
+    with phase("pay"):
+        await checkout_page.fill_payment_information(
+            payment_data['name_on_card'],
+            payment_data['card_number'],
+            payment_data['cvc'],
+            payment_data['expiry_month'],
+            payment_data['expiry_year']
+        )
+        await checkout_page.click_pay_and_confirm()
+        assert await checkout_page.is_order_placed(), "Order was not placed successfully"
+    return await checkout_page.get_confirmation_message()
+
+
+async def _context_worker(browser, base_url: str, queue: asyncio.Queue, results: list):
+    context = await browser.new_context(viewport={"width": 1920, "height": 1080})
+    page = await context.new_page()
+    try:
+        while True:
+            try:
+                flow_number = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            user_data = generate_user_data()
+            start = time.perf_counter()
+            result = {'flow': flow_number, 'email': user_data['email'], 'ok': True, 'error': None}
+            try:
+                await purchase_flow(page, base_url, user_data, generate_payment_data())
+            except Exception as error:
+                result['ok'] = False
+                result['error'] = f"{type(error).__name__}: {error}"
+            result['seconds'] = round(time.perf_counter() - start, 3)
+            results.append(result)
+            # Next flow starts logged out with an empty cart
+            await context.clear_cookies()
+    finally:
+        await context.close()
+
+
+async def run_purchase_flows(base_url: str, flows: int, contexts: int, headless: bool = True) -> list:
+    """Run flows purchase journeys on contexts concurrent browser contexts"""
+    queue = asyncio.Queue()
+    for flow_number in range(1, flows + 1):
+        queue.put_nowait(flow_number)
+    results = []
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+        try:
+            await asyncio.gather(*(_context_worker(browser, base_url, queue, results)
+                                   for _ in range(min(contexts, flows))))
+        finally:
+            await browser.close()
+    return sorted(results, key=lambda result: result['flow'])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run concurrent purchase flows on one event loop")
+    parser.add_argument("--flows", type=int, default=24, help="Number of purchase flows (default 24)")
+    parser.add_argument("--contexts", type=int, default=6, help="Concurrent browser contexts (default 6)")
+    parser.add_argument("--base-url", default=None, help="Site under test (default: the public site)")
+    parser.add_argument("--local-server", action="store_true", help="Run against a local stand-in server")
+    parser.add_argument("--headed", action="store_true", help="Show the browsers")
+    args = parser.parse_args(argv)
+
+    # Interleaved flows cannot share Allure's step stack or the per-test screenshot folder
+    set_step_backend(BACKEND_OFF)
+    configure_screenshots(policy="off")
+
+    server = None
+    base_url = args.base_url
+    if args.local_server:
+        from server import StandInServer
+        server = StandInServer().start()
+        base_url = server.url
+    try:
+        start = time.perf_counter()
+        results = asyncio.run(run_purchase_flows(base_url, args.flows, args.contexts, not args.headed))
+        elapsed = time.perf_counter() - start
+    finally:
+        if server:
+            server.stop()
+
+    failed = [result for result in results if not result['ok']]
+    for result in failed:
+        print(f"flow {result['flow']} ({result['email']}) failed: {result['error']}")
+    print(f"{len(results) - len(failed)}/{len(results)} flows passed in {elapsed:.1f}s "
+          f"on {args.contexts} contexts ({len(results) / elapsed:.2f} flows/s)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
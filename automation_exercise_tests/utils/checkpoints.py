@@ -0,0 +1,157 @@
+"""
+Flow Checkpoints
+
+Long flows save a checkpoint at the end of every named phase: the browser
+storage state, the page URL, the cart the server holds for the session and
+the flow's own data (user, values read on the way). A later run of the same
+test can resume from the latest checkpoint that is still valid and skip the
+phases before it, so debugging step 8 does not replay steps 1-7 every time.
+
+A checkpoint is only reused when it is younger than max_age, was taken
+against the same site, and the restored session still has the same cart on
+the server. Checkpoints of a test are removed once it passes.
+"""
+import copy
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+
+import allure
+from playwright.sync_api import Page
+
+from utils.session_cache import restore_cookies, restore_local_storage
+
+
+CHECKPOINTS_OFF = "off"
+CHECKPOINTS_SAVE = "save"
+CHECKPOINTS_RESUME = "resume"
+CHECKPOINT_MODES = (CHECKPOINTS_OFF, CHECKPOINTS_SAVE, CHECKPOINTS_RESUME)
+
+CART_ROW = re.compile(r'<tr id="product-(\d+)"')
+UNSAFE_FILE_CHARS = re.compile(r"[^\w.-]+")
+
+
+class CheckpointStore:
+    """On-disk checkpoints, one JSON file per test"""
+
+    def __init__(self, checkpoint_dir: str = "playwright/.checkpoints", max_age_seconds: float = 3600):
+        self.checkpoint_dir = checkpoint_dir
+        self.max_age_seconds = max_age_seconds
+
+    def _path(self, nodeid: str) -> str:
+        return os.path.join(self.checkpoint_dir, UNSAFE_FILE_CHARS.sub("_", nodeid)[-150:] + ".json")
+
+    def load(self, nodeid: str) -> list:
+        """Checkpoints of a test younger than max_age, oldest first"""
+        try:
+            with open(self._path(nodeid), encoding="utf-8") as checkpoint_file:
+                checkpoints = json.load(checkpoint_file)
+        except (OSError, ValueError):
+            return []
+        now = time.time()
+        return [checkpoint for checkpoint in checkpoints if now - checkpoint['saved_at'] <= self.max_age_seconds]
+
+    def save(self, nodeid: str, checkpoints: list):
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        path = self._path(nodeid)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as checkpoint_file:
+            json.dump(checkpoints, checkpoint_file)
+        os.replace(f"{path}.tmp", path)
+
+    def clear(self, nodeid: str):
+        try:
+            os.remove(self._path(nodeid))
+        except FileNotFoundError:
+            pass
+
+
+def read_server_cart(page: Page, base_url: str) -> list:
+    """Product ids in the session's server-side cart (read over HTTP, the page stays put)"""
+    response = page.context.request.get(f"{base_url.rstrip('/')}/view_cart")
+    return sorted(int(product_id) for product_id in CART_ROW.findall(response.text()))
+
+
+class FlowCheckpoints:
+    """Checkpoints of one run of one test
+
+    Use phase() for each step of the flow and skip its body when the run
+    resumed past it; keep whatever later phases need in data.
+    """
+
+    def __init__(self, store: CheckpointStore, nodeid: str, page: Page, base_url: str,
+                 mode: str = CHECKPOINTS_OFF):
+        self.store = store
+        self.nodeid = nodeid
+        self.page = page
+        self.base_url = base_url
+        self.mode = mode
+        self.data = {}
+        self.resumed_from = None
+        self._saved = []
+        self._skip = set()
+
+    def resume(self, validate=None):
+        """Restore the latest valid checkpoint (resume mode); returns its phase or None
+
+        validate(data) is called on the restored page and can reject the
+        checkpoint, e.g. when the saved user is no longer logged in.
+        """
+        if self.mode != CHECKPOINTS_RESUME:
+            return None
+        checkpoints = self.store.load(self.nodeid)
+        for index in reversed(range(len(checkpoints))):
+            checkpoint = checkpoints[index]
+            if checkpoint['base_url'] != self.base_url:
+                continue
+            restore_cookies(self.page.context, checkpoint['storage_state'])
+            if read_server_cart(self.page, self.base_url) != checkpoint['cart']:
+                # The server no longer holds this session's cart; an earlier checkpoint may still match
+                self.page.context.clear_cookies()
+                continue
+            self.page.goto(checkpoint['url'])
+            restore_local_storage(self.page, checkpoint['storage_state'])
+            if validate is not None and not validate(checkpoint['data']):
+                self.page.context.clear_cookies()
+                continue
+            self.data = copy.deepcopy(checkpoint['data'])
+            self._saved = checkpoints[:index + 1]
+            self._skip = {saved['phase'] for saved in self._saved}
+            self.resumed_from = checkpoint['phase']
+            resumed = {'phase': checkpoint['phase'], 'url': checkpoint['url'], 'cart': checkpoint['cart'],
+                       'age_seconds': round(time.time() - checkpoint['saved_at'])}
+            allure.attach(json.dumps(resumed, indent=2), name="Resumed from checkpoint",
+                          attachment_type=allure.attachment_type.JSON)
+            return self.resumed_from
+        return None
+
+    def save(self, phase: str):
+        """Checkpoint the end of a phase"""
+        if self.mode == CHECKPOINTS_OFF:
+            return
+        self._saved.append({
+            'phase': phase,
+            'saved_at': time.time(),
+            'base_url': self.base_url,
+            'url': self.page.url,
+            'storage_state': self.page.context.storage_state(),
+            'cart': read_server_cart(self.page, self.base_url),
+            'data': copy.deepcopy(self.data),
+        })
+        self.store.save(self.nodeid, self._saved)
+
+    @contextmanager
+    def phase(self, title: str):
+        """allure.step(title) that checkpoints on success; yields False when resumed past it"""
+        with allure.step(title if title not in self._skip else f"{title} (restored from checkpoint)"):
+            if title in self._skip:
+                yield False
+                return
+            yield True
+            self.save(title)
+
+    def finish(self, passed: bool):
+        """Drop the test's checkpoints once it passes"""
+        if passed and self.mode != CHECKPOINTS_OFF:
+            self.store.clear(self.nodeid)
@@ -0,0 +1,108 @@
+"""
+Warm Browser Context Pool
+
+Keeps pre-created browser contexts (each with one open page) for a
+session-scoped browser. Tests check a page out, and on return the context
+is reset - cookies cleared, storage wiped, navigated to about:blank - and
+put back for the next test.
+
+Playwright's sync API is bound to the thread that started it, so contexts
+cannot be created on a helper thread. Instead the pool is warmed up front
+and refilled as soon as a context is returned or discarded, which keeps
+creation off the critical path of the next test.
+"""
+from collections import deque
+
+from playwright.sync_api import Browser, Error, Page
+
+
+CLEAR_STORAGE_SCRIPT = """() => {
+    try { window.localStorage.clear(); } catch (e) {}
+    try { window.sessionStorage.clear(); } catch (e) {}
+}"""
+
+
+class ContextPool:
+    """Pool of pre-warmed browser contexts and pages"""
+
+    def __init__(self, browser: Browser, context_args: dict, size: int):
+        self.browser = browser
+        self.context_args = context_args
+        self.size = size
+        self._idle = deque()
+        self._leased = set()
+        self._unused = set()
+        # first_use: a warm context checked out for the first time; reused: one checked out again after a reset
+        self.stats = {'created': 0, 'first_use': 0, 'reused': 0, 'discarded': 0}
+
+    def _create(self) -> Page:
+        context = self.browser.new_context(**self.context_args)
+        page = context.new_page()
+        self.stats['created'] += 1
+        return page
+
+    def warm(self):
+        """Create idle contexts until the pool is full"""
+        while len(self._idle) + len(self._leased) < self.size:
+            page = self._create()
+            self._unused.add(page)
+            self._idle.append(page)
+        return self
+
+    def acquire(self) -> Page:
+        """Check out a ready page (creating one if the pool is exhausted)"""
+        if self._idle:
+            page = self._idle.popleft()
+            if page in self._unused:
+                self._unused.discard(page)
+                self.stats['first_use'] += 1
+            else:
+                self.stats['reused'] += 1
+        else:
+            page = self._create()
+        self._leased.add(page)
+        return page
+
+    def release(self, page: Page):
+        """Reset a checked-out page and return it to the pool"""
+        self._leased.discard(page)
+        if self._reset(page) and len(self._idle) < self.size:
+            self._idle.append(page)
+        else:
+            self._discard(page)
+        self.warm()
+
+    def _reset(self, page: Page) -> bool:
+        """Wipe per-test state; returns False if the context cannot be reused"""
+        try:
+            context = page.context
+            for other in context.pages:
+                if other != page:
+                    other.close()
+            context.clear_cookies()
+            context.clear_permissions()
+            page.evaluate(CLEAR_STORAGE_SCRIPT)
+            page.goto("about:blank")
+            # localStorage of origins other than the last one cannot be
+            # cleared without navigating there; start fresh instead
+            return not context.storage_state()["origins"]
+        except Error:
+            return False
+
+    def _discard(self, page: Page):
+        self.stats['discarded'] += 1
+        try:
+            page.context.close()
+        except Error:
+            pass
+
+    def close(self):
+        """Close every context owned by the pool"""
+        for page in list(self._idle) + list(self._leased):
+            try:
+                page.context.close()
+            except Error:
+                pass
+        self._idle.clear()
+        self._leased.clear()
+        self._unused.clear()
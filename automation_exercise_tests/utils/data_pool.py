@@ -0,0 +1,172 @@
+"""
+Pre-generated Test Data Pool
+
+Users and payment records are generated in bulk from a seed and stored as
+fixed-width records in one file, which is memory-mapped and read by index.
+Handing out a record is O(1) and needs no Faker; Faker is only imported when
+the file is missing or was built with a different seed, size or layout.
+
+Records cycle when the pool is exhausted; names and emails stay unique within
+a run because they carry the worker-aware unique ID.
+"""
+import json
+import mmap
+import os
+import random
+import threading
+
+from utils.workers import next_unique_id
+
+
+POOL_VERSION = 1
+USER_FIELDS = ('first_name', 'last_name', 'company', 'address1', 'address2', 'state',
+               'city', 'zipcode', 'mobile', 'day', 'month', 'year', 'name_on_card')
+HEADER_SIZE = 256
+RECORD_SIZE = 512
+
+
+def generate_records(seed: int, size: int) -> list:
+    """Build size records with Faker, deterministic for the seed"""
+    from faker import Faker
+
+    fake = Faker()
+    fake.seed_instance(seed)
+    rng = random.Random(seed)
+    return [[
+        fake.first_name(),
+        fake.last_name(),
+        fake.company(),
+        fake.street_address(),
+        fake.secondary_address(),
+        fake.state(),
+        fake.city(),
+        fake.zipcode(),
+        fake.numerify(text='##########'),
+        str(rng.randint(1, 28)),
+        str(rng.randint(1, 12)),
+        str(rng.randint(1970, 2000)),
+        fake.name(),
+    ] for _ in range(size)]
+
+
+def write_pool(path: str, seed: int, size: int):
+    """Generate the pool and write it atomically (safe with parallel workers)"""
+    header = json.dumps({'version': POOL_VERSION, 'seed': seed, 'size': size,
+                         'fields': USER_FIELDS}).encode("utf-8")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as pool_file:
+        pool_file.write(header.ljust(HEADER_SIZE - 1) + b"\n")
+        for record in generate_records(seed, size):
+            encoded = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            if len(encoded) >= RECORD_SIZE:
+                raise ValueError(f"Pool record exceeds {RECORD_SIZE} bytes: {record}")
+            pool_file.write(encoded.ljust(RECORD_SIZE - 1) + b"\n")
+    os.replace(temp_path, path)
+
+
+class DataPool:
+    """Memory-mapped pool of pre-generated user records"""
+
+    def __init__(self, pool_dir: str = "playwright/.data", seed: int = 1234, size: int = 1000):
+        self.seed = seed
+        self.size = size
+        self.path = os.path.join(pool_dir, f"pool-{seed}-{size}.dat")
+        self._map = None
+        self._cursor = 0
+        self._lock = threading.Lock()
+
+    def _is_current(self) -> bool:
+        try:
+            with open(self.path, "rb") as pool_file:
+                header = json.loads(pool_file.read(HEADER_SIZE))
+        except (OSError, ValueError):
+            return False
+        return (header.get('version') == POOL_VERSION and header.get('seed') == self.seed
+                and header.get('size') == self.size and tuple(header.get('fields', ())) == USER_FIELDS)
+
+    def open(self):
+        """Map the pool file, regenerating it first if it is missing or stale"""
+        if self._map is not None:
+            return
+        if not self._is_current():
+            write_pool(self.path, self.seed, self.size)
+        with open(self.path, "rb") as pool_file:
+            self._map = mmap.mmap(pool_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def record(self, index: int) -> dict:
+        """Return the record at index (wrapping around the pool)"""
+        self.open()
+        offset = HEADER_SIZE + (index % self.size) * RECORD_SIZE
+        return dict(zip(USER_FIELDS, json.loads(self._map[offset:offset + RECORD_SIZE])))
+
+    def seek(self, index: int) -> int:
+        """Continue handing out records from index (wrapping around the pool)
+
+        Returns the previous cursor, so the position can be restored.
+        """
+        with self._lock:
+            previous, self._cursor = self._cursor, index % self.size
+        return previous
+
+    def next_record(self) -> dict:
+        """Return the next record in pool order"""
+        with self._lock:
+            index = self._cursor
+            self._cursor += 1
+        return self.record(index)
+
+    def next_user(self, unique_id: str = None) -> dict:
+        """Registration data in the shape of generate_user_data()"""
+        record = self.next_record()
+        unique_id = unique_id or next_unique_id()
+        first_name, last_name = record['first_name'], record['last_name']
+        return {
+            'name': f"{first_name} {last_name} {unique_id}",
+            'email': f"{first_name.lower()}.{last_name.lower()}.{unique_id}@testmail.com",
+            'password': 'Test@123456',
+            'day': record['day'],
+            'month': record['month'],
+            'year': record['year'],
+            'first_name': first_name,
+            'last_name': last_name,
+            'company': record['company'],
+            'address1': record['address1'],
+            'address2': record['address2'],
+            'country': 'India',
+            'state': record['state'],
+            'city': record['city'],
+            'zipcode': record['zipcode'],
+            'mobile': record['mobile']
+        }
+
+    def next_payment(self) -> dict:
+        """Payment card data in the shape of generate_payment_data()"""
+        return {
+            'name_on_card': self.next_record()['name_on_card'],
+            'card_number': '4532015112830366',  # Test card number
+            'cvc': '123',
+            'expiry_month': '12',
+            'expiry_year': '2027'
+        }
+
+
+data_pool = DataPool()
+
+
+def configure_data_pool(**settings) -> DataPool:
+    """Replace the process-wide pool with one built from settings"""
+    global data_pool
+    data_pool.close()
+    data_pool = DataPool(**settings)
+    return data_pool
+
+
+def get_data_pool() -> DataPool:
+    """Return the process-wide pool"""
+    return data_pool
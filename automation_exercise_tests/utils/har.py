@@ -0,0 +1,116 @@
+"""
+HAR Record and Replay
+
+record: every test's network traffic is written to <har_dir>/<test>.har.
+replay: every request of the test is answered from that archive through
+route interception; requests missing from it are aborted or sent to the
+network (not_found="fallback").
+
+Bodies are stored as separate files named by their SHA-1 next to the
+archives, so a body shared by many tests (scripts, styles, images) is
+stored once. The manifest keeps the run id and data seed of the recording:
+replaying regenerates the same user data per test, so form posts match the
+recorded requests.
+"""
+import hashlib
+import json
+import os
+import re
+from contextlib import contextmanager
+
+from playwright.sync_api import BrowserContext
+
+from utils.data_pool import DataPool, get_data_pool
+from utils.workers import configure_unique_ids, restore_unique_ids, MASTER_WORKER_ID
+
+
+HAR_OFF = "off"
+HAR_RECORD = "record"
+HAR_REPLAY = "replay"
+HAR_MODES = (HAR_OFF, HAR_RECORD, HAR_REPLAY)
+NOT_FOUND_ACTIONS = ("abort", "fallback")
+
+MANIFEST = "manifest.json"
+UNSAFE_FILE_CHARS = re.compile(r"[^\w.-]+")
+
+
+class HarArchive:
+    """Directory of per-test HAR files sharing deduplicated bodies"""
+
+    def __init__(self, har_dir: str, mode: str = HAR_OFF, not_found: str = "abort"):
+        self.har_dir = har_dir
+        self.mode = mode
+        self.not_found = not_found
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != HAR_OFF
+
+    def path_for(self, nodeid: str) -> str:
+        """HAR file of a test"""
+        return os.path.join(self.har_dir, UNSAFE_FILE_CHARS.sub("_", nodeid)[-150:] + ".har")
+
+    def attach(self, context: BrowserContext, nodeid: str):
+        """Record into, or replay from, the test's HAR (before the first request)"""
+        path = self.path_for(nodeid)
+        if self.mode == HAR_RECORD:
+            os.makedirs(self.har_dir, exist_ok=True)
+            # Written when the context closes; minimal mode leaves out timings and cookies
+            context.route_from_har(path, update=True, update_content="attach", update_mode="minimal")
+        elif self.mode == HAR_REPLAY:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"No HAR recorded for {nodeid} ({path}); record it with --har record")
+            context.route_from_har(path, not_found=self.not_found)
+
+    def read_manifest(self) -> dict:
+        """Settings of the recording run ({} if nothing was recorded)"""
+        try:
+            with open(os.path.join(self.har_dir, MANIFEST), encoding="utf-8") as manifest_file:
+                return json.load(manifest_file)
+        except FileNotFoundError:
+            return {}
+
+    def write_manifest(self, **settings):
+        os.makedirs(self.har_dir, exist_ok=True)
+        path = os.path.join(self.har_dir, MANIFEST)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as manifest_file:
+            json.dump(settings, manifest_file, indent=2, sort_keys=True)
+        os.replace(f"{path}.tmp", path)
+
+    def prune(self) -> int:
+        """Delete body files no HAR references any more; returns how many"""
+        if not os.path.isdir(self.har_dir):
+            return 0
+        referenced = set()
+        bodies = []
+        for file_name in os.listdir(self.har_dir):
+            path = os.path.join(self.har_dir, file_name)
+            if file_name.endswith(".har"):
+                with open(path, encoding="utf-8") as har_file:
+                    referenced.update(re.findall(r'"_file"\s*:\s*"([^"]+)"', har_file.read()))
+            elif file_name != MANIFEST:
+                bodies.append(file_name)
+        removed = 0
+        for file_name in bodies:
+            if file_name not in referenced:
+                os.remove(os.path.join(self.har_dir, file_name))
+                removed += 1
+        return removed
+
+
+@contextmanager
+def seed_test_data(run_id: str, nodeid: str, pool: DataPool = None):
+    """Make the test's unique IDs and pool records depend only on run id and test
+
+    Only inside the block: the previous ID allocator and pool cursor are put
+    back afterwards, so the rest of the run keeps allocating unique IDs.
+    """
+    pool = pool or get_data_pool()
+    digest = hashlib.sha1(f"{run_id}:{nodeid}".encode("utf-8")).hexdigest()
+    previous_allocator = configure_unique_ids(digest, MASTER_WORKER_ID)
+    previous_cursor = pool.seek(int(digest[6:14], 16))
+    try:
+        yield
+    finally:
+        restore_unique_ids(previous_allocator)
+        pool.seek(previous_cursor)
@@ -0,0 +1,157 @@
+"""
+Hot-path Timing Instrumentation
+
+When enabled, every @step call (BasePage primitives and page-object
+methods) is timed: wall time, time spent inside explicit waits, and the
+overhead added by step reporting. At session end the records are exported
+as JSON with percentiles per action and per locator.
+
+Compare two runs:
+    python -m utils.instrumentation reports/timings/base.json reports/timings/master.json --threshold 0.2
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _aggregate(records: list, key: str) -> dict:
+    grouped = defaultdict(list)
+    for record in records:
+        if record.get(key):
+            grouped[record[key]].append(record)
+
+    summary = {}
+    for name, group in sorted(grouped.items()):
+        durations = sorted(record['seconds'] for record in group)
+        total = sum(durations)
+        waited = sum(record['wait_seconds'] for record in group)
+        summary[name] = {
+            'count': len(group),
+            'total': round(total, 4),
+            'p50': round(percentile(durations, 0.50), 4),
+            'p90': round(percentile(durations, 0.90), 4),
+            'p99': round(percentile(durations, 0.99), 4),
+            'max': round(durations[-1], 4),
+            'wait_share': round(waited / total, 3) if total else 0.0,
+            'overhead': round(sum(record['overhead_seconds'] for record in group), 4),
+        }
+    return summary
+
+
+class Instrumentation:
+    """Records the duration and wait share of instrumented calls"""
+
+    def __init__(self):
+        self.enabled = False
+        self.records = []
+        self._stack = []
+
+    def reset(self):
+        self.records = []
+        self._stack = []
+
+    @contextmanager
+    def measure(self, action: str, locator: str = None):
+        """Time an action; the yielded record can receive the inner duration"""
+        record = {'action': action, 'locator': locator, 'seconds': 0.0,
+                  'wait_seconds': 0.0, 'overhead_seconds': 0.0, 'inner': None}
+        self._stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            if record['inner'] is not None:
+                record['overhead_seconds'] = max(0.0, record['seconds'] - record['inner'])
+            del record['inner']
+            self._stack.pop()
+            self.records.append(record)
+
+    @contextmanager
+    def waiting(self):
+        """Mark a block as waiting; counted for every enclosing action"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            waited = time.perf_counter() - start
+            for record in self._stack:
+                record['wait_seconds'] += waited
+
+    def summary(self) -> dict:
+        """Percentiles per action and per locator"""
+        return {
+            'by_action': _aggregate(self.records, 'action'),
+            'by_locator': _aggregate(self.records, 'locator'),
+        }
+
+    def export(self, path: str, environment: dict = None):
+        """Write records and summary (and the run's environment, e.g. its profile) as JSON"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as timings_file:
+            json.dump({'environment': environment or {}, 'summary': self.summary(), 'records': self.records},
+                      timings_file, indent=2)
+
+
+instrumentation = Instrumentation()
+
+
+def find_regressions(baseline: dict, current: dict, threshold: float, metric: str = 'p50',
+                     min_seconds: float = 0.005) -> list:
+    """Actions whose metric grew by more than threshold (a fraction) over the baseline"""
+    regressions = []
+    base_actions = baseline['summary']['by_action']
+    for action, stats in current['summary']['by_action'].items():
+        base = base_actions.get(action)
+        if base is None or stats[metric] < min_seconds:
+            continue
+        if base[metric] == 0 or (stats[metric] - base[metric]) / base[metric] > threshold:
+            regressions.append((action, base[metric], stats[metric]))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Diff two instrumentation exports")
+    parser.add_argument("baseline", help="JSON export of the reference run")
+    parser.add_argument("current", help="JSON export of the run to check")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed relative slowdown, e.g. 0.2 for 20%% (default)")
+    parser.add_argument("--metric", choices=["p50", "p90", "p99", "max"], default="p50",
+                        help="Statistic to compare (default p50)")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, encoding="utf-8") as baseline_file:
+        baseline = json.load(baseline_file)
+    with open(args.current, encoding="utf-8") as current_file:
+        current = json.load(current_file)
+
+    profiles = [export.get('environment', {}).get('profile') for export in (baseline, current)]
+    if profiles[0] != profiles[1]:
+        print(f"WARNING: comparing runs of different profiles: {profiles[0]} vs {profiles[1]}")
+    regressions = find_regressions(baseline, current, args.threshold, args.metric)
+    for action, before, after in regressions:
+        change = f"+{(after - before) / before:.0%}" if before else "new cost"
+        print(f"REGRESSED {action}: {args.metric} {before * 1000:.1f} ms -> {after * 1000:.1f} ms ({change})")
+    if not regressions:
+        print(f"No action regressed by more than {args.threshold:.0%} ({args.metric})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
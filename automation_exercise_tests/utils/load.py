@@ -0,0 +1,164 @@
+"""
+Load Generation
+
+Replays the purchase journey of TestCompletePurchaseFlow with virtual users
+(VUs) against the local stand-in server. Each VU owns one headless browser
+context for the whole run (cookies are cleared between iterations), starts
+after its share of the ramp-up and repeats the journey until the duration
+is over. Throughput and p50/p95/p99 latency are reported per step.
+
+    python -m utils.load --users 10 --ramp-up 5 --duration 60
+    python -m utils.load --users 4 --duration 30 --base-url http://staging-clone:8000
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from playwright.async_api import async_playwright
+
+from utils.async_flows import FLOW_STEPS, purchase_flow
+from utils.instrumentation import percentile
+from utils.screenshots import configure_screenshots
+from utils.steps import set_step_backend, BACKEND_OFF
+from utils.test_data import generate_user_data, generate_payment_data
+
+
+class LoadStats:
+    """Per-step latency samples and errors of a load run"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.iterations = 0
+        self.failed_iterations = 0
+        self.started = None
+        self.finished = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time one step of an iteration; failures count as errors of that step"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.errors[name] += 1
+            raise
+        self.samples[name].append(time.perf_counter() - start)
+
+    def summary(self) -> dict:
+        """Throughput and latency percentiles per step"""
+        elapsed = (self.finished or time.perf_counter()) - (self.started or time.perf_counter())
+        completed = self.iterations - self.failed_iterations
+        steps = {}
+        for name in FLOW_STEPS:
+            durations = sorted(self.samples[name])
+            steps[name] = {
+                'count': len(durations),
+                'errors': self.errors[name],
+                'throughput': round(len(durations) / elapsed, 3) if elapsed else 0.0,
+                'p50': round(percentile(durations, 0.50), 4),
+                'p95': round(percentile(durations, 0.95), 4),
+                'p99': round(percentile(durations, 0.99), 4),
+                'max': round(durations[-1], 4) if durations else 0.0,
+            }
+        return {
+            'elapsed': round(elapsed, 2),
+            'iterations': self.iterations,
+            'failed_iterations': self.failed_iterations,
+            'throughput': round(completed / elapsed, 3) if elapsed else 0.0,
+            'steps': steps,
+        }
+
+
+async def _virtual_user(browser, base_url: str, start_delay: float, deadline: float,
+                        think_time: float, stats: LoadStats):
+    await asyncio.sleep(start_delay)
+    context = await browser.new_context(viewport={"width": 1920, "height": 1080})
+    page = await context.new_page()
+    try:
+        while time.perf_counter() < deadline:
+            stats.iterations += 1
+            try:
+                await purchase_flow(page, base_url, generate_user_data(), generate_payment_data(),
+                                    phase=stats.phase)
+            except Exception:
+                stats.failed_iterations += 1
+            await context.clear_cookies()
+            if think_time:
+                await asyncio.sleep(think_time)
+    finally:
+        await context.close()
+
+
+async def run_load(base_url: str, users: int, ramp_up: float, duration: float,
+                   think_time: float = 0.0) -> LoadStats:
+    """Run users VUs, started evenly over ramp_up seconds, for duration seconds"""
+    stats = LoadStats()
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=True)
+        try:
+            stats.started = time.perf_counter()
+            deadline = stats.started + duration
+            await asyncio.gather(*(
+                _virtual_user(browser, base_url, ramp_up * number / users, deadline, think_time, stats)
+                for number in range(users)
+            ))
+            stats.finished = time.perf_counter()
+        finally:
+            await browser.close()
+    return stats
+
+
+def format_summary(summary: dict) -> str:
+    lines = [f"{summary['iterations']} iterations ({summary['failed_iterations']} failed) in "
+             f"{summary['elapsed']}s -> {summary['throughput']} journeys/s",
+             f"{'step':<12} {'count':>6} {'errors':>6} {'per s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"]
+    for name, stats in summary['steps'].items():
+        lines.append(f"{name:<12} {stats['count']:>6} {stats['errors']:>6} {stats['throughput']:>7} "
+                     f"{stats['p50'] * 1000:>8.0f} {stats['p95'] * 1000:>8.0f} {stats['p99'] * 1000:>8.0f}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test the purchase journey")
+    parser.add_argument("--users", type=int, default=5, help="Virtual users (default 5)")
+    parser.add_argument("--ramp-up", type=float, default=5.0, help="Seconds to start all users (default 5)")
+    parser.add_argument("--duration", type=float, default=60.0, help="Run length in seconds (default 60)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pause between iterations of a user")
+    parser.add_argument("--base-url", default=None,
+                        help="Stand-in server to load (default: start a local one)")
+    parser.add_argument("--output", default="reports/load/summary.json", help="Where to write the summary")
+    args = parser.parse_args(argv)
+
+    set_step_backend(BACKEND_OFF)
+    configure_screenshots(policy="off")
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        from server import StandInServer
+        server = StandInServer().start()
+        base_url = server.url
+    try:
+        stats = asyncio.run(run_load(base_url, args.users, args.ramp_up, args.duration, args.think_time))
+    finally:
+        if server:
+            server.stop()
+
+    summary = stats.summary()
+    summary['config'] = {'base_url': base_url, 'users': args.users, 'ramp_up': args.ramp_up,
+                         'duration': args.duration, 'think_time': args.think_time}
+    print(format_summary(summary))
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as summary_file:
+        json.dump(summary, summary_file, indent=2)
+    return 1 if summary['failed_iterations'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Locator Cache
+
+Page objects ask the cache of their page for Locator objects instead of
+calling page.locator() on every action. One cache is shared by all page
+objects of a page; it is cleared when the main frame navigates or a frame
+is detached, and counts hits, misses and invalidations.
+
+What it saves is small and purely client-side: Locators are lazy, so
+page.locator() (and .nth()) only build a Python object around the selector
+without talking to the browser, and every action on a Locator still
+resolves it in the page. The cache saves rebuilding those objects on every
+action; it saves no element lookups. Because a Locator re-resolves on use,
+a cached one never points at a stale element; clearing on navigation just
+keeps the cache to the selectors of the current document.
+"""
+from playwright.sync_api import Frame, Locator, Page
+
+
+class CacheStats:
+    """Hit/miss/invalidation counters"""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def snapshot(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+# Totals over every page of this process, for the session report
+locator_cache_totals = CacheStats()
+
+
+class LocatorCache:
+    """Locator objects of one page, keyed by selector (and child index)"""
+
+    def __init__(self, page: Page, totals: CacheStats = None):
+        self.page = page
+        self.stats = CacheStats()
+        self.totals = totals if totals is not None else locator_cache_totals
+        self._locators = {}
+        page.on("framenavigated", self._on_frame_navigated)
+        page.on("framedetached", self._on_frame_detached)
+
+    @classmethod
+    def for_page(cls, page: Page) -> "LocatorCache":
+        """Return the page's cache, creating it on first use"""
+        cache = getattr(page, "_ae_locator_cache", None)
+        if cache is None:
+            cache = cls(page)
+            page._ae_locator_cache = cache
+        return cache
+
+    def _lookup(self, key, build) -> Locator:
+        locator = self._locators.get(key)
+        if locator is not None:
+            self.stats.hits += 1
+            self.totals.hits += 1
+            return locator
+        self.stats.misses += 1
+        self.totals.misses += 1
+        locator = self._locators[key] = build()
+        return locator
+
+    def get(self, selector: str) -> Locator:
+        """Locator for selector"""
+        return self._lookup(selector, lambda: self.page.locator(selector))
+
+    def nth(self, selector: str, index: int) -> Locator:
+        """Locator for the index-th (0-based) match of selector"""
+        return self._lookup((selector, index), lambda: self.page.locator(selector).nth(index))
+
+    def invalidate(self):
+        """Drop every cached locator"""
+        if self._locators:
+            self._locators.clear()
+            self.stats.invalidations += 1
+            self.totals.invalidations += 1
+
+    def _on_frame_navigated(self, frame: Frame):
+        if frame == self.page.main_frame:
+            self.invalidate()
+
+    def _on_frame_detached(self, frame: Frame):
+        self.invalidate()
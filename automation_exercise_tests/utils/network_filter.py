@@ -0,0 +1,170 @@
+"""
+Network Request Filter
+
+Intercepts every request of a browser context and blocks the ones no test
+assertion needs (ad networks, trackers, heavy media), so pages settle
+sooner. Analytics endpoints are answered with an empty stub instead of an
+error, which keeps the site's scripts from failing. Counters record how
+many requests - and roughly how many bytes - were saved.
+
+Routing has a cost of its own: while a context has a route handler,
+Playwright disables the browser's HTTP cache for it, so every allowed
+request goes to the network again, even within one test. Compare runs with
+and without --network-filter before relying on it to speed a suite up.
+"""
+import threading
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Response, Route
+
+
+DEFAULT_DENY_DOMAINS = (
+    "googlesyndication.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "googleadservices.com",
+    "fundingchoicesmessages.google.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "criteo.com",
+    "facebook.net",
+)
+
+DEFAULT_STUB_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+)
+
+# Fallback response sizes (bytes) used until real sizes are observed
+DEFAULT_SIZE_ESTIMATES = {
+    'document': 30000,
+    'script': 50000,
+    'stylesheet': 20000,
+    'image': 30000,
+    'media': 500000,
+    'font': 40000,
+    'xhr': 2000,
+    'fetch': 2000,
+}
+
+
+def _matches_domain(host: str, domains) -> bool:
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+class FilterStats:
+    """Thread-safe counters for filtered traffic"""
+
+    COUNTERS = ('allowed', 'blocked', 'stubbed', 'bytes_allowed')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = dict.fromkeys(self.COUNTERS, 0)
+        self.blocked_by_type = defaultdict(int)
+        self._observed_sizes = defaultdict(lambda: [0, 0])
+
+    def record(self, action: str, resource_type: str):
+        with self._lock:
+            self.counts[action] += 1
+            if action != 'allowed':
+                self.blocked_by_type[resource_type] += 1
+
+    def record_response_size(self, resource_type: str, size: int):
+        with self._lock:
+            self.counts['bytes_allowed'] += size
+            observed = self._observed_sizes[resource_type]
+            observed[0] += size
+            observed[1] += 1
+
+    def _average_size(self, resource_type: str) -> int:
+        total, count = self._observed_sizes.get(resource_type, (0, 0))
+        if count:
+            return total // count
+        return DEFAULT_SIZE_ESTIMATES.get(resource_type, 5000)
+
+    def snapshot(self) -> dict:
+        """Return the current counters"""
+        with self._lock:
+            blocked_by_type = dict(self.blocked_by_type)
+            snapshot = dict(self.counts)
+            snapshot['estimated_bytes_saved'] = sum(
+                count * self._average_size(resource_type)
+                for resource_type, count in blocked_by_type.items()
+            )
+        snapshot['blocked_by_type'] = blocked_by_type
+        return snapshot
+
+    def since(self, earlier: dict) -> dict:
+        """Return the counters accumulated after an earlier snapshot"""
+        current = self.snapshot()
+        delta = {key: current[key] - earlier[key]
+                 for key in self.COUNTERS + ('estimated_bytes_saved',)}
+        delta['blocked_by_type'] = {
+            resource_type: count - earlier['blocked_by_type'].get(resource_type, 0)
+            for resource_type, count in current['blocked_by_type'].items()
+            if count != earlier['blocked_by_type'].get(resource_type, 0)
+        }
+        return delta
+
+
+class NetworkFilter:
+    """Allow/deny request filter attached to browser contexts via route interception"""
+
+    def __init__(self, deny_domains=DEFAULT_DENY_DOMAINS, allow_domains=(),
+                 block_resource_types=(), stub_domains=DEFAULT_STUB_DOMAINS):
+        self.deny_domains = tuple(deny_domains)
+        self.allow_domains = tuple(allow_domains)
+        self.block_resource_types = tuple(block_resource_types)
+        self.stub_domains = tuple(stub_domains)
+        self.stats = FilterStats()
+
+    def decide(self, url: str, resource_type: str) -> str:
+        """Return 'allowed', 'blocked' or 'stubbed' for a request"""
+        host = urlsplit(url).hostname or ""
+        if not host:
+            return 'allowed'
+        if _matches_domain(host, self.stub_domains):
+            return 'stubbed'
+        if _matches_domain(host, self.deny_domains):
+            return 'blocked'
+        if self.allow_domains and not _matches_domain(host, self.allow_domains):
+            return 'blocked'
+        if resource_type in self.block_resource_types:
+            return 'blocked'
+        return 'allowed'
+
+    def handle(self, route: Route):
+        """Route handler: continue, abort or stub the request"""
+        request = route.request
+        action = self.decide(request.url, request.resource_type)
+        self.stats.record(action, request.resource_type)
+        if action == 'allowed':
+            route.continue_()
+        elif action == 'stubbed':
+            content_type = "application/javascript" if request.resource_type == "script" else "text/plain"
+            route.fulfill(status=200, body="", content_type=content_type)
+        else:
+            route.abort("blockedbyclient")
+
+    def _on_response(self, response: Response):
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.stats.record_response_size(response.request.resource_type, int(length))
+
+    def attach(self, context: BrowserContext):
+        """Start filtering a context (idempotent, so pooled contexts are safe)
+
+        The "**/*" route turns off the context's HTTP cache.
+        """
+        if getattr(context, "_ae_network_filter", None) is self:
+            return
+        context.route("**/*", self.handle)
+        context.on("response", self._on_response)
+        context._ae_network_filter = self
+
+
+def parse_list_option(value: str) -> tuple:
+    """Split a comma separated command line value"""
+    return tuple(item.strip() for item in (value or "").split(",") if item.strip())
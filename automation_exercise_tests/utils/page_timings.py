@@ -0,0 +1,54 @@
+"""
+Page Load Timings
+
+Records how long each page object navigation took and with which wait
+strategy, so readiness-based waits can be compared with networkidle.
+"""
+import json
+import os
+import statistics
+import threading
+from collections import defaultdict
+
+
+class PageTimings:
+    """Collects navigation durations per page object"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.records = []
+
+    def record(self, page_name: str, url: str, strategy: str, seconds: float):
+        """Store one navigation timing"""
+        with self._lock:
+            self.records.append({
+                'page': page_name,
+                'url': url,
+                'strategy': strategy,
+                'seconds': round(seconds, 4),
+            })
+
+    def summary(self) -> dict:
+        """Aggregate timings per (page, strategy)"""
+        grouped = defaultdict(list)
+        with self._lock:
+            for record in self.records:
+                grouped[f"{record['page']} [{record['strategy']}]"].append(record['seconds'])
+        return {
+            name: {
+                'count': len(values),
+                'mean': round(statistics.fmean(values), 4),
+                'median': round(statistics.median(values), 4),
+                'max': round(max(values), 4),
+            }
+            for name, values in sorted(grouped.items())
+        }
+
+    def save(self, path: str):
+        """Write raw records and the summary as JSON"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as timings_file:
+            json.dump({'summary': self.summary(), 'records': self.records}, timings_file, indent=2)
+
+
+page_timings = PageTimings()
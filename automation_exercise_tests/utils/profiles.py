@@ -0,0 +1,98 @@
+"""
+Execution Profiles
+
+A profile bundles the browser, capture and reporting settings of one kind
+of run, so a single --profile (or AE_PROFILE) switches all of them:
+
+- local:   the classic defaults; headed, slowed down, videos of failures
+- debug:   headed and slowed down, with everything recorded
+- ci-fast: headless at full speed, artifacts only for failures (ring
+           tracing: the trace of the last steps before a failure)
+- perf:    headless at full speed with capture and step reporting off,
+           for timings that measure the site rather than the framework
+
+Options given explicitly still win over the profile. The resolved profile
+is written to the Allure environment and the timing exports, so runs are
+only compared with runs of the same profile.
+"""
+import os
+from dataclasses import asdict, dataclass
+
+from utils.screenshots import POLICY_ALWAYS, POLICY_ON_FAILURE, POLICY_OFF
+from utils.steps import BACKEND_ALLURE, BACKEND_TOP_LEVEL, BACKEND_OFF
+from utils.video_policy import VIDEO_ON, VIDEO_OFF, VIDEO_RETAIN_ON_FAILURE
+
+
+# Profile tracing is a pytest-playwright --tracing mode, or ring for --ring-tracing
+TRACING_RING = "ring"
+
+
+@dataclass(frozen=True)
+class Profile:
+    """Settings bundled under one name"""
+
+    name: str
+    headed: bool
+    slowmo: int
+    viewport: str
+    video_policy: str
+    screenshot_policy: str
+    tracing: str
+    step_backend: str
+
+    def describe(self) -> str:
+        return (f"{self.name} ({'headed' if self.headed else 'headless'}, slowmo {self.slowmo}ms, "
+                f"viewport {self.viewport}, video {self.video_policy}, screenshots {self.screenshot_policy}, "
+                f"tracing {self.tracing}, steps {self.step_backend})")
+
+
+PROFILES = {profile.name: profile for profile in (
+    Profile("local", headed=True, slowmo=500, viewport="1920x1080", video_policy=VIDEO_RETAIN_ON_FAILURE,
+            screenshot_policy=POLICY_ALWAYS, tracing="off", step_backend=BACKEND_ALLURE),
+    Profile("debug", headed=True, slowmo=500, viewport="1920x1080", video_policy=VIDEO_ON,
+            screenshot_policy=POLICY_ALWAYS, tracing="on", step_backend=BACKEND_ALLURE),
+    Profile("ci-fast", headed=False, slowmo=0, viewport="1280x720", video_policy=VIDEO_OFF,
+            screenshot_policy=POLICY_ON_FAILURE, tracing=TRACING_RING, step_backend=BACKEND_TOP_LEVEL),
+    Profile("perf", headed=False, slowmo=0, viewport="1280x720", video_policy=VIDEO_OFF,
+            screenshot_policy=POLICY_OFF, tracing="off", step_backend=BACKEND_OFF),
+)}
+
+
+def default_profile_name() -> str:
+    """AE_PROFILE, else ci-fast on CI servers (CI=true) and local everywhere else"""
+    return os.getenv("AE_PROFILE") or ("ci-fast" if os.getenv("CI") else "local")
+
+
+def apply_profile(option, profile: Profile) -> Profile:
+    """Fill the options left unset (None) from the profile
+
+    Returns the profile as it is actually in effect, explicit options included.
+    """
+    if option.headed is None:
+        option.headed = profile.headed
+    if option.slowmo is None:
+        option.slowmo = profile.slowmo
+    if option.tracing is None and option.ring_tracing is None:
+        option.ring_tracing = profile.tracing == TRACING_RING
+        option.tracing = "off" if option.ring_tracing else profile.tracing
+    else:
+        # Either tracing choice given explicitly rules out the profile's tracing
+        if option.tracing is None:
+            option.tracing = "off" if option.ring_tracing or profile.tracing == TRACING_RING else profile.tracing
+        option.ring_tracing = bool(option.ring_tracing)
+    for name in ("viewport", "video_policy", "screenshot_policy", "step_backend"):
+        if getattr(option, name) is None:
+            setattr(option, name, getattr(profile, name))
+    tracing = TRACING_RING if option.ring_tracing else option.tracing
+    return Profile(profile.name, option.headed, option.slowmo, option.viewport, option.video_policy,
+                   option.screenshot_policy, tracing, option.step_backend)
+
+
+def write_allure_environment(alluredir: str, profile: Profile, **extra):
+    """Show the profile in the Allure report's Environment widget"""
+    os.makedirs(alluredir, exist_ok=True)
+    properties = {'profile': profile.name, **asdict(profile), **extra}
+    del properties['name']
+    with open(os.path.join(alluredir, "environment.properties"), "w", encoding="utf-8") as properties_file:
+        for key, value in properties.items():
+            properties_file.write(f"{key}={value}\n")
@@ -0,0 +1,140 @@
+"""
+Duration-aware Test Scheduling
+
+Keeps the duration and last outcome of every test in a local history file
+and orders the collected tests for parallel runs:
+
+1. tests that failed last time, for fast feedback
+2. everything else longest-first, so xdist's load distribution hands the
+   long tail out early instead of leaving one worker grinding at the end
+   (greedy longest-processing-time scheduling)
+
+Scheduling is opt-in (--schedule duration) and does nothing until the history
+holds durations. The makespan predicted from the history is reported next to
+the actual one; it models xdist's --dist load, which first hands every worker
+a consecutive chunk of the ordered tests and then balances the rest.
+"""
+import heapq
+import json
+import os
+import statistics
+import time
+from collections import defaultdict
+
+
+SCHEDULE_DURATION = "duration"
+SCHEDULE_OFF = "off"
+SCHEDULE_MODES = (SCHEDULE_DURATION, SCHEDULE_OFF)
+
+
+class DurationHistory:
+    """Smoothed per-test durations and last outcomes, persisted as JSON"""
+
+    def __init__(self, path: str, smoothing: float = 0.5):
+        self.path = path
+        self.smoothing = smoothing
+        self.tests = {}
+
+    def load(self) -> "DurationHistory":
+        try:
+            with open(self.path, encoding="utf-8") as history_file:
+                self.tests = json.load(history_file)
+        except (OSError, ValueError):
+            self.tests = {}
+        return self
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(f"{self.path}.tmp", "w", encoding="utf-8") as history_file:
+            json.dump(self.tests, history_file, indent=1, sort_keys=True)
+        os.replace(f"{self.path}.tmp", self.path)
+
+    def duration(self, nodeid: str):
+        entry = self.tests.get(nodeid)
+        return entry['duration'] if entry else None
+
+    def failed_last(self, nodeid: str) -> bool:
+        entry = self.tests.get(nodeid)
+        return bool(entry and entry['failed'])
+
+    def estimate(self, nodeid: str) -> float:
+        """Known duration, or the median of all known ones for new tests"""
+        known = self.duration(nodeid)
+        if known is not None:
+            return known
+        durations = [entry['duration'] for entry in self.tests.values()]
+        return statistics.median(durations) if durations else 1.0
+
+    def update(self, nodeid: str, duration: float, failed: bool):
+        """Blend a new measurement into the history"""
+        previous = self.duration(nodeid)
+        if previous is not None:
+            duration = self.smoothing * duration + (1 - self.smoothing) * previous
+        self.tests[nodeid] = {'duration': round(duration, 3), 'failed': failed, 'last_run': int(time.time())}
+
+
+def order_items(items: list, history: DurationHistory) -> list:
+    """Failed-last-time first, then longest-first (stable across workers)"""
+    return sorted(items, key=lambda item: (not history.failed_last(item.nodeid),
+                                           -history.estimate(item.nodeid), item.nodeid))
+
+
+def initial_chunk(count: int, workers: int, max_chunk: int = None) -> int:
+    """Tests xdist's --dist load sends every worker before balancing the rest"""
+    if workers <= 1 or count < 2 * workers:
+        return 1
+    chunk = count // workers // 4
+    if max_chunk is not None:
+        chunk = min(chunk, max_chunk)
+    return max(chunk, 2)
+
+
+def predict_makespan(durations: list, workers: int, chunk: int = 1) -> float:
+    """Makespan of the ordered durations on workers
+
+    Every worker first takes a consecutive chunk (see initial_chunk), then
+    the remaining durations go greedily to the least loaded worker, which
+    approximates how xdist refills workers as they finish.
+    """
+    workers = max(1, workers)
+    loads = [sum(durations[worker * chunk:(worker + 1) * chunk]) for worker in range(workers)]
+    heapq.heapify(loads)
+    for duration in durations[workers * chunk:]:
+        heapq.heappush(loads, heapq.heappop(loads) + duration)
+    return max(loads)
+
+
+class RunRecorder:
+    """Collects test durations (per worker) while the session runs"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations = defaultdict(float)
+        self.failed = set()
+        self.worker_busy = defaultdict(float)
+        self.predicted = None
+
+    def add(self, report):
+        """Add a setup/call/teardown report"""
+        self.durations[report.nodeid] += report.duration
+        if report.failed:
+            self.failed.add(report.nodeid)
+        node = getattr(report, "node", None)
+        worker = node.workerinput["workerid"] if node is not None and hasattr(node, "workerinput") else "master"
+        self.worker_busy[worker] += report.duration
+
+    def store(self, history: DurationHistory):
+        for nodeid, duration in self.durations.items():
+            history.update(nodeid, duration, nodeid in self.failed)
+
+    def summary(self) -> dict:
+        return {
+            'predicted': self.predicted,
+            'busiest_worker': max(self.worker_busy.values(), default=0.0),
+            'wall': time.perf_counter() - self.started,
+            'workers': len(self.worker_busy),
+        }
+
+
+# Durations of this session (on the controller: the reports of every worker)
+run_recorder = RunRecorder()
@@ -0,0 +1,179 @@
+"""
+Screenshot Pipeline
+
+Decides which step screenshots are taken (capture policy), in which format
+and quality, and moves transcoding and disk writes to a background thread.
+With the on-failure policy step screenshots are still captured but held in
+memory, and only written and attached when a phase of the test fails.
+
+The browser capture itself has to stay on the test thread (Playwright's sync
+API is thread-bound), and Allure keeps the current test in thread-local
+state, so the encoded bytes are attached on the test thread once the test has
+finished (flush after teardown); setup and call never wait for the writer.
+"""
+import os
+import random
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import allure
+from playwright.sync_api import Page
+
+
+POLICY_ALWAYS = "always"
+POLICY_ON_FAILURE = "on-failure"
+POLICY_SAMPLED = "sampled"
+POLICY_OFF = "off"
+POLICIES = (POLICY_ALWAYS, POLICY_ON_FAILURE, POLICY_SAMPLED, POLICY_OFF)
+
+FORMATS = ("png", "jpeg", "webp")
+
+UNSAFE_FILE_CHARS = re.compile(r"[^\w.-]+")
+
+ATTACHMENT_TYPES = {
+    'png': (allure.attachment_type.PNG, None),
+    'jpeg': (allure.attachment_type.JPG, None),
+    'webp': ("image/webp", "webp"),
+}
+
+
+def _to_webp(data: bytes, quality: int) -> bytes:
+    """Transcode PNG bytes to WebP (requires the optional Pillow package)"""
+    import io
+    from PIL import Image
+
+    output = io.BytesIO()
+    Image.open(io.BytesIO(data)).save(output, format="WEBP", quality=quality)
+    return output.getvalue()
+
+
+def _webp_supported() -> bool:
+    try:
+        import PIL.Image  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class ScreenshotPipeline:
+    """Policy-driven screenshots encoded and written on a background thread"""
+
+    def __init__(self, policy: str = POLICY_ALWAYS, image_format: str = "png", quality: int = 80,
+                 full_page: bool = False, sample_rate: float = 0.2,
+                 output_dir: str = "reports/screenshots"):
+        if image_format == "webp" and not _webp_supported():
+            image_format = "jpeg"
+        self.policy = policy
+        self.image_format = image_format
+        self.quality = quality
+        self.full_page = full_page
+        self.sample_rate = sample_rate
+        self.output_dir = output_dir
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshots")
+        self._pending = []
+        self._held = []
+        self._lock = threading.Lock()
+        self._test_dir = output_dir
+        self._sequence = 0
+
+    def start_test(self, nodeid: str):
+        """Direct the following screenshots to a folder for this test"""
+        self._test_dir = os.path.join(self.output_dir, UNSAFE_FILE_CHARS.sub("_", nodeid)[-150:])
+        self._sequence = 0
+        self._held = []
+
+    def should_capture(self) -> bool:
+        """Apply the capture policy to a step screenshot"""
+        if self.policy in (POLICY_ALWAYS, POLICY_ON_FAILURE):
+            return True
+        if self.policy == POLICY_SAMPLED:
+            return random.random() < self.sample_rate
+        return False
+
+    def capture(self, page: Page, name: str, force: bool = False):
+        """Capture a screenshot now; encoding and writing happen in the background"""
+        if not force and not self.should_capture():
+            return
+        self._keep(page.screenshot(**self._screenshot_args()), name, hold=not force)
+
+    async def capture_async(self, page, name: str, force: bool = False):
+        """capture() for playwright.async_api pages"""
+        if not force and not self.should_capture():
+            return
+        self._keep(await page.screenshot(**self._screenshot_args()), name, hold=not force)
+
+    def _screenshot_args(self) -> dict:
+        if self.image_format == "jpeg":
+            return {"type": "jpeg", "quality": self.quality, "full_page": self.full_page}
+        return {"type": "png", "full_page": self.full_page}
+
+    def _keep(self, data: bytes, name: str, hold: bool):
+        self._sequence += 1
+        extension = "jpg" if self.image_format == "jpeg" else self.image_format
+        file_name = f"{self._sequence:03d}_{UNSAFE_FILE_CHARS.sub('_', name)}.{extension}"
+        path = os.path.join(self._test_dir, file_name)
+        if hold and self.policy == POLICY_ON_FAILURE:
+            self._held.append((data, name, path))
+        else:
+            self._submit(data, name, path)
+
+    def _submit(self, data: bytes, name: str, path: str):
+        future = self._executor.submit(self._write, data, path)
+        with self._lock:
+            self._pending.append((name, future))
+
+    def _write(self, data: bytes, path: str) -> bytes:
+        if self.image_format == "webp":
+            data = _to_webp(data, self.quality)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as image_file:
+            image_file.write(data)
+        return data
+
+    def flush(self, failed: bool = False, test_finished: bool = True):
+        """Attach the screenshots of the test to the current Allure test
+
+        Called after every test phase: failed releases the step screenshots
+        held back by the on-failure policy. Pending writes are only waited for
+        once test_finished, and their encoded bytes are attached directly
+        instead of copying the written files. A screenshot that could not be
+        written is reported as a text attachment instead of failing the hook.
+        """
+        if failed:
+            held, self._held = self._held, []
+            for data, name, path in held:
+                self._submit(data, name, path)
+        if not test_finished:
+            return
+        with self._lock:
+            pending, self._pending = self._pending, []
+        attachment_type, extension = ATTACHMENT_TYPES[self.image_format]
+        for name, future in pending:
+            try:
+                data = future.result()
+            except Exception as error:
+                allure.attach(f"{type(error).__name__}: {error}", name=f"{name} (not saved)",
+                              attachment_type=allure.attachment_type.TEXT)
+                continue
+            allure.attach(data, name=name, attachment_type=attachment_type, extension=extension)
+
+    def close(self):
+        """Stop the background writer"""
+        self._executor.shutdown(wait=True)
+
+
+screenshot_pipeline = ScreenshotPipeline()
+
+
+def configure_screenshots(**settings) -> ScreenshotPipeline:
+    """Replace the process-wide pipeline with one built from settings"""
+    global screenshot_pipeline
+    screenshot_pipeline.close()
+    screenshot_pipeline = ScreenshotPipeline(**settings)
+    return screenshot_pipeline
+
+
+def get_screenshot_pipeline() -> ScreenshotPipeline:
+    """Return the process-wide pipeline"""
+    return screenshot_pipeline
@@ -0,0 +1,117 @@
+"""
+Authenticated Session Cache
+
+Saves the browser storage state (cookies and localStorage) of a logged-in
+user to disk, so later tests that only need "some logged-in user" can
+restore it instead of registering again.
+
+Entries are keyed by site, user profile and worker, so parallel workers
+never write the same file. Writes go through a temp file and os.replace,
+which keeps readers from ever seeing a partial entry. Expired entries are
+dropped on read and the oldest entries are evicted above max_entries.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from playwright.sync_api import BrowserContext, Page
+
+
+RESTORE_LOCAL_STORAGE_SCRIPT = """origins => {
+    const entry = origins.find(origin => origin.origin === window.location.origin);
+    if (!entry) return;
+    for (const item of entry.localStorage) {
+        window.localStorage.setItem(item.name, item.value);
+    }
+}"""
+
+
+class SessionCache:
+    """On-disk cache of authenticated storage states with TTL and eviction"""
+
+    def __init__(self, cache_dir: str, ttl_seconds: float = 1800, max_entries: int = 32):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def make_key(base_url: str, profile: str = "default", worker_id: str = "master") -> str:
+        """Build a cache key for a site, user profile and worker"""
+        digest = hashlib.sha1(f"{base_url}|{profile}".encode()).hexdigest()[:12]
+        return f"{profile}-{worker_id}-{digest}"
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _is_expired(self, entry: dict) -> bool:
+        return time.time() - entry['created'] > self.ttl_seconds
+
+    def load(self, key: str):
+        """Return the cached entry ({'user', 'storage_state', 'created'}) or None"""
+        try:
+            with open(self._path(key), encoding="utf-8") as cache_file:
+                entry = json.load(cache_file)
+        except (FileNotFoundError, ValueError):
+            return None
+        if self._is_expired(entry):
+            self.invalidate(key)
+            return None
+        return entry
+
+    def save(self, key: str, user: dict, storage_state: dict):
+        """Store a storage state atomically and enforce the size limit"""
+        entry = {'created': time.time(), 'user': user, 'storage_state': storage_state}
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+            json.dump(entry, temp_file)
+        os.replace(temp_path, self._path(key))
+        self.evict()
+
+    def invalidate(self, key: str):
+        """Drop an entry (e.g. when its session is no longer valid)"""
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def evict(self):
+        """Remove expired entries, then the oldest ones above max_entries"""
+        entries = []
+        for file_name in os.listdir(self.cache_dir):
+            if not file_name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, file_name)
+            try:
+                entries.append((os.path.getmtime(path), path))
+            except FileNotFoundError:
+                continue
+
+        entries.sort()
+        now = time.time()
+        excess = len(entries) - self.max_entries
+        for index, (modified, path) in enumerate(entries):
+            if index < excess or now - modified > self.ttl_seconds:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+
+def restore_cookies(context: BrowserContext, storage_state: dict):
+    """Load the cookies of a saved storage state into a context"""
+    if storage_state.get('cookies'):
+        context.add_cookies(storage_state['cookies'])
+
+
+def restore_local_storage(page: Page, storage_state: dict):
+    """Load saved localStorage for the origin the page is currently on
+
+    Done per page rather than with an init script, so nothing outlives the
+    test in a pooled context.
+    """
+    origins = [origin for origin in storage_state.get('origins', []) if origin.get('localStorage')]
+    if origins:
+        page.evaluate(RESTORE_LOCAL_STORAGE_SCRIPT, origins)
@@ -0,0 +1,197 @@
+"""
+Step Recording Backends
+
+Page-object methods are decorated with @step instead of @allure.step, so
+the cost of step reporting can be chosen per run:
+
+- allure:    every call becomes a nested Allure step (full tree, for debugging)
+- top-level: only page-object methods become Allure steps; BasePage
+             primitives (click, fill, ...) run unrecorded
+- buffered:  steps are kept in memory as compact records and attached to
+             the report once per test
+- off:       no step recording
+
+With instrumentation enabled every step call is also timed (see
+utils/instrumentation.py). A step listener (set_step_listener) is told
+about every outermost step that completes, e.g. to cut trace chunks.
+
+Coroutine methods (pages/aio) are recorded by the allure and top-level
+backends only. Flows interleaved on one event loop share Allure's step
+stack, so concurrent runs should use the off backend.
+"""
+import functools
+import inspect
+import time
+
+import allure
+from utils.instrumentation import instrumentation
+
+
+BACKEND_ALLURE = "allure"
+BACKEND_TOP_LEVEL = "top-level"
+BACKEND_BUFFERED = "buffered"
+BACKEND_OFF = "off"
+BACKENDS = (BACKEND_ALLURE, BACKEND_TOP_LEVEL, BACKEND_BUFFERED, BACKEND_OFF)
+
+
+def format_title(title: str, func, args, kwargs) -> str:
+    """Fill a step title template with the call's arguments"""
+    try:
+        params = inspect.signature(func).bind(*args, **kwargs).arguments
+        return title.format(**params)
+    except (KeyError, IndexError, TypeError, ValueError):
+        return title
+
+
+class StepBuffer:
+    """In-memory step records, formatted only when flushed"""
+
+    def __init__(self):
+        self.records = []
+        self.depth = 0
+
+    def run(self, title: str, func, args, kwargs, call=None):
+        """Call func (or call(), if given) and record it as a step"""
+        record = [self.depth, title, func, args, kwargs, 0.0, None]
+        self.records.append(record)
+        self.depth += 1
+        start = time.perf_counter()
+        try:
+            return call() if call else func(*args, **kwargs)
+        except Exception as error:
+            record[6] = type(error).__name__
+            raise
+        finally:
+            record[5] = time.perf_counter() - start
+            self.depth -= 1
+
+    def render(self) -> str:
+        """Render the buffered steps as an indented text tree"""
+        lines = []
+        for depth, title, func, args, kwargs, duration, error in self.records:
+            status = f" FAILED ({error})" if error else ""
+            lines.append(f"{'  ' * depth}{format_title(title, func, args, kwargs)}"
+                         f" [{duration * 1000:.1f} ms]{status}")
+        return "\n".join(lines)
+
+    def flush(self):
+        """Attach buffered steps to the current Allure test and clear the buffer"""
+        if self.records:
+            allure.attach(self.render(), name="steps", attachment_type=allure.attachment_type.TEXT)
+        self.records = []
+        self.depth = 0
+
+
+step_backend = BACKEND_ALLURE
+step_buffer = StepBuffer()
+
+
+class StepBoundaries:
+    """Calls the listener with the title of every outermost step that completes"""
+
+    def __init__(self):
+        self.listener = None
+        self.depth = 0
+
+    def run(self, title: str, func, args, kwargs, dispatch):
+        # Read once: the listener can be removed (set to None) while the step runs
+        listener = self.listener
+        self.depth += 1
+        try:
+            result = dispatch(args, kwargs)
+        finally:
+            self.depth -= 1
+        if self.depth == 0 and listener is not None:
+            listener(format_title(title, func, args, kwargs))
+        return result
+
+
+step_boundaries = StepBoundaries()
+
+
+def set_step_listener(listener):
+    """Register listener(title) for outermost steps (None to remove it)"""
+    step_boundaries.listener = listener
+    step_boundaries.depth = 0
+
+
+def set_step_backend(backend: str):
+    """Select the step recording backend for this process"""
+    global step_backend
+    step_backend = backend
+
+
+def flush_steps():
+    """Flush buffered steps (no-op for the other backends)"""
+    step_buffer.flush()
+
+
+def _async_step(title: str, primitive: bool, func):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if step_backend == BACKEND_ALLURE or (step_backend == BACKEND_TOP_LEVEL and not primitive):
+            with allure.step(format_title(title, func, args, kwargs)):
+                return await func(*args, **kwargs)
+        return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def step(title: str, primitive: bool = False):
+    """Decorate a page-object method as a report step
+
+    primitive marks BasePage building blocks that the top-level backend
+    leaves out of the report.
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            return _async_step(title, primitive, func)
+
+        allure_step = allure.step(title)(func)
+        parameters = list(inspect.signature(func).parameters)
+        locator_index = parameters.index("locator") if "locator" in parameters else None
+
+        def locator_of(args, kwargs):
+            if locator_index is None:
+                return None
+            if len(args) > locator_index:
+                return args[locator_index]
+            return kwargs.get("locator")
+
+        def run_instrumented(args, kwargs):
+            with instrumentation.measure(func.__qualname__, locator_of(args, kwargs)) as record:
+                def call():
+                    start = time.perf_counter()
+                    try:
+                        return func(*args, **kwargs)
+                    finally:
+                        record['inner'] = time.perf_counter() - start
+
+                if step_backend == BACKEND_ALLURE or (step_backend == BACKEND_TOP_LEVEL and not primitive):
+                    with allure.step(format_title(title, func, args, kwargs)):
+                        return call()
+                if step_backend == BACKEND_BUFFERED:
+                    return step_buffer.run(title, func, args, kwargs, call)
+                return call()
+
+        def dispatch(args, kwargs):
+            if instrumentation.enabled:
+                return run_instrumented(args, kwargs)
+            if step_backend == BACKEND_ALLURE:
+                return allure_step(*args, **kwargs)
+            if step_backend == BACKEND_TOP_LEVEL:
+                if primitive:
+                    return func(*args, **kwargs)
+                return allure_step(*args, **kwargs)
+            if step_backend == BACKEND_BUFFERED:
+                return step_buffer.run(title, func, args, kwargs)
+            return func(*args, **kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if step_boundaries.listener is not None:
+                return step_boundaries.run(title, func, args, kwargs, dispatch)
+            return dispatch(args, kwargs)
+
+        return wrapper
+    return decorator
@@ -1,16 +1,29 @@
 """
-Test Data Generator using Faker
+Test Data Generators
+
+User and payment data come from the pre-generated pool (utils/data_pool.py);
+Faker is only imported for ad-hoc values and pool regeneration.
 """
-from faker import Faker
 import random
 import string
 
-fake = Faker()
+from utils.data_pool import get_data_pool
+
+_fake = None
+
+
+def _faker():
+    """Create the Faker instance on first use"""
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        _fake = Faker()
+    return _fake
 
 
 def generate_random_email():
     """Generate a random email address"""
-    return fake.email()
+    return _faker().email()
 
 
 def generate_random_password(length=10):
@@ -18,44 +31,18 @@ def generate_random_password(length=10):
     return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
 
 
-def generate_user_data():
-    """Generate complete user registration data"""
-    first_name = fake.first_name()
-    last_name = fake.last_name()
-
-    user_data = {
-        'name': f"{first_name} {last_name}",
-        'email': f"{first_name.lower()}.{last_name.lower()}{random.randint(100, 999)}@testmail.com",
-        'password': 'Test@123456',
-        'day': str(random.randint(1, 28)),
-        'month': str(random.randint(1, 12)),
-        'year': str(random.randint(1970, 2000)),
-        'first_name': first_name,
-        'last_name': last_name,
-        'company': fake.company(),
-        'address1': fake.street_address(),
-        'address2': fake.secondary_address(),
-        'country': 'India',
-        'state': fake.state(),
-        'city': fake.city(),
-        'zipcode': fake.zipcode(),
-        'mobile': fake.numerify(text='##########')
-    }
-
-    return user_data
+def generate_user_data(unique_id: str = None):
+    """Generate complete user registration data
+
+    Name and email carry a worker-aware unique ID so parallel workers never
+    register the same account.
+    """
+    return get_data_pool().next_user(unique_id)
 
 
 def generate_payment_data():
     """Generate payment card data"""
-    payment_data = {
-        'name_on_card': fake.name(),
-        'card_number': '4532015112830366',  # Test card number
-        'cvc': '123',
-        'expiry_month': '12',
-        'expiry_year': '2027'
-    }
-
-    return payment_data
+    return get_data_pool().next_payment()
 
 
 def get_test_comment():
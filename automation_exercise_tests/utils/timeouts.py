@@ -0,0 +1,152 @@
+"""
+Adaptive Timeouts
+
+Keeps the observed latency of every waited-for locator across runs and
+derives the timeout of the next wait from a high percentile of that history
+times a margin, clamped to [floor, ceiling]. Locators without enough history
+keep the caller's default.
+
+A derived timeout only ever raises the caller's default, unless
+allow_shorter is set; then a locator that times out goes back to the
+default for the rest of the run. Timed-out waits are recorded at their
+timeout, so a locator that keeps timing out gets a longer timeout next run.
+History is kept per scope (target site and profile): latencies of the local
+stand-in say nothing about the live site.
+
+Every wait is reported with the timeout it got and the latency it actually
+took, so slow pages show up as data instead of as flakes.
+"""
+import json
+import os
+import re
+from collections import defaultdict
+
+from utils.instrumentation import percentile
+
+
+TIMEOUTS_ADAPTIVE = "adaptive"
+TIMEOUTS_FIXED = "fixed"
+TIMEOUT_MODES = (TIMEOUTS_ADAPTIVE, TIMEOUTS_FIXED)
+
+
+def history_scope(target: str, profile: str) -> str:
+    """Folder name of the latency history of one target site and profile"""
+    return re.sub(r"[^\w.-]+", "_", f"{profile}-{target}").strip("_")
+
+
+class TimeoutService:
+    """Per-locator latency history and the timeouts derived from it"""
+
+    def __init__(self, mode: str = TIMEOUTS_FIXED, history_dir: str = "playwright/.timeouts",
+                 worker_id: str = "master", quantile: float = 0.99, margin: float = 3.0,
+                 floor_ms: int = 2000, ceiling_ms: int = 60000, min_samples: int = 5,
+                 max_samples: int = 200, scope: str = None, allow_shorter: bool = False):
+        self.mode = mode
+        self.history_dir = os.path.join(history_dir, scope) if scope else history_dir
+        self.worker_id = worker_id
+        self.quantile = quantile
+        self.margin = margin
+        self.floor_ms = floor_ms
+        self.ceiling_ms = ceiling_ms
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.allow_shorter = allow_shorter
+        self.timed_out = set()
+        self.history = None
+        self.own_samples = defaultdict(list)
+        self.events = []
+
+    def _history_path(self, worker_id: str) -> str:
+        return os.path.join(self.history_dir, f"{worker_id}.json")
+
+    def load(self):
+        """Merge the latency history written by all workers of earlier runs"""
+        self.history = defaultdict(list)
+        if not os.path.isdir(self.history_dir):
+            return
+        for file_name in sorted(os.listdir(self.history_dir)):
+            if not file_name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.history_dir, file_name), encoding="utf-8") as history_file:
+                    samples = json.load(history_file)
+            except (OSError, ValueError):
+                continue
+            for locator, latencies in samples.items():
+                self.history[locator].extend(latencies)
+                if file_name == f"{self.worker_id}.json":
+                    self.own_samples[locator].extend(latencies)
+
+    def timeout_for(self, locator: str, default: int) -> int:
+        """Timeout (ms) for the next wait on locator"""
+        if self.mode != TIMEOUTS_ADAPTIVE:
+            return default
+        if self.history is None:
+            self.load()
+        latencies = sorted(self.history.get(locator, ()))
+        if len(latencies) < self.min_samples:
+            return default
+        derived = percentile(latencies, self.quantile) * self.margin
+        derived = int(min(self.ceiling_ms, max(self.floor_ms, derived)))
+        if not self.allow_shorter or locator in self.timed_out:
+            return max(default, derived)
+        return derived
+
+    def record(self, locator: str, elapsed_ms: float, timeout_ms: int, timed_out: bool):
+        """Record one wait; a timed-out wait is a sample of (at least) its timeout"""
+        self.events.append({'locator': locator, 'elapsed_ms': round(elapsed_ms, 1),
+                            'timeout_ms': timeout_ms, 'timed_out': timed_out})
+        sample = round(max(elapsed_ms, timeout_ms) if timed_out else elapsed_ms, 1)
+        if timed_out:
+            self.timed_out.add(locator)
+        if self.history is None:
+            self.load()
+        self.own_samples[locator].append(sample)
+        self.history[locator].append(sample)
+
+    def summary(self) -> dict:
+        """Per locator: waits, timeouts hit, timeout used and latency observed this run"""
+        grouped = defaultdict(list)
+        for event in self.events:
+            grouped[event['locator']].append(event)
+        summary = {}
+        for locator, events in grouped.items():
+            elapsed = sorted(event['elapsed_ms'] for event in events if not event['timed_out'])
+            summary[locator] = {
+                'waits': len(events),
+                'timed_out': sum(event['timed_out'] for event in events),
+                'timeout_ms': max(event['timeout_ms'] for event in events),
+                'p50_ms': percentile(elapsed, 0.50),
+                'max_ms': elapsed[-1] if elapsed else None,
+            }
+        return summary
+
+    def save(self, report_path: str = None):
+        """Persist this worker's latency history (and optionally the run's report)"""
+        if self.own_samples:
+            os.makedirs(self.history_dir, exist_ok=True)
+            trimmed = {locator: latencies[-self.max_samples:] for locator, latencies in self.own_samples.items()}
+            temp_path = f"{self._history_path(self.worker_id)}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as history_file:
+                json.dump(trimmed, history_file)
+            os.replace(temp_path, self._history_path(self.worker_id))
+        if report_path and self.events:
+            os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+            with open(report_path, "w", encoding="utf-8") as report_file:
+                json.dump({'mode': self.mode, 'summary': self.summary(), 'events': self.events},
+                          report_file, indent=2)
+
+
+timeouts = TimeoutService()
+
+
+def configure_timeouts(**settings) -> TimeoutService:
+    """Replace the process-wide timeout service with one built from settings"""
+    global timeouts
+    timeouts = TimeoutService(**settings)
+    return timeouts
+
+
+def get_timeouts() -> TimeoutService:
+    """Return the process-wide timeout service"""
+    return timeouts
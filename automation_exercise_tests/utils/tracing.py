@@ -0,0 +1,118 @@
+"""
+Ring-buffer Tracing
+
+Traces a test in chunks: a new Playwright trace chunk starts after every
+chunk_steps outermost page-object steps, and only the last keep_chunks
+finished chunks are kept (in a temp dir). When the test fails the kept
+chunks plus the one in progress are copied to the trace folder, each a
+complete trace for `playwright show-trace`; a passing test's chunks are
+simply deleted.
+
+So a failure comes with the trace of the steps that led up to it, without
+keeping or writing the trace of every passing test. Rotation time is
+counted per tracer; the overall cost against tracing off is measured with
+`python -m benchmarks --ring-tracing`.
+"""
+import os
+import re
+import shutil
+import tempfile
+import time
+from collections import deque
+
+from playwright.sync_api import BrowserContext
+
+
+UNSAFE_FILE_CHARS = re.compile(r"[^\w.-]+")
+
+
+class TracingStats:
+    """Chunk and overhead counters over every tracer of this process"""
+
+    def __init__(self):
+        self.tests = 0
+        self.chunks = 0
+        self.persisted = 0
+        self.rotation_seconds = 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            'tests': self.tests,
+            'chunks': self.chunks,
+            'persisted': self.persisted,
+            'rotation_seconds': round(self.rotation_seconds, 3),
+        }
+
+
+tracing_totals = TracingStats()
+
+
+def trace_dir_for(trace_dir: str, nodeid: str) -> str:
+    """Folder of a failed test's trace chunks"""
+    return os.path.join(trace_dir, UNSAFE_FILE_CHARS.sub("_", nodeid)[-150:])
+
+
+class RingTracer:
+    """Chunked tracing of one browser context, keeping the last chunks only"""
+
+    def __init__(self, context: BrowserContext, chunk_steps: int = 1, keep_chunks: int = 5,
+                 screenshots: bool = True, snapshots: bool = True, stats: TracingStats = None):
+        self.context = context
+        self.stats = stats if stats is not None else tracing_totals
+        self.chunk_steps = max(1, chunk_steps)
+        self.keep_chunks = max(1, keep_chunks)
+        self.screenshots = screenshots
+        self.snapshots = snapshots
+        self.chunks = deque()
+        self.chunk_titles = []
+        self.steps_in_chunk = 0
+        self.sequence = 0
+        self._temp_dir = None
+
+    def start(self):
+        self._temp_dir = tempfile.mkdtemp(prefix="ring-trace-")
+        self.context.tracing.start(screenshots=self.screenshots, snapshots=self.snapshots)
+        self.context.tracing.start_chunk()
+        self.stats.tests += 1
+
+    def step_finished(self, title: str):
+        """Called after every outermost page-object step"""
+        self.chunk_titles.append(title)
+        self.steps_in_chunk += 1
+        if self.steps_in_chunk >= self.chunk_steps:
+            self.rotate()
+
+    def _finish_chunk(self, directory: str) -> str:
+        self.sequence += 1
+        label = UNSAFE_FILE_CHARS.sub("_", self.chunk_titles[0] if self.chunk_titles else "last")[:60]
+        path = os.path.join(directory, f"{self.sequence:03d}-{label}.zip")
+        self.context.tracing.stop_chunk(path=path)
+        self.chunk_titles = []
+        self.steps_in_chunk = 0
+        self.stats.chunks += 1
+        return path
+
+    def rotate(self):
+        """Close the current chunk into the ring and start the next one"""
+        start = time.perf_counter()
+        self.chunks.append(self._finish_chunk(self._temp_dir))
+        while len(self.chunks) > self.keep_chunks:
+            os.remove(self.chunks.popleft())
+        self.context.tracing.start_chunk()
+        self.stats.rotation_seconds += time.perf_counter() - start
+
+    def persist(self, trace_dir: str) -> list:
+        """Write the kept chunks and the one in progress to trace_dir (on failure)"""
+        os.makedirs(trace_dir, exist_ok=True)
+        paths = [shutil.copy(chunk, trace_dir) for chunk in self.chunks]
+        paths.append(self._finish_chunk(trace_dir))
+        self.context.tracing.start_chunk()
+        self.stats.persisted += 1
+        return paths
+
+    def stop(self):
+        """Stop tracing and drop whatever was not persisted"""
+        try:
+            self.context.tracing.stop()
+        finally:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
@@ -0,0 +1,101 @@
+"""
+Video Recording Policy
+
+Decides whether test videos are recorded and which ones are kept, and keeps
+the video folder under a disk budget by evicting the oldest files first.
+Workers record into their own subfolders; the budget covers the shared
+budget_dir with all of them, so it does not grow with the worker count.
+The recording resolution is independent of the viewport.
+"""
+import os
+import random
+
+
+VIDEO_ON = "on"
+VIDEO_OFF = "off"
+VIDEO_RETAIN_ON_FAILURE = "retain-on-failure"
+VIDEO_SAMPLED = "sampled"
+VIDEO_MODES = (VIDEO_ON, VIDEO_OFF, VIDEO_RETAIN_ON_FAILURE, VIDEO_SAMPLED)
+
+
+def parse_size(value: str):
+    """Parse 'WIDTHxHEIGHT' into Playwright's size dict (None for empty)"""
+    if not value:
+        return None
+    width, height = value.lower().split("x")
+    return {"width": int(width), "height": int(height)}
+
+
+class VideoPolicy:
+    """Recording mode, retention and disk budget for test videos"""
+
+    def __init__(self, mode: str = VIDEO_RETAIN_ON_FAILURE, video_dir: str = "reports/videos/",
+                 size: dict = None, sample_rate: float = 0.1, budget_mb: float = 500,
+                 budget_dir: str = None):
+        self.mode = mode
+        self.video_dir = video_dir
+        self.budget_dir = budget_dir or video_dir
+        self.size = size
+        self.sample_rate = sample_rate
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != VIDEO_OFF
+
+    def context_args(self) -> dict:
+        """Browser context arguments that enable recording"""
+        if not self.enabled:
+            return {}
+        args = {"record_video_dir": self.video_dir}
+        if self.size:
+            args["record_video_size"] = self.size
+        return args
+
+    def should_keep(self, failed: bool) -> bool:
+        """Decide whether the video of a finished test is kept"""
+        if self.mode == VIDEO_ON or failed:
+            return True
+        if self.mode == VIDEO_SAMPLED:
+            return random.random() < self.sample_rate
+        return False
+
+    def finalize(self, video_paths: list, failed: bool) -> list:
+        """Delete unwanted videos of a test (after its context closed); returns kept paths"""
+        kept = []
+        for path in video_paths:
+            if self.should_keep(failed):
+                kept.append(path)
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        self.enforce_budget()
+        return kept
+
+    def enforce_budget(self):
+        """Evict the oldest videos until budget_dir (with subfolders) fits the disk budget
+
+        Other workers may evict from the same folders concurrently, so files
+        that are already gone are skipped.
+        """
+        videos = []
+        for directory, _, file_names in os.walk(self.budget_dir):
+            for file_name in file_names:
+                path = os.path.join(directory, file_name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                videos.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in videos)
+        for _, size, path in sorted(videos):
+            if total <= self.budget_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
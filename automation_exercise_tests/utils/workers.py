@@ -0,0 +1,80 @@
+"""
+Parallel Worker Helpers
+
+Identify the current pytest-xdist worker and allocate IDs that are unique
+across all workers of a run, so parallel tests never collide on emails or
+names. Without xdist everything runs as the single "master" worker.
+"""
+import itertools
+import os
+import threading
+import uuid
+
+
+MASTER_WORKER_ID = "master"
+
+
+def get_worker_id(config) -> str:
+    """Return the xdist worker id (gw0, gw1, ...) or 'master'"""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return MASTER_WORKER_ID
+    return workerinput["workerid"]
+
+
+def get_run_id(config) -> str:
+    """Return an id shared by the controller and all workers of one run"""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        return workerinput["testrunuid"]
+    if not hasattr(config, "_ae_run_id"):
+        config._ae_run_id = getattr(config.option, "testrunuid", None) or uuid.uuid4().hex
+        if hasattr(config.option, "testrunuid"):
+            # xdist hands this to the workers as their testrunuid
+            config.option.testrunuid = config._ae_run_id
+    return config._ae_run_id
+
+
+def worker_dir(base_dir: str, worker_id: str) -> str:
+    """Return a per-worker subdirectory of base_dir (base_dir itself for master)"""
+    if worker_id == MASTER_WORKER_ID:
+        return base_dir
+    return os.path.join(base_dir, worker_id)
+
+
+class UniqueIdAllocator:
+    """Allocate short IDs unique across workers: <run><worker><counter>"""
+
+    def __init__(self, run_id: str = None, worker_id: str = MASTER_WORKER_ID):
+        self.run_id = (run_id or uuid.uuid4().hex)[:6]
+        self.worker_id = worker_id
+        self._worker_tag = "m" if worker_id == MASTER_WORKER_ID else f"w{worker_id.lstrip('gw')}"
+        self._counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def next_id(self) -> str:
+        """Return the next unique ID"""
+        with self._lock:
+            number = next(self._counter)
+        return f"{self.run_id}{self._worker_tag}n{number}"
+
+
+_allocator = UniqueIdAllocator()
+
+
+def configure_unique_ids(run_id: str, worker_id: str) -> UniqueIdAllocator:
+    """Install the allocator for this worker process, returning the one it replaces"""
+    global _allocator
+    previous, _allocator = _allocator, UniqueIdAllocator(run_id, worker_id)
+    return previous
+
+
+def restore_unique_ids(allocator: UniqueIdAllocator):
+    """Put back an allocator returned by configure_unique_ids()"""
+    global _allocator
+    _allocator = allocator
+
+
+def next_unique_id() -> str:
+    """Return the next ID from this worker's allocator"""
+    return _allocator.next_id()